@@ -0,0 +1,6 @@
+"""
+Shared tooling for running the day/part solvers.
+
+Each `src/dayN_ptM.py` module exposes `parse(raw)` and `solve(parsed)`;
+the runner here loads them by name and times each phase.
+"""
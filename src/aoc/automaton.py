@@ -0,0 +1,145 @@
+import numpy as np
+
+from collections import deque
+from functools import cached_property
+from typing import Tuple
+
+from aoc import loader
+
+
+# lines longer than this are scanned on their own, a byte at a time: the batch takes a round of NumPy calls per
+# byte of its longest line, however few lines are left in it, so one long line would hold up the whole chunk
+LONG_LINE = 4096
+
+
+class AhoCorasick:
+
+    """
+    An Aho–Corasick automaton recognising a set of byte-string patterns, each labelled with a non-zero value,
+    compiled to a complete transition table: reading a byte is one lookup from any state, failure links
+    already followed, so overlapping matches like 'eightwo' are all seen. A newline always returns to the
+    start state, so each line of an input is scanned on its own.
+
+    The value of a state is that of the longest pattern ending there, or 0 if none does.
+    """
+
+    def __init__(self, patterns):
+        children = [{}]
+        value = [0]
+        for pattern, pattern_value in patterns.items():
+            state = 0
+            for byte in pattern:
+                if byte not in children[state]:
+                    children[state][byte] = len(children)
+                    children.append({})
+                    value.append(0)
+                state = children[state][byte]
+            value[state] = pattern_value
+
+        table = np.zeros((len(children), 256), dtype=np.intp)
+        fail = [0] * len(children)
+
+        # breadth first, so a state's failure state, being shallower, is always finished before it's needed
+        queue = deque(children[0].values())
+        for byte, child in children[0].items():
+            table[0, byte] = child
+
+        while queue:
+            state = queue.popleft()
+            value[state] = value[state] or value[fail[state]]
+            table[state] = table[fail[state]]
+            for byte, child in children[state].items():
+                fail[child] = table[fail[state], byte]
+                table[state, byte] = child
+                queue.append(child)
+
+        table[:, ord('\n')] = 0
+
+        # states are stored shifted left 8 bits, so OR-ing in the next byte gives its index in the table; the
+        # few thousand entries fit in cache as int32
+        self.table = (table << 8).astype(np.int32).ravel()
+        self.value = np.zeros(len(self.table), dtype=np.int32)
+        self.value[np.arange(len(children)) << 8] = value
+        self.states = len(children)
+
+    def __repr__(self):
+        return f"AhoCorasick({self.states} states)"
+
+    @cached_property
+    def table_list(self):
+        return self.table.tolist()
+
+    @cached_property
+    def value_list(self):
+        return self.value.tolist()
+
+    def scan(self, line) -> Tuple[int, int]:
+
+        """The values of the first and last pattern matched in one line, stepping through its bytes in Python."""
+
+        table, value = self.table_list, self.value_list
+        state = first = last = 0
+        for byte in bytes(line):
+            state = table[state | byte]
+            matched = value[state]
+            if matched:
+                first = first or matched
+                last = matched
+        return first, last
+
+    def first_and_last(self, data):
+
+        """
+        The values of the first and last pattern matched on each line of data, as two arrays: 0 for lines with
+        no match. Every line goes through the automaton at once, a byte position at a time, longest lines first,
+        so the lines still being read are always the first few of the arrays, and each step works in place on
+        their slices. Lines longer than LONG_LINE are scanned one by one instead (see scan).
+        """
+
+        flat = np.frombuffer(loader.as_buffer(data), dtype=np.uint8)
+        starts, ends = loader.line_bounds(flat)
+
+        # long lines are left out of the batch, as if empty, and scanned one at a time afterwards
+        lengths = ends - starts
+        long_lines = np.flatnonzero(lengths > LONG_LINE)
+        lengths[long_lines] = 0
+
+        # longest first: stable sorts of 16-bit keys are radix sorts, much quicker than sorting int64s
+        longest = lengths.max(initial=0)
+        shortfall = longest - lengths
+        order = np.argsort(shortfall.astype(np.uint16) if longest < 1 << 16 else shortfall, kind='stable')
+
+        # how many lines are still being read at each position: those longer than it
+        remaining = np.searchsorted(shortfall[order], longest - np.arange(longest), side='left')
+
+        n = len(starts)
+        cursor = starts[order]
+        state = np.zeros(n, dtype=np.int32)
+        first = np.zeros(n, dtype=np.int32)
+        last = np.zeros(n, dtype=np.int32)
+        byte = np.empty(n, dtype=np.uint8)
+        matched = np.empty(n, dtype=np.int32)
+        mask = np.empty(n, dtype=bool)
+
+        for k in remaining.tolist():
+            reading, matched_k, mask_k, first_k = state[:k], matched[:k], mask[:k], first[:k]
+
+            np.take(flat, cursor[:k], out=byte[:k])
+            reading |= byte[:k]
+            np.take(self.table, reading, out=reading)
+            np.take(self.value, reading, out=matched_k)
+
+            np.equal(first_k, 0, out=mask_k)
+            np.copyto(first_k, matched_k, where=mask_k)
+            np.greater(matched_k, 0, out=mask_k)
+            np.copyto(last[:k], matched_k, where=mask_k)
+
+            cursor[:k] += 1
+
+        # back into line order
+        first[order] = first.copy()
+        last[order] = last.copy()
+
+        for line in long_lines.tolist():
+            first[line], last[line] = self.scan(flat[starts[line]:ends[line]])
+        return first, last
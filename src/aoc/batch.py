@@ -0,0 +1,136 @@
+import contextlib
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from aoc import parallel, runner
+from aoc.cache import Cache
+
+
+@dataclass
+class BatchInput:
+    input_id: str
+    path: Path
+
+
+def batch_inputs(source) -> List[BatchInput]:
+
+    """
+    The inputs in a directory, named by file stem, in name order; or those listed in a manifest file, one
+    path per line relative to the manifest, named as listed. Blank lines and # comments are skipped.
+    """
+
+    source = Path(source)
+    if source.is_dir():
+        return [BatchInput(path.stem, path)
+                for path in sorted(source.iterdir())
+                if path.is_file() and not path.name.startswith('.')]
+
+    inputs = []
+    for line in source.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            inputs.append(BatchInput(line, source.parent / line))
+
+    return inputs
+
+
+def json_value(value):
+
+    """An answer as JSON can carry it: NumPy scalars become plain numbers, anything else unfamiliar its str()."""
+
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def result_record(result: runner.RunResult, wall: float) -> Dict:
+    return {
+        'answer': json_value(result.answer),
+        'parse': result.parse_time,
+        'prepare': result.prepare_time,
+        'solve': result.solve_time,
+        'cpu': result.cpu_time,
+        'wall': wall,
+        'cached': result.cached,
+    }
+
+
+def solve_input(name: str, item: BatchInput, cache: bool = False) -> Dict:
+
+    """
+    Read, parse and solve one input as a JSON-ready record. Loading the solver is free once this process has
+    imported it. A failure becomes a record with an error, so one bad input doesn't stop the batch.
+    """
+
+    start = time.perf_counter()
+    try:
+        module = runner.load_solver(name)
+        raw = runner.read_input(name, item.path)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = runner.run(module, raw, Cache() if cache else None)
+
+    except Exception as e:
+        return {'input_id': item.input_id, 'error': f"{e.__class__.__name__}: {e}"}
+
+    return {'input_id': item.input_id, **result_record(result, time.perf_counter() - start)}
+
+
+def solve_bytes(name: str, data: bytes, cache: bool = False) -> Dict:
+
+    """
+    As solve_input, for an input that arrives as bytes rather than in a file, like the daemon's requests.
+    Solvers that set MAPPED_INPUT parse the bytes as they are; the rest get them decoded.
+    """
+
+    start = time.perf_counter()
+    try:
+        module = runner.load_solver(name)
+        raw = data if getattr(module, 'MAPPED_INPUT', False) else data.decode()
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = runner.run(module, raw, Cache() if cache else None)
+
+    except Exception as e:
+        return {'error': f"{e.__class__.__name__}: {e}"}
+
+    return result_record(result, time.perf_counter() - start)
+
+
+def run_batch(name: str, inputs: List[BatchInput], workers=1, cache=False) -> Iterator[Dict]:
+
+    """
+    Solve every input with one day/part, yielding each record as it finishes. The solver is imported once
+    per process, along with anything it works out at import time, and stays loaded for every input that
+    process handles: this one with a single worker, otherwise each of a pool of `workers`.
+    """
+
+    runner.load_solver(name)
+    if workers == 1:
+        for item in inputs:
+            yield solve_input(name, item, cache)
+        return
+
+    context = parallel.pool_context(parallel.PRELOAD + [name])
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=runner.load_solver, initargs=(name,)) as pool:
+
+        futures = {pool.submit(solve_input, name, item, cache): item for item in inputs}
+        finished = set()
+        try:
+            for future in as_completed(futures):
+                finished.add(future)
+                yield future.result()
+
+        except BrokenProcessPool:
+            for future, item in futures.items():
+                if future not in finished:
+                    yield {'input_id': item.input_id, 'error': "worker process died"}
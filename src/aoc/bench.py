@@ -0,0 +1,315 @@
+import contextlib
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import platform
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List
+
+from aoc import generators, memory, runner
+from aoc.memory import PhaseMemory
+
+
+BASELINE_PATH = runner.SRC_DIR.parent / 'benchmarks' / 'baseline.json'
+
+# ignore regressions on cases that finish faster than this: at that scale the noise swamps the signal
+MIN_WALL_TIME = 0.02
+
+# timed runs of each case in each process, after one untimed warm-up run, and the total time that
+# quicker cases keep repeating until, so that their median isn't taken over a handful of microseconds
+MIN_RUNS = 5
+MAX_RUNS = 1000
+REPEAT_TIME = 0.1
+
+
+@dataclass
+class BenchCase:
+    name: str
+    label: str
+    raw: str
+    size: int = None  # for generated inputs
+
+    @property
+    def key(self):
+        return f"{self.name}:{self.label}"
+
+
+@dataclass
+class Measurement:
+    wall: float
+    cpu: float
+    parse: float
+    solve: float
+    peak_rss: int
+    normalised: float = None
+    error: str = None
+    memory: Dict[str, PhaseMemory] = None  # by phase, only with --mem
+    steps: int = None  # for solvers that set BUDGETED
+    step_rate: float = None  # steps per second of solve
+    runs: int = 1  # timed in-process runs the timings are the minimums of
+    calibration: float = None  # taken in the same process, between the timed runs
+
+    @property
+    def heap_peak(self):
+        return max(phase.peak for phase in self.memory.values())
+
+
+def bench_cases(names: List[str], generated=False, seed=0) -> List[BenchCase]:
+
+    """
+    The embedded example input for each solver, and a synthetic input at its largest bench size, since most
+    examples solve in well under MIN_WALL_TIME and only show how fixed costs change. With generated,
+    synthetic inputs at every bench size, to fit how each solver scales.
+    """
+
+    cases = []
+    for name in names:
+        module = runner.load_solver(name)
+        cases.append(BenchCase(name, 'test', runner.embedded_test_input(module)))
+
+        day, _ = runner.day_and_part(name)
+        sizes = generators.BENCH_SIZES[day] if generated else generators.BENCH_SIZES[day][-1:]
+        for size in sizes:
+            cases.append(BenchCase(name, f'gen{size}', generators.generate(day, size, seed), size))
+
+    return cases
+
+
+def calibrate(repeats=5) -> float:
+
+    """
+    Time a fixed pure-Python workload on this machine, so timings taken on different machines
+    can be compared by dividing through by it.
+    """
+
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        counts = {}
+        for i in range(200_000):
+            key = (i * 7919) % 1009
+            counts[key] = counts.get(key, 0) + i
+        sorted(counts.items(), key=lambda x: x[1])
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def measure(name: str, raw: str, repeat=True) -> Measurement:
+
+    """
+    Run one solver on one input. Meant to be called in a fresh process, so that peak RSS belongs
+    to this solver alone and module-level state (including caches) starts clean.
+
+    The first run is a warm-up, paying for imports and first-touch costs, and isn't timed. After it come
+    at least MIN_RUNS timed runs, more for quick cases until they add up to REPEAT_TIME, and the timings
+    are their minimums, since noise only ever adds time. The solver is reloaded before each, which empties
+    caches in its own module; state in the aoc modules it uses, like tables built at import, carries over
+    from run to run.
+
+    The machine is calibrated again between the first timed runs, since a shared machine's speed can drift
+    over the minutes a full bench takes, and a calibration taken at the start would no longer fit.
+
+    Without repeat, the solver runs just once, cold, and there is no calibration: for inputs large enough
+    that one run is all there's time for.
+    """
+
+    module = runner.load_solver(name)
+
+    results = []
+    calibrations = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        if not repeat:
+            results.append(runner.run(module, raw))
+        else:
+            runner.run(module, raw)
+            while len(results) < MIN_RUNS or (sum(r.total_time for r in results) < REPEAT_TIME and len(results) < MAX_RUNS):
+                # calibrated between the first runs, so that both span the same stretch of time
+                if len(results) < MIN_RUNS:
+                    calibrations.append(calibrate(repeats=2))
+                module = importlib.reload(module)
+                results.append(runner.run(module, raw))
+
+    solve = min(r.solve_time for r in results)
+    steps = results[0].steps
+
+    return Measurement(
+        wall=min(r.total_time for r in results),
+        cpu=min(r.cpu_time for r in results),
+        parse=min(r.parse_time for r in results),
+        solve=solve,
+        peak_rss=max(r.peak_memory for r in results),
+        steps=steps,
+        step_rate=None if steps is None else (steps / solve if solve else 0.0),
+        runs=len(results),
+        calibration=min(calibrations, default=None))
+
+
+def measure_file(name: str, path) -> Measurement:
+
+    """As measure, with the input read from path in the fresh process: memory-mapped, for solvers that can take that."""
+
+    return measure(name, runner.read_input(name, path), repeat=False)
+
+
+def write_repeated_input(day: int, path, size: int, seed=0) -> int:
+
+    """
+    Write a generated input over and over to path, one copy per line block, until the file is at least size
+    bytes: a cheap way to get a multi-gigabyte document. Only meaningful for days whose input is a list of
+    independent lines, like day 1. Returns the size of the file.
+    """
+
+    block = generators.generate(day, generators.BENCH_SIZES[day][-1], seed).encode() + b'\n'
+    copies = max(1, math.ceil(size / len(block)))
+
+    with open(path, 'wb') as f:
+        for _ in range(copies):
+            f.write(block)
+        # no newline after the last line, as in the real inputs
+        f.truncate(copies * len(block) - 1)
+
+    return copies * len(block) - 1
+
+
+def measure_throughput(name: str, path) -> Measurement:
+
+    """One run of a solver on the input at path, in a fresh process."""
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(measure_file, name, path).result()
+
+
+def best_of(measurements: List[Measurement]) -> Measurement:
+
+    """Fastest run's timings, worst run's peak memory, and the fastest calibration, which noise also only slows."""
+
+    best = min(measurements, key=lambda m: m.wall)
+    best.peak_rss = max(m.peak_rss for m in measurements)
+    best.calibration = min(m.calibration for m in measurements)
+    return best
+
+
+def run_benchmarks(cases: List[BenchCase], repeats=3, mem=False):
+
+    """
+    Measure each case, yielding (case, measurement) pairs as they finish.
+    Every repeat gets its own process, so no solver sees another run's warm caches, and its times are
+    normalised by that process's own calibration.
+    With mem, each case gets one more run under tracemalloc, kept apart from the timed runs since it slows them down.
+    """
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as pool:
+        for case in cases:
+            try:
+                measurement = best_of([pool.submit(measure, case.name, case.raw).result() for _ in range(repeats)])
+                measurement.normalised = measurement.wall / measurement.calibration
+                if mem:
+                    measurement.memory = pool.submit(memory.trace_memory, case.name, case.raw).result()
+            except Exception as e:
+                measurement = Measurement(None, None, None, None, None, error=f"{e.__class__.__name__}: {e}")
+
+            yield case, measurement
+
+
+def machine_info(calibration: float):
+    return {
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'processor': platform.processor(),
+        'calibration': calibration,
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(measurements: Dict[str, Measurement], calibration: float, path=BASELINE_PATH):
+
+    """
+    Write the measurements to the baseline, keeping any existing entries for cases that weren't re-run,
+    and any existing memory figures for cases that were re-run without --mem.
+    """
+
+    baseline = load_baseline(path) or {'results': {}}
+    baseline['machine'] = machine_info(calibration)
+
+    for key, m in measurements.items():
+        if m.error is not None:
+            continue
+
+        result = asdict(m)
+        if m.memory is None:
+            result['memory'] = baseline['results'].get(key, {}).get('memory')
+        baseline['results'][key] = result
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def compare(key: str, measurement: Measurement, baseline, threshold: float):
+
+    """
+    How this measurement's normalised time compares to the baseline's, as a ratio, and whether
+    that counts as a regression. Returns (None, False) if there is nothing to compare against.
+    """
+
+    if baseline is None or measurement.error is not None:
+        return None, False
+
+    previous = baseline['results'].get(key)
+    if previous is None:
+        return None, False
+
+    ratio = measurement.normalised / previous['normalised']
+    regressed = ratio > 1 + threshold and measurement.wall > MIN_WALL_TIME
+
+    return ratio, regressed
+
+
+def compare_memory(key: str, measurement: Measurement, baseline, threshold: float):
+
+    """Like compare, for the highest per-phase peak of the Python heap."""
+
+    if baseline is None or measurement.error is not None or measurement.memory is None:
+        return None, False
+
+    previous = baseline['results'].get(key, {}).get('memory')
+    if not previous:
+        return None, False
+
+    ratio = measurement.heap_peak / max(phase['peak'] for phase in previous.values())
+    regressed = ratio > 1 + threshold and measurement.heap_peak > memory.MIN_PEAK
+
+    return ratio, regressed
+
+
+def scaling_exponent(points) -> float:
+
+    """
+    Least-squares slope of log(wall time) against log(size) over (size, wall) points: roughly 1 for a solver
+    that's linear in its input, 2 for quadratic. None with fewer than two points to fit.
+    """
+
+    points = [(math.log(size), math.log(wall)) for size, wall in points if wall > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
@@ -0,0 +1,72 @@
+import time
+
+
+# how many steps go by between looks at the clock (and the step limit)
+CHECK_EVERY = 4096
+
+
+class BudgetExceeded(Exception):
+
+    """
+    A search ran out of steps or time. `partial` is whatever the solver had worked out when it stopped,
+    such as the longest path found so far, or None if it had nothing worth reporting.
+    """
+
+    def __init__(self, reason, steps, elapsed):
+        super().__init__(f"{reason} after {steps:,} steps in {elapsed:.3f} s ({steps / elapsed if elapsed else 0:,.0f} steps/s)")
+        self.steps = steps
+        self.elapsed = elapsed
+        self.partial = None
+
+
+class Budget:
+
+    """
+    Counts the steps a search takes (states expanded, locations tried, nodes walked...) and stops it, by
+    raising BudgetExceeded, once it goes over max_steps or max_seconds. Either or both can be None, for no limit;
+    an unlimited budget still counts, so rate gives the search's throughput.
+
+    The clock is only read every CHECK_EVERY steps. Loops too tight to afford a call per step can count
+    locally, and pass on their count every so often with step(n).
+    """
+
+    def __init__(self, max_steps=None, max_seconds=None):
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.start()
+
+    def start(self):
+
+        """Start counting, and the clock, again from zero."""
+
+        self.steps = 0
+        self.started = time.perf_counter()
+        self.next_check = 0
+        self.check()
+
+    def step(self, n=1):
+        self.steps += n
+        if self.steps >= self.next_check:
+            self.check()
+
+    def check(self):
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise BudgetExceeded(f"step limit of {self.max_steps:,} reached", self.steps, self.elapsed)
+        if self.max_seconds is not None and self.elapsed > self.max_seconds:
+            raise BudgetExceeded(f"time limit of {self.max_seconds:g} s reached", self.steps, self.elapsed)
+
+        self.next_check = self.steps + CHECK_EVERY
+        if self.max_steps is not None:
+            self.next_check = min(self.next_check, self.max_steps + 1)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+
+        """Steps per second so far."""
+
+        elapsed = self.elapsed
+        return self.steps / elapsed if elapsed else 0.0
@@ -0,0 +1,255 @@
+import hashlib
+import inspect
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+
+from pathlib import Path
+from types import CodeType, ModuleType
+
+from aoc import runner
+
+
+CACHE_DIR = runner.SRC_DIR.parent / '.cache' / 'aoc'
+MAX_BYTES = 512 * 2**20
+
+SOLVER_MODULE = re.compile(r'day\d+_pt\d+')
+
+
+def referenced_names(code: CodeType):
+
+    """Global names used by a code object, including those used by any functions nested inside it."""
+
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= referenced_names(const)
+    return names
+
+
+def member_code(obj):
+
+    """The code objects behind a function, or behind each method of a class."""
+
+    if inspect.isfunction(obj):
+        return [obj.__code__]
+
+    code = []
+    for member in vars(obj).values():
+        if isinstance(member, (staticmethod, classmethod)):
+            member = member.__func__
+        if isinstance(member, property):
+            code.extend(f.__code__ for f in [member.fget, member.fset, member.fdel] if f is not None)
+        elif inspect.isfunction(member):
+            code.append(member.__code__)
+    return code
+
+
+def is_aoc_module(name: str) -> bool:
+    return name == 'aoc' or name.startswith('aoc.')
+
+
+def aoc_imports(module: ModuleType):
+
+    """The aoc.* modules a module uses, directly or indirectly: imported whole, or for their functions and classes."""
+
+    found = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            elif inspect.isfunction(value) or inspect.isclass(value):
+                name = getattr(value, '__module__', None) or ''
+            else:
+                continue
+            if is_aoc_module(name) and name not in found and name in sys.modules:
+                found[name] = sys.modules[name]
+                pending.append(found[name])
+    return found
+
+
+def module_digest(module: ModuleType) -> str:
+
+    """Hash of a module's source and that of every aoc.* module it uses, so editing any of them changes it."""
+
+    digest = hashlib.sha256(inspect.getsource(module).encode())
+    for name, imported in sorted(aoc_imports(module).items()):
+        if imported is not module:
+            digest.update(name.encode())
+            digest.update(inspect.getsource(imported).encode())
+    return digest.hexdigest()
+
+
+def source_digest(obj) -> str:
+
+    """
+    Hash of a function or class's source, along with the source of every function and class it uses,
+    directly or indirectly, from its own module or from aoc.*, the whole source of any aoc.* module it
+    uses through an attribute (like loader.chunks), and the values of any other module globals it uses.
+
+    Two solvers with identical copies of a phase (say, both parts parsing the input the same way) get the
+    same digest, so they can share cached results.
+    """
+
+    digest = hashlib.sha256()
+
+    seen = set()
+    modules = set()
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        module = sys.modules[current.__module__]
+        try:
+            digest.update(inspect.getsource(current).encode())
+        except OSError:
+            # no source to find for classes made at runtime, like namedtuples: their fields define them
+            digest.update(f'{current.__qualname__}{getattr(current, "_fields", ())}'.encode())
+
+        names = set()
+        for code in member_code(current):
+            names |= referenced_names(code)
+
+        for name in sorted(names):
+            if (module.__name__, name) in seen:
+                continue
+            seen.add((module.__name__, name))
+            if not hasattr(module, name):
+                continue  # a builtin, or an attribute name
+
+            # functions behind decorators like functools.cache, whose wrappers repr differently in every process
+            value = inspect.unwrap(getattr(module, name))
+            if inspect.isfunction(value) or inspect.isclass(value):
+                if value.__module__ == module.__name__ or is_aoc_module(value.__module__):
+                    pending.append(value)
+            elif isinstance(value, ModuleType):
+                if is_aoc_module(value.__name__):
+                    modules.add(value.__name__)
+            else:
+                digest.update(f'{name}={value!r}'.encode())
+                # an instance's repr rarely shows its code, so its class is hashed too
+                if is_aoc_module(type(value).__module__):
+                    pending.append(type(value))
+
+    for name in sorted(modules):
+        digest.update(module_digest(sys.modules[name]).encode())
+
+    return digest.hexdigest()
+
+
+class SolverUnpickler(pickle.Unpickler):
+
+    """
+    Resolves classes defined in a solver module against the solver asking for the cached value,
+    so that day20_pt2 sharing day20_pt1's parse gets back its own Conjunction, not day20_pt1's.
+    """
+
+    def __init__(self, file, module):
+        super().__init__(file)
+        self.module = module
+
+    def find_class(self, module_name, name):
+        if self.module is not None and SOLVER_MODULE.fullmatch(module_name) and hasattr(self.module, name):
+            return getattr(self.module, name)
+        return super().find_class(module_name, name)
+
+
+class Cache:
+
+    """
+    On-disk cache of pickled values, addressed by the SHA-256 of whatever went into producing them.
+    Once it grows past max_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(*parts) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode()
+            elif not isinstance(part, (bytes, mmap.mmap)):
+                part = str(part).encode()
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def phase_key(self, raw: str, *functions) -> str:
+
+        """Key for the result of running `functions` in turn on this input, e.g. parse then prepare."""
+
+        return self.key(raw, *(source_digest(function) for function in functions))
+
+    def path(self, key: str) -> Path:
+        return self.directory / f'{key}.pickle'
+
+    def get(self, key: str, module=None):
+
+        """The cached value, or KeyError. Classes from solver modules are resolved against `module`."""
+
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = SolverUnpickler(f, module).load()
+        except FileNotFoundError:
+            raise KeyError(key)
+        except Exception:
+            # unreadable, or pickled from code that has since changed shape: treat it as a miss
+            path.unlink(missing_ok=True)
+            raise KeyError(key)
+
+        # the modification time doubles as the last-used time for eviction
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value):
+
+        """Store a value, silently skipping anything that can't be pickled."""
+
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # write then rename, so a concurrent reader never sees half a file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self.path(key))
+
+        self.evict()
+
+    def entries(self):
+
+        """(path, size, last used) for each entry, least recently used first."""
+
+        entries = []
+        for path in self.directory.glob('*.pickle'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process
+            entries.append((path, stat.st_size, stat.st_mtime))
+
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            path.unlink(missing_ok=True)
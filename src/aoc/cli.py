@@ -0,0 +1,527 @@
+import argparse
+import contextlib
+import json
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+from aoc import batch, bench, client, daemon, follow, generators, loader, memory, parallel, profiling, runner, startup, trace
+from aoc.budget import Budget, BudgetExceeded
+from aoc.cache import Cache
+
+
+def build_parser():
+
+    parser = argparse.ArgumentParser(prog='aoc', description='Run the Advent of Code 2023 solvers.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run one day/part and report timings')
+    run_parser.add_argument('day', help="day to run, e.g. 'day17' or '17'")
+    run_parser.add_argument('--part', type=int, default=1, choices=[1, 2])
+    input_group = run_parser.add_mutually_exclusive_group()
+    input_group.add_argument('--input', help='puzzle input file (default: inputs/dayN.txt)')
+    input_group.add_argument('--test', action='store_true', help="use the solver's embedded example input")
+    input_group.add_argument('--generate', type=int, metavar='SIZE', help='use a synthetic input of this size (see aoc generate)')
+    run_parser.add_argument('--seed', type=int, default=0, help='seed for --generate (default: 0)')
+    run_parser.add_argument('--cache', action='store_true', help='reuse cached answers and parsed/prepared inputs')
+    run_parser.add_argument('--stream', action='store_true', help='read the input a line at a time, for solvers that can (see solve_lines), instead of all at once')
+    run_parser.add_argument('--max-steps', type=int, help="stop a search-heavy solver's solve after this many steps (states expanded, locations tried...)")
+    run_parser.add_argument('--timeout', type=float, metavar='SECONDS', help="stop a search-heavy solver's solve after this long")
+    run_parser.add_argument('--import-profile', action='store_true', help="report where the solver's import time goes")
+    instrument_group = run_parser.add_mutually_exclusive_group()
+    instrument_group.add_argument('--profile', nargs='?', const='cprofile', choices=sorted(profiling.PROFILERS), help='profile parse and solve, deterministically with cProfile (the default) or by sampling the stack')
+    instrument_group.add_argument('--mem', action='store_true', help='trace Python heap allocations per phase with tracemalloc')
+    run_parser.add_argument('--top', type=int, default=20, help='hot functions to list with --profile (default: 20)')
+    run_parser.add_argument('--profile-dir', type=Path, default=profiling.PROFILES_DIR, help='where --profile writes its .pstats and collapsed stacks (default: profiles/)')
+    run_parser.add_argument('--trace', nargs='?', const='debug', choices=[name for name in trace.LEVELS if name != 'off'], help="record the solver's trace events, at debug level (every iteration of its hot loops) unless given")
+    run_parser.add_argument('--trace-file', type=Path, help='write trace events here, as JSON Lines for a .jsonl file and binary otherwise (default: readable lines on stderr)')
+    run_parser.set_defaults(func=run_command)
+
+    bench_parser = subparsers.add_parser('bench', help='benchmark solvers and check for regressions against a baseline')
+    bench_parser.add_argument('days', nargs='*', help="days to benchmark, e.g. 'day5' or '5' (default: all)")
+    bench_parser.add_argument('--repeats', type=int, default=3, help='fresh processes per case; the best is kept (default: 3)')
+    bench_parser.add_argument('--baseline', type=Path, default=bench.BASELINE_PATH, help='baseline JSON file (default: benchmarks/baseline.json)')
+    bench_parser.add_argument('--threshold', type=float, default=0.25, help='fail if a normalised time grows by more than this fraction (default: 0.25)')
+    bench_parser.add_argument('--save', action='store_true', help='write the results to the baseline file')
+    bench_parser.add_argument('--mem', action='store_true', help='also trace peak Python heap per phase, in one extra run per case')
+    bench_parser.add_argument('--generated', action='store_true', help='benchmark synthetic inputs at every bench size, not just the largest, and report how each solver scales')
+    bench_parser.add_argument('--seed', type=int, default=0, help='seed for the generated inputs (default: 0)')
+    bench_parser.set_defaults(func=bench_command)
+
+    throughput_parser = subparsers.add_parser('throughput', help='time one solver on a document of a given size, in MB/s')
+    throughput_parser.add_argument('day', help="day to run, e.g. 'day1' or '1'")
+    throughput_parser.add_argument('--part', type=int, default=1, choices=[1, 2])
+    throughput_parser.add_argument('--megabytes', type=float, default=1000, help='size of the generated document, made by repeating a synthetic input: for days whose input is a list of lines (default: 1000)')
+    throughput_parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic input (default: 0)')
+    throughput_input_group = throughput_parser.add_mutually_exclusive_group()
+    throughput_input_group.add_argument('--input', type=Path, help='time this document instead of generating one')
+    throughput_input_group.add_argument('--output', '-o', type=Path, help='keep the generated document here (default: a temporary file)')
+    throughput_parser.set_defaults(func=throughput_command)
+
+    follow_parser = subparsers.add_parser('follow', help='keep a running answer over an input that grows at the end, reading only what was appended')
+    follow_parser.add_argument('day', help="day to follow, e.g. 'day1' or '1'")
+    follow_parser.add_argument('--part', type=int, default=1, choices=[1, 2])
+    follow_parser.add_argument('--input', type=Path, help='file to follow (default: inputs/dayN.txt)')
+    follow_parser.add_argument('--interval', type=float, default=1.0, metavar='SECONDS', help='how often to look for new lines (default: 1)')
+    follow_parser.add_argument('--once', action='store_true', help='update the answer once, from where the last run left off, and exit')
+    follow_parser.add_argument('--restart', action='store_true', help='forget where the last run left off and read the file from the beginning')
+    follow_parser.set_defaults(func=follow_command)
+
+    run_all_parser = subparsers.add_parser('run-all', help='run every solver in parallel, slowest first')
+    run_all_parser.add_argument('days', nargs='*', help="days to run, e.g. 'day5' or '5' (default: all)")
+    run_all_parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    run_all_parser.add_argument('--test', action='store_true', help="use each solver's embedded example input")
+    run_all_parser.add_argument('--timings', type=Path, default=parallel.TIMINGS_PATH, help='timings from the previous run, used to schedule this one (default: benchmarks/last_run.json)')
+    run_all_parser.add_argument('--cache', action='store_true', help='reuse cached answers and parsed/prepared inputs')
+    run_all_parser.set_defaults(func=run_all_command)
+
+    batch_parser = subparsers.add_parser('batch', help='solve many inputs for one day/part in warm processes, streaming JSON Lines records')
+    batch_parser.add_argument('day', help="day to run, e.g. 'day17' or '17'")
+    batch_parser.add_argument('inputs', type=Path, help='a directory of input files, or a manifest listing one input path per line')
+    batch_parser.add_argument('--part', type=int, default=1, choices=[1, 2])
+    batch_parser.add_argument('--workers', type=int, default=1, help='worker processes, each keeping the solver loaded (default: 1, which runs in this process)')
+    batch_parser.add_argument('--output', '-o', type=Path, help='JSON Lines file to write (default: stdout)')
+    batch_parser.add_argument('--cache', action='store_true', help='reuse cached answers and parsed/prepared inputs')
+    batch_parser.set_defaults(func=batch_command)
+
+    daemon_parser = subparsers.add_parser('daemon', help='keep every solver loaded in a local server, for low-latency repeated solves')
+    daemon_parser.add_argument('action', choices=['start', 'stop', 'stats'], help='start a daemon in the foreground, stop a running one, or show its latency histograms')
+    daemon_parser.add_argument('--socket', type=Path, default=client.SOCKET_PATH, help=f'Unix socket to listen or connect on (default: {client.SOCKET_PATH})')
+    daemon_parser.add_argument('--workers', type=int, help='worker processes for start (default: one per CPU)')
+    daemon_parser.add_argument('--json', action='store_true', help='print stats as JSON, buckets included')
+    daemon_parser.set_defaults(func=daemon_command)
+
+    startup_parser = subparsers.add_parser('startup', help='check how long each solver takes to import against a budget')
+    startup_parser.add_argument('days', nargs='*', help="days to check, e.g. 'day5' or '5' (default: all)")
+    startup_parser.add_argument('--budget', type=float, default=startup.STARTUP_BUDGET * 1000, help=f'maximum import time in ms (default: {startup.STARTUP_BUDGET * 1000:.0f})')
+    startup_parser.add_argument('--import-profile', action='store_true', help="break each solver's import time down by the modules it imports")
+    startup_parser.add_argument('--top', type=int, default=5, help='imports to list per solver with --import-profile (default: 5)')
+    startup_parser.set_defaults(func=startup_command)
+
+    generate_parser = subparsers.add_parser('generate', help='write a synthetic puzzle input of a given size')
+    generate_parser.add_argument('day', nargs='?', help="day to generate for, e.g. 'day10' or '10' (with --check, default: all)")
+    generate_parser.add_argument('--size', type=int, help="size knob: lines, grid side, bricks... depending on the day (default: about the real input's)")
+    generate_parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    generate_parser.add_argument('--output', '-o', type=Path, help='file to write (default: stdout)')
+    generate_parser.add_argument('--check', action='store_true', help="instead, check that the solvers can solve the generator's inputs at its bench sizes (or --size), for a few seeds (or --seed)")
+    generate_parser.set_defaults(func=generate_command)
+
+    cache_parser = subparsers.add_parser('cache', help='inspect or empty the on-disk cache')
+    cache_parser.add_argument('action', choices=['info', 'clear'])
+    cache_parser.set_defaults(func=cache_command)
+
+    return parser
+
+
+def run_command(args):
+
+    name = runner.solver_name(args.day, args.part)
+    if name not in runner.solver_names():
+        sys.exit(f"aoc: no solver for {name}")
+
+    module = runner.load_solver(name)
+    if args.stream:
+        if not runner.streamable(module):
+            sys.exit(f"aoc: {name} can't be streamed: it has no solve_lines")
+        if args.cache:
+            sys.exit("aoc: --cache needs the whole input, so can't be used with --stream")
+
+    if args.generate is not None:
+        raw = generators.generate(runner.day_and_part(name)[0], args.generate, args.seed)
+    elif args.test:
+        try:
+            raw = runner.embedded_test_input(module)
+        except ValueError as e:
+            sys.exit(f"aoc: {e}")
+    elif args.stream:
+        raw = None
+        path = runner.input_path(name) if args.input is None else Path(args.input)
+        if not path.is_file():
+            sys.exit(f"aoc: no puzzle input at {path}")
+    else:
+        try:
+            raw = runner.read_input(name, args.input)
+        except FileNotFoundError as e:
+            sys.exit(f"aoc: no puzzle input at {e.filename}")
+
+    if args.import_profile:
+        print_import_profile(startup.profile_imports(name))
+
+    cache = Cache() if args.cache else None
+    with contextlib.ExitStack() as stack:
+        if args.trace:
+            trace.configure(args.trace, args.trace_file)
+            stack.callback(trace.close)
+
+        trace_phase = runner.no_tracing
+        if args.mem:
+            tracer = stack.enter_context(memory.MemoryTracer())
+            trace_phase = tracer.phase
+        if args.profile:
+            profile = stack.enter_context(profiling.PROFILERS[args.profile]())
+
+        try:
+            if args.stream:
+                lines = loader.read_lines(path) if raw is None else loader.lines(raw)
+                result = runner.run_streamed(module, lines, trace_phase)
+            else:
+                result = runner.run(module, raw, cache, trace_phase, Budget(args.max_steps, args.timeout))
+        except BudgetExceeded as e:
+            partial = '' if e.partial is None else f"; partial result {e.partial}"
+            sys.exit(f"{name}: stopped: {e}{partial}")
+
+    def cached(phase):
+        return '  (cached)' if phase in result.cached else ''
+
+    print(f"{result.name}: {result.answer}{cached('answer')}")
+    print(f"  parse        {result.parse_time:10.4f} s{cached('parse')}")
+    if hasattr(module, 'prepare'):
+        print(f"  prepare      {result.prepare_time:10.4f} s{cached('prepare')}")
+    print(f"  solve        {result.solve_time:10.4f} s")
+    if result.steps is not None:
+        print(f"  steps        {result.steps:10d}   ({result.step_rate:,.0f}/s)")
+    print(f"  cpu          {result.cpu_time:10.4f} s")
+    print(f"  peak memory  {result.peak_memory / 2**20:10.1f} MiB")
+
+    if args.mem:
+        print_phase_memory(tracer.phases)
+
+    if args.profile:
+        print_hot_functions(profile.hot_functions(args.top))
+        for path in profile.write(args.profile_dir, name):
+            print(f"wrote {path}")
+
+
+def selected_solvers(days):
+
+    """Solver names for the requested days (both parts of each), or every solver if no days were given."""
+
+    names = runner.solver_names()
+    if not days:
+        return names
+
+    wanted = {int(str(day).removeprefix('day')) for day in days}
+    return [name for name in names if runner.day_and_part(name)[0] in wanted]
+
+
+def bench_command(args):
+
+    names = selected_solvers(args.days)
+    cases = bench.bench_cases(names, generated=args.generated, seed=args.seed)
+    baseline = bench.load_baseline(args.baseline)
+    calibration = bench.calibrate()
+
+    print(f"calibration: {calibration * 1000:.2f} ms")
+    heap_header = f" {'heap (MiB)':>10} {'vs base':>8}" if args.mem else ''
+    print(f"{'case':<24} {'wall (s)':>10} {'cpu (s)':>10} {'rss (MiB)':>10} {'norm':>10} {'vs base':>8} {'steps/s':>12}{heap_header}")
+
+    measurements = {}
+    regressions = []
+    scaling = {}  # name -> [(size, wall)] for generated inputs
+    for case, m in bench.run_benchmarks(cases, repeats=args.repeats, mem=args.mem):
+        measurements[case.key] = m
+
+        if m.error is not None:
+            print(f"{case.key:<24} ERROR {m.error}")
+            continue
+
+        ratio, regressed = bench.compare(case.key, m, baseline, args.threshold)
+        if regressed:
+            regressions.append(case.key)
+
+        vs_base = '' if ratio is None else f"{ratio:.2f}x"
+        flag = '  REGRESSION' if regressed else ''
+
+        heap = ''
+        if args.mem:
+            heap_ratio, heap_regressed = bench.compare_memory(case.key, m, baseline, args.threshold)
+            if heap_regressed:
+                regressions.append(f"{case.key} (memory)")
+                flag += '  MEMORY REGRESSION'
+            heap_vs_base = '' if heap_ratio is None else f"{heap_ratio:.2f}x"
+            heap = f" {m.heap_peak / 2**20:>10.2f} {heap_vs_base:>8}"
+
+        step_rate = '' if m.step_rate is None else f"{m.step_rate:,.0f}"
+        print(f"{case.key:<24} {m.wall:>10.4f} {m.cpu:>10.4f} {m.peak_rss / 2**20:>10.1f} {m.normalised:>10.2f} {vs_base:>8} {step_rate:>12}{heap}{flag}")
+
+        if case.size is not None and args.generated:
+            scaling.setdefault(case.name, []).append((case.size, m.wall))
+
+    if scaling:
+        print_scaling(scaling)
+
+    too_quick = [key for key, m in measurements.items() if m.error is None and m.wall <= bench.MIN_WALL_TIME]
+    if too_quick and baseline is not None:
+        print(f"{len(too_quick)} case(s) too quick to check for regressions (under {bench.MIN_WALL_TIME * 1000:.0f} ms): {', '.join(too_quick)}")
+
+    if args.save:
+        bench.save_baseline(measurements, calibration, args.baseline)
+        print(f"baseline written to {args.baseline}")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+
+
+def print_scaling(scaling):
+    print()
+    print(f"{'solver':<12} {'sizes':>16} {'wall ~ size^k':>14}")
+    for name, points in scaling.items():
+        exponent = bench.scaling_exponent(points)
+        sizes = f"{points[0][0]}..{points[-1][0]}"
+        print(f"{name:<12} {sizes:>16} {'' if exponent is None else f'k = {exponent:.2f}':>14}")
+
+
+def throughput_command(args):
+
+    name = runner.solver_name(args.day, args.part)
+    if name not in runner.solver_names():
+        sys.exit(f"aoc: no solver for {name}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.input
+        if path is None:
+            day, _ = runner.day_and_part(name)
+            path = args.output or Path(directory) / f'day{day}.txt'
+            bench.write_repeated_input(day, path, int(args.megabytes * 1e6), args.seed)
+        elif not path.exists():
+            sys.exit(f"aoc: no puzzle input at {path}")
+
+        size = path.stat().st_size
+        m = bench.measure_throughput(name, path)
+
+    print(f"{name} on {size / 1e6:.1f} MB")
+    print(f"  parse        {m.parse:10.4f} s")
+    print(f"  solve        {m.solve:10.4f} s")
+    print(f"  throughput   {size / 1e6 / m.wall:10.1f} MB/s")
+    print(f"  peak memory  {m.peak_rss / 2**20:10.1f} MiB")
+
+
+def follow_command(args):
+
+    name = runner.solver_name(args.day, args.part)
+    if name not in runner.solver_names():
+        sys.exit(f"aoc: no solver for {name}")
+    if not follow.followable(runner.load_solver(name)):
+        sys.exit(f"aoc: {name} can't be followed: its answer isn't a sum over lines")
+
+    path = args.input or runner.input_path(name)
+    if not path.exists():
+        sys.exit(f"aoc: no puzzle input at {path}")
+
+    cache = Cache()
+    follower = follow.Follower(name, path) if args.restart else follow.load_follower(name, path, cache)
+
+    shown = None
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                added = follower.update()
+            except ValueError as e:
+                sys.exit(f"aoc: {path}: {e}")
+            follow.save_follower(follower, cache)
+
+            # appending to an unfinished last line changes the answer without adding any complete lines
+            try:
+                answer = follower.answer()
+            except ValueError:
+                answer = f"{follower.state.total} (leaving out the unfinished last line)"
+
+            if answer != shown or args.once:
+                print(f"{name}: {answer}  after {follower.state.offset:,} bytes, {added:,} new in {time.perf_counter() - start:.4f} s", flush=True)
+                shown = answer
+            if args.once:
+                return
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def run_all_command(args):
+
+    names = selected_solvers(args.days)
+    timings = parallel.load_timings(args.timings)
+
+    start = time.perf_counter()
+    outcomes = []
+    for outcome in parallel.run_all(names, workers=args.workers, test=args.test, timings=timings, cache=args.cache):
+        outcomes.append(outcome)
+        progress = f"[{len(outcomes):>2}/{len(names)}]"
+
+        if outcome.error is not None:
+            print(f"{progress} {outcome.name:<12} ERROR {outcome.error}")
+        else:
+            cached = f"  (cached: {', '.join(outcome.result.cached)})" if outcome.result.cached else ''
+            print(f"{progress} {outcome.name:<12} {outcome.elapsed:>10.4f} s  {outcome.result.answer}{cached}")
+
+    makespan = time.perf_counter() - start
+
+    succeeded = [o for o in outcomes if o.error is None]
+    failed = [o for o in outcomes if o.error is not None]
+    serial = sum(o.wall for o in outcomes if o.wall is not None)
+
+    print(f"makespan {makespan:.3f} s, sum of per-solver times {serial:.3f} s ({serial / makespan:.2f}x)")
+
+    # timings from the example inputs would schedule a real run badly
+    if not args.test:
+        parallel.save_timings(succeeded, args.timings)
+
+    if failed:
+        sys.exit(f"{len(failed)} failed: {', '.join(o.name for o in failed)}")
+
+
+def batch_command(args):
+
+    name = runner.solver_name(args.day, args.part)
+    if name not in runner.solver_names():
+        sys.exit(f"aoc: no solver for {name}")
+    if not args.inputs.exists():
+        sys.exit(f"aoc: no inputs at {args.inputs}")
+
+    inputs = batch.batch_inputs(args.inputs)
+
+    start = time.perf_counter()
+    failed = 0
+    with contextlib.ExitStack() as stack:
+        out = sys.stdout if args.output is None else stack.enter_context(open(args.output, 'w'))
+        for record in batch.run_batch(name, inputs, workers=args.workers, cache=args.cache):
+            print(json.dumps(record), file=out, flush=True)
+            failed += 'error' in record
+
+    # stdout is for the records
+    print(f"{name}: {len(inputs)} inputs in {time.perf_counter() - start:.3f} s", file=sys.stderr)
+
+    if failed:
+        sys.exit(f"{failed} of {len(inputs)} inputs failed")
+
+
+def daemon_command(args):
+
+    if args.action == 'start':
+        try:
+            daemon.serve(args.socket, args.workers)
+        except RuntimeError as e:
+            sys.exit(f"aoc: {e}")
+        return
+
+    try:
+        with client.Client(args.socket) as connection:
+            response = connection.shutdown() if args.action == 'stop' else connection.stats()
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit(f"aoc: no daemon listening on {args.socket}")
+
+    if args.action == 'stop':
+        print(f"stopped the daemon on {args.socket}")
+    elif args.json:
+        print(json.dumps(response, indent=2))
+    else:
+        print_latency_stats(response)
+
+
+def print_latency_stats(stats):
+    print(f"{'solver':<12} {'requests':>8} {'errors':>6} {'mean (s)':>10} {'p50 (s)':>10} {'p90 (s)':>10} {'p99 (s)':>10} {'max (s)':>10}")
+    for name, s in stats.items():
+        print(f"{name:<12} {s['count']:>8} {s['errors']:>6} {s['mean']:>10.4f} {s['p50']:>10.4f} {s['p90']:>10.4f} {s['p99']:>10.4f} {s['max']:>10.4f}")
+
+
+def print_phase_memory(phases):
+    for name, phase in phases.items():
+        print()
+        print(f"{name}: peak heap {phase.peak / 2**20:.2f} MiB, retained {phase.retained / 2**20:.2f} MiB")
+        for site in phase.top:
+            print(f"  {site.size / 1024:10.1f} KiB {site.count:>9} blocks  {site.location}")
+
+
+def print_hot_functions(hot_functions):
+    print()
+    print(f"{'self (s)':>10} {'total (s)':>10} {'calls':>10}  function")
+    for f in hot_functions:
+        calls = '' if f.calls is None else f.calls
+        print(f"{f.self_time:>10.4f} {f.total_time:>10.4f} {calls:>10}  {f.label}")
+
+
+def print_import_profile(profile: startup.ImportProfile, top=5, flag=''):
+    print(f"{profile.name} imports in {profile.total * 1000:.1f} ms{flag}")
+    for entry in profile.heaviest(top):
+        print(f"  {entry.module:<28} {entry.cumulative * 1000:8.1f} ms")
+
+
+def startup_command(args):
+
+    budget = args.budget / 1000
+    over_budget = []
+    for name in selected_solvers(args.days):
+        profile = startup.profile_imports(name)
+        flag = ''
+        if profile.total > budget:
+            over_budget.append(name)
+            flag = '  OVER BUDGET'
+
+        if args.import_profile:
+            print_import_profile(profile, args.top, flag)
+        else:
+            print(f"{name:<12} {profile.total * 1000:8.1f} ms{flag}")
+
+    if over_budget:
+        sys.exit(f"{len(over_budget)} solver(s) over the {args.budget:.0f} ms startup budget: {', '.join(over_budget)}")
+
+
+def generate_command(args):
+
+    if args.check:
+        check_generators(args)
+        return
+    if args.day is None:
+        sys.exit("aoc: generate needs a day")
+
+    day = int(args.day.removeprefix('day'))
+    if day not in generators.GENERATORS:
+        sys.exit(f"aoc: no generator for day {day}")
+
+    raw = generators.generate(day, args.size, args.seed)
+    if args.output is None:
+        print(raw)
+    else:
+        args.output.write_text(raw)
+        print(f"wrote {args.output}")
+
+
+def check_generators(args):
+
+    days = sorted(generators.GENERATORS) if args.day is None else [int(args.day.removeprefix('day'))]
+    sizes = None if args.size is None else [args.size]
+    seeds = generators.CHECK_SEEDS if args.seed == 0 else [args.seed]
+
+    failures = 0
+    for day in days:
+        if day not in generators.GENERATORS:
+            sys.exit(f"aoc: no generator for day {day}")
+        start = time.perf_counter()
+        problems = list(generators.check(day, sizes, seeds))
+        for name, size, seed, problem in problems:
+            print(f"{name:<12} size {size:<6} seed {seed:<3} {problem}")
+        print(f"day{day:<2}  {'ok' if not problems else f'{len(problems)} unsolved'}  ({time.perf_counter() - start:.1f} s)")
+        failures += len(problems)
+
+    if failures:
+        sys.exit(f"{failures} generated input(s) couldn't be solved")
+
+
+def cache_command(args):
+
+    cache = Cache()
+    if args.action == 'clear':
+        cache.clear()
+        print(f"cleared {cache.directory}")
+        return
+
+    entries = cache.entries()
+    size = sum(size for _, size, _ in entries)
+    print(f"{cache.directory}: {len(entries)} entries, {size / 2**20:.1f} of {cache.max_bytes / 2**20:.0f} MiB")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import socket
+import struct
+import sys
+
+from pathlib import Path
+
+
+# this module is what every request from the command line imports, so it sticks to the standard library
+# and leaves loading solvers to the daemon (see aoc.daemon)
+
+SOCKET_PATH = Path(os.environ.get('XDG_RUNTIME_DIR') or '/tmp') / f'aoc-{os.getuid()}.sock'
+INPUTS_DIR = Path(__file__).resolve().parent.parent.parent / 'inputs'
+
+# each message is a JSON header and a (possibly empty) body of raw bytes, preceded by both their lengths
+PREFIX = struct.Struct('>II')
+
+
+def send_message(sock, header: dict, body: bytes = b''):
+    header = json.dumps(header).encode()
+    sock.sendall(PREFIX.pack(len(header), len(body)) + header + body)
+
+
+def receive_exactly(sock, n) -> bytes:
+    buffer = bytearray(n)
+    view = memoryview(buffer)
+    received = 0
+    while received < n:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("connection closed partway through a message")
+        received += count
+    return bytes(buffer)
+
+
+def receive_message(sock):
+
+    """The next (header, body) on the socket, or None if the other end has closed the connection between messages."""
+
+    first = sock.recv(1)
+    if not first:
+        return None
+
+    header_length, body_length = PREFIX.unpack(first + receive_exactly(sock, PREFIX.size - 1))
+    header = json.loads(receive_exactly(sock, header_length))
+    return header, receive_exactly(sock, body_length)
+
+
+class Client:
+
+    """
+    A connection to a running daemon, which can carry any number of requests one after another.
+    Connecting raises FileNotFoundError or ConnectionRefusedError if no daemon is listening.
+    """
+
+    def __init__(self, path=SOCKET_PATH):
+        self.path = path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(str(path))
+        except OSError:
+            self.sock.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.sock.close()
+
+    def request(self, header: dict, body: bytes = b'') -> dict:
+        send_message(self.sock, header, body)
+        response = receive_message(self.sock)
+        if response is None:
+            raise ConnectionError("the daemon closed the connection without answering")
+        return response[0]
+
+    def solve(self, day, part, input_bytes: bytes) -> dict:
+
+        """
+        Solve one input, as a record like aoc batch writes: the answer and phase timings, or an error.
+        `latency` is how long the daemon spent on the request, waiting for a free worker included.
+        """
+
+        return self.request({'op': 'solve', 'day': day, 'part': part}, input_bytes)
+
+    def stats(self) -> dict:
+
+        """Per-solver latency histograms, by solver name (see aoc.daemon.LatencyHistogram.summary)."""
+
+        return self.request({'op': 'stats'})
+
+    def shutdown(self) -> dict:
+        return self.request({'op': 'shutdown'})
+
+
+def solve(day, part, input_bytes: bytes, path=SOCKET_PATH) -> dict:
+
+    """One request on a connection of its own."""
+
+    with Client(path) as client:
+        return client.solve(day, part, input_bytes)
+
+
+def solve_here(day, part, input_bytes: bytes) -> dict:
+
+    """What the daemon would have answered, worked out in this process instead, paying for the imports."""
+
+    from aoc import batch, runner
+
+    return batch.solve_bytes(runner.solver_name(day, part), input_bytes)
+
+
+def main(argv=None):
+
+    """
+    A stand-in for running a solver script: print just the answer. Goes through the daemon when one is
+    listening, and otherwise falls back to solving in this process.
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m aoc.client', description='Solve a puzzle input through the aoc daemon.')
+    parser.add_argument('day', help="day to run, e.g. 'day17' or '17'")
+    parser.add_argument('--part', type=int, default=1, choices=[1, 2])
+    parser.add_argument('--input', help="puzzle input file, or - for stdin (default: inputs/dayN.txt)")
+    parser.add_argument('--socket', type=Path, default=SOCKET_PATH, help=f'daemon socket (default: {SOCKET_PATH})')
+    args = parser.parse_args(argv)
+
+    day = int(args.day.removeprefix('day'))
+    try:
+        if args.input == '-':
+            input_bytes = sys.stdin.buffer.read()
+        else:
+            input_bytes = Path(args.input or INPUTS_DIR / f'day{day}.txt').read_bytes()
+    except FileNotFoundError as e:
+        sys.exit(f"aoc: no puzzle input at {e.filename}")
+
+    try:
+        record = solve(day, args.part, input_bytes, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"aoc: no daemon listening on {args.socket}, solving in this process", file=sys.stderr)
+        record = solve_here(day, args.part, input_bytes)
+
+    if 'error' in record:
+        sys.exit(f"aoc: {record['error']}")
+    print(record['answer'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+import bisect
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List
+
+from aoc import batch, parallel, runner
+from aoc.client import SOCKET_PATH, receive_message, send_message
+
+
+# upper bounds of the latency buckets, each twice the last: 0.1 ms up to about 105 s
+BUCKETS = [0.0001 * 2**k for k in range(21)]
+
+
+class LatencyHistogram:
+
+    """
+    Request latencies in logarithmic buckets, so a solver answering in a millisecond and one taking a minute
+    are both resolved to within a factor of two. Percentiles are read off as the upper bound of their bucket.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # the last bucket is everything slower than BUCKETS[-1]
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def record(self, seconds, error=False):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.errors += error
+
+    def percentile(self, q) -> float:
+
+        """Latency that the fraction q of requests came in under, e.g. percentile(0.99)."""
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean': self.total / self.count,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p99': self.percentile(0.99),
+            'max': self.max,
+            # upper bound in seconds -> requests, leaving out the empty buckets; None bounds the slowest
+            'buckets': [[bound, count] for bound, count in zip(BUCKETS + [None], self.counts) if count],
+        }
+
+
+def load_solvers(names: List[str]):
+    for name in names:
+        runner.load_solver(name)
+
+
+class RequestHandler(socketserver.BaseRequestHandler):
+
+    """One client connection, answering its requests in turn until it closes."""
+
+    def handle(self):
+        while True:
+            try:
+                message = receive_message(self.request)
+            except ConnectionError:
+                return
+            if message is None:
+                return
+
+            header, body = message
+            start = time.perf_counter()
+            op = header.get('op')
+
+            if op == 'solve':
+                response = self.server.solve(header, body, start)
+            elif op == 'stats':
+                response = self.server.stats()
+            elif op == 'shutdown':
+                response = {'stopping': True}
+                # shutdown() waits for serve_forever to return, so it can't be called from a request thread
+                threading.Thread(target=self.server.shutdown).start()
+            else:
+                response = {'error': f"unknown op {op!r}"}
+
+            send_message(self.request, response)
+
+
+class Daemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    """
+    A local server that keeps every solver loaded, in a pool of worker processes that each imported them all
+    once at start-up. Each connection gets a thread, which hands its solves to the pool, so up to `workers`
+    inputs are solved at once. Latencies are kept per solver (see LatencyHistogram).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path=SOCKET_PATH, workers=None):
+        self.path = path
+        self.workers = workers or os.cpu_count()
+        self.names = runner.solver_names()
+        self.context = parallel.pool_context(parallel.PRELOAD + self.names)
+
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.pool = self.start_pool()
+
+        super().__init__(str(path), RequestHandler)
+
+    def start_pool(self) -> ProcessPoolExecutor:
+
+        """A pool with all its workers running and their solvers loaded, so the first requests don't wait for them."""
+
+        pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context,
+                                   initializer=load_solvers, initargs=(self.names,))
+        # the pool only starts a new worker when a task arrives and none is idle
+        wait([pool.submit(os.getpid) for _ in range(self.workers)])
+        return pool
+
+    def solve(self, header, body, start) -> Dict:
+        try:
+            name = runner.solver_name(header['day'], header['part'])
+        except (KeyError, ValueError) as e:
+            return {'error': f"bad solve request: {e.__class__.__name__}: {e}"}
+        if name not in self.names:
+            return {'error': f"no solver for {name}"}
+
+        pool = self.pool
+        try:
+            record = pool.submit(batch.solve_bytes, name, body).result()
+        except BrokenProcessPool:
+            record = {'error': "worker process died"}
+            with self.lock:
+                # another request may have replaced the pool already
+                if self.pool is pool:
+                    self.pool = self.start_pool()
+
+        latency = time.perf_counter() - start
+        with self.lock:
+            self.histograms.setdefault(name, LatencyHistogram()).record(latency, 'error' in record)
+
+        return {**record, 'latency': latency}
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {name: self.histograms[name].summary() for name in sorted(self.histograms, key=runner.day_and_part)}
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def listening(path=SOCKET_PATH) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def serve(path=SOCKET_PATH, workers=None):
+
+    """
+    Run a daemon on path until it's asked to shut down, or gets SIGINT or SIGTERM. A socket file left behind
+    by a daemon that died is replaced; one that's still answering is an error.
+    """
+
+    if listening(path):
+        raise RuntimeError(f"a daemon is already listening on {path}")
+    if os.path.exists(path):
+        os.unlink(path)
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with Daemon(path, workers) as server:
+        print(f"aoc daemon: {len(server.names)} solvers loaded in {server.workers} workers, listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,112 @@
+import zlib
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import loader, runner
+from aoc.cache import Cache, source_digest
+
+
+# new data is summed this many bytes at a time, which bounds the memory a large append takes
+CHUNK_BYTES = 1 << 24
+
+# how many bytes just before the offset are checksummed, to tell an appended file from a replaced one
+WINDOW = 4096
+
+
+@dataclass
+class FollowState:
+
+    """How far a running total has got into a file: everything before offset is complete lines, already summed."""
+
+    offset: int = 0
+    total: int = 0
+    checksum: int = 0
+
+
+def followable(module) -> bool:
+
+    """Whether a solver's answer is a sum over independent lines, which it declares by defining sum_lines(chunk)."""
+
+    return hasattr(module, 'sum_lines')
+
+
+class Follower:
+
+    """
+    A running total over a file that only ever grows at the end, for solvers whose answer is a sum over
+    independent lines. Each update maps the file and reads only what was appended since the last one:
+    complete lines are summed and the offset moves past them, while a partial line at the end is left
+    for next time. If the file has shrunk, or the bytes just before the offset have changed, it was
+    replaced rather than appended to, and the total starts again from the beginning.
+    """
+
+    def __init__(self, name, path, state=None):
+        self.name = name
+        self.path = Path(path)
+        self.sum_lines = runner.load_solver(name).sum_lines
+        self.state = state or FollowState()
+        self.pending = 0
+
+    def window_checksum(self, data, offset) -> int:
+        return zlib.crc32(data[max(0, offset - WINDOW):offset])
+
+    def update(self) -> int:
+
+        """Sum the complete lines appended since the last update. Returns how many bytes of them there were."""
+
+        data = runner.map_file(self.path)
+        state = self.state
+        if len(data) < state.offset or self.window_checksum(data, state.offset) != state.checksum:
+            state = self.state = FollowState()
+
+        # everything up to and including the last newline is complete lines
+        end = data.rfind(b'\n', state.offset) + 1
+        self.pending = len(data) - max(end, state.offset)
+        if end == 0:
+            return 0
+
+        # summed before any of the state changes, so a bad line leaves it as it was
+        total = sum(self.sum_lines(chunk) for chunk in loader.chunks(memoryview(data)[state.offset:end], CHUNK_BYTES))
+
+        state.total += total
+        added = end - state.offset
+        state.offset = end
+        state.checksum = self.window_checksum(data, end)
+        return added
+
+    def answer(self):
+
+        """
+        The total as solving the whole file would give it, counting a partial line at the end as the last
+        line: ValueError, as from solve, if that line can't be summed yet.
+        """
+
+        if not self.pending:
+            return self.state.total
+
+        data = runner.map_file(self.path)
+        return self.state.total + self.sum_lines(data[self.state.offset:self.state.offset + self.pending])
+
+
+def state_key(name, path) -> str:
+
+    """Cache key for a follower's state: the state is only any use to the same solver, unchanged, on the same file."""
+
+    module = runner.load_solver(name)
+    return Cache.key('follow', name, Path(path).resolve(), source_digest(module.sum_lines))
+
+
+def load_follower(name, path, cache: Cache) -> Follower:
+
+    """A follower picking up where the last one on this file left off, if its state is still in the cache."""
+
+    try:
+        state = cache.get(state_key(name, path))
+    except KeyError:
+        state = None
+    return Follower(name, path, state)
+
+
+def save_follower(follower: Follower, cache: Cache):
+    cache.put(state_key(follower.name, follower.path), follower.state)
@@ -0,0 +1,180 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Dict
+
+from aoc import loader, trace
+
+
+# the log is parsed this many bytes at a time, which bounds the memory parsing takes
+CHUNK_BYTES = 1 << 23
+
+# in counts, for a colour a draw didn't show, and for the draws past the end of a game
+NOT_DRAWN = -1
+
+# what can end a colour's name
+DELIMITERS = np.zeros(256, dtype=bool)
+DELIMITERS[list(b',; \t\r\n')] = True
+
+
+@dataclass
+class Games:
+
+    """
+    Every game's draws as one dense array, counts[game, draw, colour], so questions about all the games are
+    a few reductions over its axes. Colours get their index on the last axis in the order they first appear.
+    """
+
+    numbers: np.ndarray
+    counts: np.ndarray
+    draws: np.ndarray
+    colours: Dict[str, int]
+
+
+def fixed_width(flat, starts, ends):
+
+    """The byte strings flat[starts[i]:ends[i]], as rows of a matrix padded with zeros to the longest."""
+
+    lengths = ends - starts
+    rows = np.zeros((len(starts), lengths.max(initial=1)), dtype=np.uint8)
+    for k in range(rows.shape[1]):
+        longer = np.flatnonzero(lengths > k)
+        rows[longer, k] = flat[starts[longer] + k]
+    return rows
+
+
+def parse_games(raw) -> Games:
+
+    """
+    The games, parsed a column at a time: every number in the input is a run of digits, a game's if a colon
+    follows it and otherwise a count, whose colour is the word after it, whose game is the last one to start
+    before it, and whose draw is how many semicolons come between the two.
+    """
+
+    flat = np.frombuffer(loader.as_buffer(raw), dtype=np.uint8)
+
+    # bytes below '0' wrap round to large values; runs of digits start and end where this changes
+    digits = flat - ord('0')
+    is_digit = digits < 10
+    starts, ends = np.flatnonzero(np.diff(is_digit, prepend=False, append=False)).reshape(-1, 2).T
+
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range((ends - starts).max(initial=0)):
+        longer = np.flatnonzero(ends - starts > k)
+        values[longer] = values[longer] * 10 + digits[starts[longer] + k]
+
+    is_game = flat[np.minimum(ends, len(flat) - 1)] == ord(':')
+    game_starts = starts[is_game]
+    count_starts, count_ends = starts[~is_game], ends[~is_game]
+
+    # the colour starts after the space following its count
+    names_start = count_ends + 1
+    delimiters = np.flatnonzero(DELIMITERS[flat])
+    names_end = np.append(delimiters, len(flat))[np.searchsorted(delimiters, names_start)]
+    names = fixed_width(flat, names_start, names_end)
+    names = names.view(f'V{names.shape[1]}').ravel()
+    unique, first_seen, colour_of = np.unique(names, return_index=True, return_inverse=True)
+    order = np.argsort(first_seen)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    colours = {bytes(name).rstrip(b'\0').decode(): i for i, name in enumerate(unique[order])}
+
+    semicolons = np.flatnonzero(flat == ord(';'))
+    game_of = np.searchsorted(game_starts, count_starts, side='right') - 1
+    semicolons_before_game = np.searchsorted(semicolons, game_starts)
+    draw_of = np.searchsorted(semicolons, count_starts) - semicolons_before_game[game_of]
+    draws = (np.append(semicolons_before_game[1:], len(semicolons)) - semicolons_before_game + 1).astype(np.int32)
+
+    counts = np.full((len(game_starts), draws.max(initial=0), len(colours)), NOT_DRAWN, dtype=np.int32)
+    counts[game_of, draw_of, rank[colour_of]] = values[~is_game]
+
+    return Games(values[is_game], counts, draws, colours)
+
+
+def drawn(colours, counts) -> Dict[str, int]:
+
+    """A row of counts by colour name, for a trace, leaving out the colours not drawn."""
+
+    return {colour: count for colour, count in zip(colours, counts) if count != NOT_DRAWN}
+
+
+@dataclass
+class Maxima:
+
+    """
+    The distinct rows of the games' largest draws of each colour, distinct[row, colour], each with how many
+    games share it and the total of their numbers. That's enough to answer both parts, and stays small however
+    many games there are, since counts are small.
+    """
+
+    colours: Dict[str, int]
+    distinct: np.ndarray
+    games: np.ndarray
+    totals: np.ndarray
+
+
+def distinct_rows(rows):
+
+    """
+    np.unique(rows, axis=0, return_inverse=True), for rows of small counts: each row is read as one integer,
+    its counts the digits, when that fits in an int64, since sorting scalars is far quicker than sorting rows.
+    """
+
+    base = int(rows.max(initial=NOT_DRAWN)) + 2
+    if base ** rows.shape[1] >= 1 << 62:
+        distinct, row_of = np.unique(rows, axis=0, return_inverse=True)
+        return distinct, row_of.ravel()
+
+    place_values = base ** np.arange(rows.shape[1] - 1, -1, -1, dtype=np.int64)
+    keys, row_of = np.unique((rows - NOT_DRAWN).astype(np.int64) @ place_values, return_inverse=True)
+    distinct = (keys[:, np.newaxis] // place_values % base + NOT_DRAWN).astype(rows.dtype)
+    return distinct, row_of
+
+
+def collapse(colours, rows, games, totals) -> Maxima:
+
+    """Maxima from rows that may repeat, each standing for `games` games whose numbers add up to `totals`."""
+
+    distinct, row_of = distinct_rows(rows)
+    merged_games = np.zeros(len(distinct), dtype=np.int64)
+    merged_totals = np.zeros(len(distinct), dtype=np.int64)
+    np.add.at(merged_games, row_of, games)
+    np.add.at(merged_totals, row_of, totals)
+    return Maxima(colours, distinct, merged_games, merged_totals)
+
+
+def merge(a: Maxima, b: Maxima) -> Maxima:
+
+    """The Maxima of both a's games and b's, with any colours new to b added after a's."""
+
+    colours = dict(a.colours)
+    for colour in b.colours:
+        colours.setdefault(colour, len(colours))
+
+    rows = np.full((len(a.distinct) + len(b.distinct), len(colours)), NOT_DRAWN, dtype=np.int32)
+    rows[:len(a.distinct), :len(a.colours)] = a.distinct
+    rows[len(a.distinct):, [colours[colour] for colour in b.colours]] = b.distinct
+
+    return collapse(colours, rows, np.concatenate([a.games, b.games]), np.concatenate([a.totals, b.totals]))
+
+
+def parse_maxima(raw) -> Maxima:
+
+    """
+    The Maxima of every game, reading the log CHUNK_BYTES at a time and keeping only the Maxima so far
+    between chunks, so a log of any size is parsed in bounded memory. Both parts of day 2 answer from it.
+    """
+
+    debug = trace.enabled(trace.DEBUG)
+
+    maxima = Maxima({}, np.empty((0, 0), dtype=np.int32), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    for chunk in loader.chunks(raw, CHUNK_BYTES):
+        games = parse_games(chunk)
+        game_maxima = games.counts.max(axis=1, initial=NOT_DRAWN)
+        maxima = merge(maxima, collapse(games.colours, game_maxima, 1, games.numbers))
+
+        if debug:
+            for number, row in zip(games.numbers.tolist(), game_maxima.tolist()):
+                trace.event('game', number=number, maxima=drawn(games.colours, row))
+
+    return maxima
@@ -0,0 +1,796 @@
+import math
+import random
+import string
+
+from collections import deque
+from typing import Iterator, Tuple
+
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+SYMBOLS = '*#+$/=%@&'
+CARDS = '23456789TJQKA'
+ALMANAC_MAPS = ['seed-to-soil', 'soil-to-fertilizer', 'fertilizer-to-water', 'water-to-light',
+                'light-to-temperature', 'temperature-to-humidity', 'humidity-to-location']
+
+# (row, col) offsets of a cell's 8 neighbours, going round clockwise from north
+RING = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+# pipe for each pair of directions a loop passes through a cell in
+PIPES = {
+    frozenset('NS'): '|', frozenset('EW'): '-',
+    frozenset('NE'): 'L', frozenset('NW'): 'J',
+    frozenset('SW'): '7', frozenset('SE'): 'F',
+}
+
+
+def unique_names(rng, count, length, alphabet=string.ascii_lowercase, exclude=()):
+    names = set()
+    excluded = set(exclude)
+    while len(names) < count:
+        name = ''.join(rng.choices(alphabet, k=length))
+        if name not in excluded:
+            names.add(name)
+    return sorted(names)
+
+
+def primes_between(low, high):
+    return [n for n in range(max(low, 2), high) if all(n % d for d in range(2, math.isqrt(n) + 1))]
+
+
+def grid_text(grid):
+    return '\n'.join(''.join(row) for row in grid)
+
+
+def can_grow_into(region, cell):
+
+    """
+    Whether adding cell keeps the region free of holes, and its outline free of places where it touches itself:
+    the neighbours already in the region must form one unbroken run round the cell, and not just a lone diagonal.
+    """
+
+    r, c = cell
+    ring = [(r + dr, c + dc) in region for dr, dc in RING]
+    runs = sum(1 for i in range(8) if ring[i] and not ring[i - 1])
+    if runs != 1:
+        return False
+
+    lone_diagonal = sum(ring) == 1 and ring.index(True) % 2 == 1
+    return not lone_diagonal
+
+
+def simple_region(rng, rows, cols, fill=0.5):
+
+    """A random connected set of cells in a rows x cols grid, grown from the centre, kept off the border."""
+
+    start = (rows // 2, cols // 2)
+    region = {start}
+    frontier = [start]
+    target = fill * (rows - 2) * (cols - 2)
+
+    for _ in range(int(20 * target)):
+        if len(region) >= target or not frontier:
+            break
+
+        cell = frontier[rng.randrange(len(frontier))]
+        for dr, dc in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
+            neighbour = (cell[0] + dr, cell[1] + dc)
+            if 0 < neighbour[0] < rows - 1 and 0 < neighbour[1] < cols - 1 and neighbour not in region:
+                if can_grow_into(region, neighbour) and rng.random() < 0.5:
+                    region.add(neighbour)
+                    frontier.append(neighbour)
+
+    return region
+
+
+def region_outline(region):
+
+    """
+    The lattice points round the region's outline, clockwise, where cell (r, c) has corners (r, c) and (r+1, c+1).
+    Consecutive points are one unit apart.
+    """
+
+    step = {}
+    for r, c in region:
+        if (r - 1, c) not in region:
+            step[(r, c)] = (r, c + 1)
+        if (r, c + 1) not in region:
+            step[(r, c + 1)] = (r + 1, c + 1)
+        if (r + 1, c) not in region:
+            step[(r + 1, c + 1)] = (r + 1, c)
+        if (r, c - 1) not in region:
+            step[(r + 1, c)] = (r, c)
+
+    start = min(step)
+    outline = [start]
+    point = step[start]
+    while point != start:
+        outline.append(point)
+        point = step[point]
+
+    assert len(outline) == len(step), "region has a hole or a pinch"
+    return outline
+
+
+def direction(a, b):
+    if a[0] == b[0]:
+        return 'E' if b[1] > a[1] else 'W'
+    return 'S' if b[0] > a[0] else 'N'
+
+
+def day1(rng, size):
+
+    """size lines of calibration document."""
+
+    lines = []
+    for _ in range(size):
+        pieces = []
+        for _ in range(rng.randint(1, 6)):
+            r = rng.random()
+            if r < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif r < 0.6:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+
+        # every line has at least one real digit, for part 1
+        pieces.insert(rng.randint(0, len(pieces)), str(rng.randint(1, 9)))
+        lines.append(''.join(pieces))
+
+    return '\n'.join(lines)
+
+
+def day2(rng, size):
+
+    """size games of cube draws, some of them impossible with the part 1 bag."""
+
+    lines = []
+    for game in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            draws.append(', '.join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+
+    return '\n'.join(lines)
+
+
+def day3(rng, size):
+
+    """A size x size engine schematic."""
+
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            r = rng.random()
+            if r < 0.12 and not (row and row[-1].isdigit()):
+                row.extend(str(rng.randint(1, 999)))
+            elif r < 0.17:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append('.')
+        rows.append(row[:size])
+
+    return grid_text(rows)
+
+
+def day4(rng, size):
+
+    """size scratchcards, none of which win copies of cards past the end of the table."""
+
+    lines = []
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        matches = min(rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 5, 10]), size - card)
+
+        others = [n for n in range(1, 100) if n not in winning]
+        revealed = winning[:matches] + rng.sample(others, 25 - matches)
+        rng.shuffle(revealed)
+
+        lines.append(f"Card {card:>4}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in revealed)}")
+
+    return '\n'.join(lines)
+
+
+def day5(rng, size):
+
+    """
+    An almanac whose maps each shuffle size ranges of the numbers below 100 * size. Values are kept small,
+    since part 2 searches upwards from location 0.
+    """
+
+    limit = 100 * size
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(limit)
+        seeds += [start, rng.randint(1, max(1, min(limit - start, limit // 50)))]
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    for name in ALMANAC_MAPS:
+        cuts = sorted(rng.sample(range(1, limit), size - 1)) if size > 1 else []
+        bounds = [0] + cuts + [limit]
+        ranges = [(start, end - start) for start, end in zip(bounds, bounds[1:])]
+
+        # laying the same ranges out again in a different order gives each its destination
+        destinations = ranges[:]
+        rng.shuffle(destinations)
+
+        lines = []
+        destination_start = 0
+        for (source_start, length) in destinations:
+            lines.append(f"{destination_start} {source_start} {length}")
+            destination_start += length
+
+        sections.append(f"{name} map:\n" + '\n'.join(lines))
+
+    return '\n\n'.join(sections)
+
+
+def day6(rng, size):
+
+    """size races, every one of which can be won."""
+
+    times = [rng.randint(7, 99) for _ in range(size)]
+    distances = [rng.randint(t * t // 8, (t // 2) * (t - t // 2) - 1) for t in times]
+
+    return (f"Time:      {'  '.join(f'{t:>4}' for t in times)}\n"
+            f"Distance:  {'  '.join(f'{d:>4}' for d in distances)}")
+
+
+def day7(rng, size):
+
+    """size hands of camel cards."""
+
+    return '\n'.join(f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}" for _ in range(size))
+
+
+def day8(rng, size):
+
+    """
+    size ghosts, each running round its own cycle of nodes from an ..A node back round to an ..Z node, with a
+    length that is a multiple of the instructions'. The first ghost goes from AAA to ZZZ, for part 1.
+    """
+
+    instructions = ''.join(rng.choices('LR', k=rng.choice(primes_between(11, 30))))
+    cycle_lengths = rng.sample(primes_between(11, 60), size)
+
+    total_nodes = sum(cycle_lengths) * len(instructions)
+    middles = unique_names(rng, total_nodes, 3, string.ascii_uppercase)
+    middles = [name for name in middles if name[-1] not in 'AZ']
+    while len(middles) < total_nodes:
+        name = ''.join(rng.choices(string.ascii_uppercase, k=2)) + rng.choice('BCDEFGHIJKLMNOPQRSTUVWXY')
+        if name not in middles:
+            middles.append(name)
+    rng.shuffle(middles)
+
+    prefixes = ['AA', 'ZZ'] if size == 1 else unique_names(rng, size, 2, string.ascii_uppercase, exclude=['AA', 'ZZ'])
+    lines = []
+    for ghost, cycle_length in enumerate(cycle_lengths):
+        start, end = ('AAA', 'ZZZ') if ghost == 0 else (prefixes[ghost] + 'A', prefixes[ghost] + 'Z')
+
+        steps = cycle_length * len(instructions)
+        path = [start] + [middles.pop() for _ in range(steps - 1)] + [end]
+
+        # every step follows the instruction to the next node on the path; the other branch goes nowhere useful
+        successors = {}
+        for i, node in enumerate(path[:-1]):
+            taken = path[i + 1]
+            other = rng.choice(path[1:-1] or [taken])
+            successors[node] = (taken, other) if instructions[i % len(instructions)] == 'L' else (other, taken)
+
+        # the end node carries on round the cycle exactly as the start node did
+        successors[end] = successors[start]
+
+        lines += [f"{node} = ({left}, {right})" for node, (left, right) in successors.items()]
+
+    rng.shuffle(lines)
+    return instructions + '\n\n' + '\n'.join(lines)
+
+
+def day9(rng, size):
+
+    """size histories, each the values of a random integer polynomial."""
+
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-10, 10) for _ in range(rng.randint(1, 7))]
+        values = [sum(a * math.comb(x, k) for k, a in enumerate(coefficients)) for x in range(21)]
+        lines.append(' '.join(map(str, values)))
+
+    return '\n'.join(lines)
+
+
+def day10(rng, size):
+
+    """
+    A size x size sketch with one loop of pipe round a random blob, and stray straight pipes about the place
+    (which can't form loops of their own). S sits on a part of the loop shaped |, F or 7.
+    """
+
+    rows = cols = max(5, (size - 1) // 2)
+    outline = region_outline(simple_region(rng, rows, cols))
+
+    # each lattice point, and the midpoint of each step between them, becomes a cell of the loop
+    loop = []
+    for a, b in zip(outline, outline[1:] + outline[:1]):
+        loop += [(2 * a[0], 2 * a[1]), (a[0] + b[0], a[1] + b[1])]
+
+    grid = [[rng.choice('..-|') for _ in range(2 * cols + 1)] for _ in range(2 * rows + 1)]
+    for i, cell in enumerate(loop):
+        before, after = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[cell[0]][cell[1]] = PIPES[frozenset([direction(cell, before), direction(cell, after)])]
+
+    start = rng.choice([cell for cell in loop if grid[cell[0]][cell[1]] in '|F7'])
+    grid[start[0]][start[1]] = 'S'
+
+    return grid_text(grid)
+
+
+def day11(rng, size):
+
+    """A size x size image, with a few empty rows and columns to expand."""
+
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+
+    grid = [['#' if r not in empty_rows and c not in empty_cols and rng.random() < 0.04 else '.'
+             for c in range(size)] for r in range(size)]
+
+    # at least two galaxies, so there is a distance to measure
+    free = [(r, c) for r in range(size) for c in range(size) if r not in empty_rows and c not in empty_cols]
+    for r, c in rng.sample(free, 2):
+        grid[r][c] = '#'
+
+    return grid_text(grid)
+
+
+def day12(rng, size):
+
+    """size condition records, each made by damaging a random row of springs."""
+
+    lines = []
+    for _ in range(size):
+        springs = [rng.choice('#.') for _ in range(rng.randint(6, 20))]
+        springs[rng.randrange(len(springs))] = '#'
+
+        groups = [len(run) for run in ''.join(springs).split('.') if run]
+        damaged = ''.join('?' if rng.random() < 0.5 else s for s in springs)
+        lines.append(f"{damaged} {','.join(map(str, groups))}")
+
+    return '\n'.join(lines)
+
+
+def reflection_mismatches(grid):
+
+    """For each possible line of reflection, the number of cells that don't match their mirror image."""
+
+    mismatches = {}
+    height, width = len(grid), len(grid[0])
+    for line in range(1, width):
+        mismatches[('col', line)] = sum(grid[r][line - 1 - i] != grid[r][line + i]
+                                        for r in range(height) for i in range(min(line, width - line)))
+    for line in range(1, height):
+        mismatches[('row', line)] = sum(grid[line - 1 - i][c] != grid[line + i][c]
+                                        for c in range(width) for i in range(min(line, height - line)))
+    return mismatches
+
+
+def day13_pattern(rng):
+
+    """
+    A pattern with exactly one perfect line of reflection and exactly one line that's off by a single smudge.
+    Rows are mirrored round one line and columns round the other, and the smudge goes where only the second
+    line can see it.
+    """
+
+    while True:
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        grid = [[rng.choice('#.') for _ in range(width)] for _ in range(height)]
+
+        rows_above = rng.randint(1, (height - 1) // 2)
+        cols_left = rng.randint(1, width // 2)
+
+        for row in grid:
+            for i in range(cols_left):
+                row[2 * cols_left - 1 - i] = row[i]
+        for i in range(rows_above):
+            grid[2 * rows_above - 1 - i] = list(grid[i])
+
+        r, c = rng.randrange(2 * rows_above, height), rng.randrange(2 * cols_left)
+        grid[r][c] = '#' if grid[r][c] == '.' else '.'
+
+        if rng.random() < 0.5:
+            grid = [list(row) for row in zip(*grid)]
+        if rng.random() < 0.5:
+            grid = grid[::-1]
+        if rng.random() < 0.5:
+            grid = [row[::-1] for row in grid]
+
+        counts = list(reflection_mismatches(grid).values())
+        if counts.count(0) == 1 and counts.count(1) == 1:
+            return grid_text(grid)
+
+
+def day13(rng, size):
+
+    """size patterns of ash and rocks."""
+
+    return '\n\n'.join(day13_pattern(rng) for _ in range(size))
+
+
+def day14(rng, size):
+
+    """A size x size platform of round and cube-shaped rocks."""
+
+    return grid_text([[rng.choices('O#.', weights=[20, 15, 65])[0] for _ in range(size)] for _ in range(size)])
+
+
+def day15(rng, size):
+
+    """size steps of the initialisation sequence, reusing labels so lenses get replaced and removed."""
+
+    labels = set()
+    while len(labels) < max(1, size // 3):
+        labels.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))))
+    labels = sorted(labels)
+
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f"{label}={rng.randint(1, 9)}" if rng.random() < 0.7 else f"{label}-")
+
+    return ','.join(steps)
+
+
+def day16(rng, size):
+
+    """A size x size contraption of mirrors and splitters."""
+
+    return grid_text([[rng.choices('.|-/\\', weights=[85, 4, 4, 4, 3])[0] for _ in range(size)] for _ in range(size)])
+
+
+def day17(rng, size):
+
+    """A size x size map of heat loss."""
+
+    return grid_text([[str(rng.randint(1, 9)) for _ in range(size)] for _ in range(size)])
+
+
+def day18(rng, size):
+
+    """
+    A dig plan round a random blob on a size x size grid. The colours encode a second, much larger plan with
+    the same turns, made by stretching the grid lines apart, so both parts dig out a lagoon with no crossings.
+    """
+
+    # dense, like the real lagoons; part 1 relies on the lagoon being the biggest thing in its bounding box
+    outline = region_outline(simple_region(rng, size + 2, size + 2, fill=0.8))
+    corners = [point for i, point in enumerate(outline)
+               if direction(outline[i - 1], point) != direction(point, outline[(i + 1) % len(outline)])]
+
+    def stretch(coordinates, low, high):
+        positions, total = {}, 0
+        for coordinate in sorted(set(coordinates)):
+            total += rng.randint(low, high)
+            positions[coordinate] = total
+        return positions
+
+    # part 2's hex distances have five digits to fit in
+    widest = (16 ** 5 - 1) // (size + 2)
+
+    small = [stretch([p[0] for p in corners], 2, 6), stretch([p[1] for p in corners], 2, 6)]
+    large = [stretch([p[0] for p in corners], widest // 10, widest), stretch([p[1] for p in corners], widest // 10, widest)]
+
+    def distance(a, b, positions):
+        rows, cols = positions
+        return abs(rows[a[0]] - rows[b[0]]) + abs(cols[a[1]] - cols[b[1]])
+
+    lines = []
+    for a, b in zip(corners, corners[1:] + corners[:1]):
+        heading = direction(a, b)
+        lines.append(f"{'RDLU'['ESWN'.index(heading)]} {distance(a, b, small)} "
+                     f"(#{distance(a, b, large):05x}{'ESWN'.index(heading)})")
+
+    return '\n'.join(lines)
+
+
+def day19_workflows(rng, size):
+
+    """
+    Grow the workflows breadth first from 'in', each rule sending the ratings it matches to a new workflow
+    or straight to A or R. Thresholds fall within the ratings that can still reach them, so no rule is dead.
+    Returns None if the tree stops growing before it reaches size workflows.
+    """
+
+    names = iter(unique_names(rng, size - 1, 3, exclude=['in']))
+    pending = deque([('in', {category: (1, 4000) for category in 'xmas'})])
+    created = 1
+
+    workflows = []
+    while pending:
+        name, ratings = pending.popleft()
+
+        def target(ratings):
+            nonlocal created
+            if created < size and rng.random() < 0.6:
+                created += 1
+                child = next(names)
+                pending.append((child, ratings))
+                return child
+            return rng.choice('AR')
+
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [category for category, (low, high) in ratings.items() if high - low >= 2]
+            if not splittable:
+                break
+
+            category = rng.choice(splittable)
+            low, high = ratings[category]
+            threshold = rng.randint(low + 1, high - 1)
+            if rng.random() < 0.5:
+                matched, rest, condition = (low, threshold - 1), (threshold, high), f"{category}<{threshold}"
+            else:
+                matched, rest, condition = (threshold + 1, high), (low, threshold), f"{category}>{threshold}"
+
+            rules.append(f"{condition}:{target(dict(ratings, **{category: matched}))}")
+            ratings = dict(ratings, **{category: rest})
+
+        rules.append(target(ratings))
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+
+    return workflows if created == size else None
+
+
+def day19(rng, size):
+
+    """size workflows, arranged as a tree under 'in', and size parts to sort."""
+
+    workflows = None
+    while workflows is None:
+        workflows = day19_workflows(rng, size)
+
+    parts = [f"{{x={rng.randint(1, 4000)},m={rng.randint(1, 4000)},a={rng.randint(1, 4000)},s={rng.randint(1, 4000)}}}"
+             for _ in range(size)]
+
+    return '\n'.join(workflows) + '\n\n' + '\n'.join(parts)
+
+
+def day20(rng, size):
+
+    """
+    size 12-bit binary counters of flip-flops, each reset by a conjunction when it reaches a prime. Each
+    counter reports through an inverter to the conjunction nc, which feeds rx, as in the real puzzle input.
+    """
+
+    periods = rng.sample(primes_between(2049, 4096), size)
+    names = unique_names(rng, 14 * size, 2, exclude=['nc', 'rx'])
+    rng.shuffle(names)
+
+    lines = []
+    first_flipflops = []
+    inverters = []
+    for period in periods:
+        flipflops = [names.pop() for _ in range(12)]
+        counter, inverter = names.pop(), names.pop()
+
+        counter_destinations = [flipflops[0]]
+        for bit, flipflop in enumerate(flipflops):
+            destinations = flipflops[bit + 1:bit + 2]
+            if period >> bit & 1:
+                destinations.append(counter)
+            elif bit > 0:
+                counter_destinations.append(flipflop)
+            lines.append(f"%{flipflop} -> {', '.join(destinations)}")
+
+        lines.append(f"&{counter} -> {', '.join(counter_destinations + [inverter])}")
+        lines.append(f"&{inverter} -> nc")
+
+        first_flipflops.append(flipflops[0])
+        inverters.append(inverter)
+
+    lines.append("&nc -> rx")
+    lines.append(f"broadcaster -> {', '.join(first_flipflops)}")
+    rng.shuffle(lines)
+
+    return '\n'.join(lines)
+
+
+def day21(rng, size):
+
+    """A size x size garden (size made odd) with S in the middle, and a clear middle row, column and border."""
+
+    size += 1 - size % 2
+    middle = size // 2
+
+    grid = [['#' if rng.random() < 0.12 else '.' for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        for r, c in [(middle, i), (i, middle), (0, i), (size - 1, i), (i, 0), (i, size - 1)]:
+            grid[r][c] = '.'
+    grid[middle][middle] = 'S'
+
+    return grid_text(grid)
+
+
+def day22(rng, size):
+
+    """size bricks in the air above a 10 x 10 floor, none overlapping."""
+
+    occupied = set()
+    lines = []
+    for _ in range(size):
+        axis = rng.choice([0, 1, 2])
+        length = rng.randint(1, 4)
+
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, max(1, size // 5))]
+        start[axis] = min(start[axis], 9 - length + 1) if axis < 2 else start[axis]
+
+        while True:
+            cubes = [tuple(start[i] + (n if i == axis else 0) for i in range(3)) for n in range(length)]
+            if occupied.isdisjoint(cubes):
+                break
+            start[2] += 1
+
+        occupied.update(cubes)
+        end = cubes[-1]
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+
+    return '\n'.join(lines)
+
+
+def day23(rng, size):
+
+    """
+    A size x size lattice of junctions joined by straight trails, with slopes on each side of every junction
+    pointing right or down, so the slopes make part 1 acyclic. Trails lead in from the start at the top left
+    and out to the end at the bottom right.
+    """
+
+    def spread():
+        positions = [rng.randint(3, 6)]
+        for _ in range(size - 1):
+            positions.append(positions[-1] + rng.randint(3, 10))
+        return positions
+
+    rows, cols = spread(), spread()
+    # at least 4 to the right, so the trail down to the end doesn't start on the last junction's '>'
+    height, width = rows[-1] + rng.randint(3, 6), cols[-1] + rng.randint(4, 6)
+    grid = [['#'] * width for _ in range(height)]
+
+    for r in rows:
+        for c in range(cols[0], cols[-1] + 1):
+            grid[r][c] = '.'
+    for c in cols:
+        for r in range(rows[0], rows[-1] + 1):
+            grid[r][c] = '.'
+
+    for r in rows:
+        for left, right in zip(cols, cols[1:]):
+            grid[r][left + 1] = grid[r][right - 1] = '>'
+    for c in cols:
+        for top, bottom in zip(rows, rows[1:]):
+            grid[top + 1][c] = grid[bottom - 1][c] = 'v'
+
+    # down from the start and across to the first junction, then across from the last junction and down to the end
+    for r in range(rows[0] + 1):
+        grid[r][1] = '.'
+    for c in range(1, cols[0]):
+        grid[rows[0]][c] = '.'
+    grid[rows[0]][cols[0] - 1] = '>'
+
+    for c in range(cols[-1] + 1, width - 1):
+        grid[rows[-1]][c] = '.'
+    for r in range(rows[-1], height):
+        grid[r][width - 2] = '.'
+    grid[rows[-1]][cols[-1] + 1] = '>'
+
+    return grid_text(grid)
+
+
+def day24(rng, size):
+
+    """size hailstones, all of which one rock thrown from an integer position at an integer velocity will hit."""
+
+    # around the middle of part 1's test area, so plenty of the paths cross inside it
+    rock_position = [rng.randint(25 * 10 ** 13, 35 * 10 ** 13) for _ in range(3)]
+    rock_velocity = [rng.randint(-200, 200) for _ in range(3)]
+
+    times = rng.sample(range(10 ** 11, 6 * 10 ** 11), size)
+    lines = []
+    for t in times:
+        velocity = [v + rng.choice([-1, 1]) * rng.randint(1, 300) for v in rock_velocity]
+        position = [p + (rv - v) * t for p, rv, v in zip(rock_position, rock_velocity, velocity)]
+        lines.append(f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}")
+
+    return '\n'.join(lines)
+
+
+def day25(rng, size):
+
+    """size components (at least 20) in two well-connected groups, joined by exactly three wires."""
+
+    size = max(size, 20)
+    names = unique_names(rng, size, 3)
+    rng.shuffle(names)
+    split = rng.randint(size * 2 // 5, size * 3 // 5)
+    groups = [names[:split], names[split:]]
+
+    edges = set()
+    for group in groups:
+        # a ring and a few random matchings make every component's group hard to cut into
+        for a, b in zip(group, group[1:] + group[:1]):
+            edges.add(frozenset([a, b]))
+        degree = dict.fromkeys(group, 2)
+        while min(degree.values()) < 4:
+            shuffled = rng.sample(group, len(group))
+            for a, b in zip(shuffled[::2], shuffled[1::2]):
+                if frozenset([a, b]) not in edges:
+                    edges.add(frozenset([a, b]))
+                    degree[a] += 1
+                    degree[b] += 1
+
+    for a, b in zip(rng.sample(groups[0], 3), rng.sample(groups[1], 3)):
+        edges.add(frozenset([a, b]))
+
+    wiring = {}
+    for edge in sorted(edges, key=sorted):
+        a, b = rng.sample(sorted(edge), 2)
+        wiring.setdefault(a, []).append(b)
+
+    return '\n'.join(f"{name}: {' '.join(others)}" for name, others in wiring.items())
+
+
+# Each generator takes a random.Random and a size, whose meaning depends on the day, and returns a puzzle input
+# as it would be downloaded. Each plants whatever structure the puzzle promises and the solvers rely on.
+GENERATORS = {day: globals()[f'day{day}'] for day in range(1, 26)}
+
+# roughly the size of the real puzzle inputs
+DEFAULT_SIZES = {
+    1: 1000, 2: 100, 3: 140, 4: 200, 5: 30, 6: 4, 7: 1000, 8: 6, 9: 200, 10: 140, 11: 140, 12: 1000, 13: 100,
+    14: 100, 15: 4000, 16: 110, 17: 141, 18: 30, 19: 500, 20: 4, 21: 131, 22: 1400, 23: 6, 24: 300, 25: 1500,
+}
+
+# sizes for benchmarking how each day scales, kept small enough for the slower solvers to get through
+BENCH_SIZES = {
+    1: [1000, 10000, 100000], 2: [100, 1000, 10000], 3: [35, 70, 140], 4: [50, 200, 800], 5: [10, 30, 100],
+    6: [2, 4, 6], 7: [100, 1000, 10000], 8: [1, 2], 9: [200, 2000, 20000], 10: [21, 41, 81], 11: [35, 70, 140],
+    12: [100, 300, 1000], 13: [25, 100, 400], 14: [10, 20, 40], 15: [1000, 4000, 16000], 16: [10, 20, 40],
+    17: [10, 15, 20], 18: [10, 20, 40], 19: [50, 200, 800], 20: [1, 2, 4], 21: [11, 33, 65], 22: [50, 200, 800],
+    23: [2, 3, 4], 24: [5, 10, 20], 25: [50, 200, 800],
+}
+
+
+def generate(day: int, size: int = None, seed: int = 0) -> str:
+    size = DEFAULT_SIZES[day] if size is None else size
+    return GENERATORS[day](random.Random(seed), size)
+
+
+# seeds each size is checked with
+CHECK_SEEDS = range(3)
+
+
+def check(day: int, sizes=None, seeds=CHECK_SEEDS) -> Iterator[Tuple[str, int, int, str]]:
+
+    """
+    Solve each part of a day on its generated inputs, by default at its bench sizes, and yield (solver, size,
+    seed, problem) for each that raises or gives no answer: the generator left out some structure the puzzle
+    promises.
+    """
+
+    # imported here, so that generating an input doesn't import the runner
+    from aoc import runner
+
+    sizes = BENCH_SIZES[day] if sizes is None else sizes
+    names = [name for name in (runner.solver_name(day, part) for part in (1, 2)) if name in runner.solver_names()]
+    for size in sizes:
+        for seed in seeds:
+            raw = generate(day, size, seed)
+            for name in names:
+                try:
+                    answer = runner.run(runner.load_solver(name), raw).answer
+                except Exception as e:
+                    yield name, size, seed, f"{type(e).__name__}: {e}"
+                    continue
+                if answer is None:
+                    yield name, size, seed, "no answer"
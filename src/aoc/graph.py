@@ -0,0 +1,347 @@
+import numpy as np
+
+from array import array
+
+from aoc.budget import CHECK_EVERY, Budget, BudgetExceeded
+
+
+class Graph:
+
+    """
+    A graph on the nodes 0..n-1, stored in compressed sparse row form: node i's neighbours are
+    targets[offsets[i]:offsets[i + 1]], with their edge weights (if any) alongside in weights. An undirected
+    graph stores each edge twice, once from each end.
+
+    The searches below read these arrays through memoryviews, which hand back plain ints a good deal faster
+    than indexing NumPy arrays one element at a time.
+
+    Graphs built from_adjacency remember their original node names: labels[i] is node i's name, and index
+    maps names back to nodes.
+    """
+
+    def __init__(self, n, sources, targets, weights=None, directed=False, labels=None):
+        sources = np.asarray(sources, dtype=np.intp)
+        targets = np.asarray(targets, dtype=np.intp)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.int64)
+
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        self.n = n
+        self.directed = directed
+
+        order = np.argsort(sources, kind='stable')
+        self.offsets = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(sources, minlength=n), out=self.offsets[1:])
+        self.targets = targets[order]
+        self.weights = None if weights is None else weights[order]
+
+        self.labels = labels
+        self.index = None if labels is None else {label: node for node, label in enumerate(labels)}
+
+    @classmethod
+    def from_adjacency(cls, adjacency, directed=False):
+
+        """
+        From the {node: [neighbour, ...]} dicts the parsers build, with nodes of any hashable type, numbered
+        in the order they first appear. Repeated edges are only kept once, as networkx would.
+        """
+
+        index = {}
+        sources, targets = [], []
+        for node, neighbours in adjacency.items():
+            source = index.setdefault(node, len(index))
+            for neighbour in neighbours:
+                sources.append(source)
+                targets.append(index.setdefault(neighbour, len(index)))
+
+        edges = np.array([sources, targets], dtype=np.intp).reshape(2, -1)
+        if not directed:
+            edges = np.sort(edges, axis=0)
+        edges = np.unique(edges, axis=1)
+
+        return cls(len(index), edges[0], edges[1], directed=directed, labels=list(index))
+
+    def __repr__(self):
+        return f"Graph({self.n} nodes, {len(self.targets)} {'edges' if self.directed else 'edge ends'})"
+
+    @property
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def neighbours(self, node):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]].tolist()
+
+    def sources(self) -> np.ndarray:
+
+        """The node each entry of targets belongs to."""
+
+        return np.repeat(np.arange(self.n), self.degrees)
+
+    def subgraph(self, keep):
+
+        """The same nodes, but only the edges between nodes in keep (a boolean array)."""
+
+        sources = self.sources()
+        inside = keep[sources] & keep[self.targets]
+        if not self.directed:
+            # each edge is stored from both ends; keep one copy, and the constructor makes the other
+            inside &= sources <= self.targets
+
+        weights = None if self.weights is None else self.weights[inside]
+        return Graph(self.n, sources[inside], self.targets[inside], weights, self.directed, self.labels)
+
+    def bfs(self, source, cutoff=None) -> np.ndarray:
+
+        """Fewest steps from source to every node, going no further than cutoff if given: -1 for nodes not reached."""
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+
+        distances = array('q', [-1]) * self.n
+        distances[source] = 0
+
+        frontier = [source]
+        distance = 0
+        while frontier and (cutoff is None or distance < cutoff):
+            distance += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                    if distances[neighbour] == -1:
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        return np.frombuffer(distances, dtype=np.int64)
+
+    def connected_components(self) -> np.ndarray:
+
+        """Component number of each node of an undirected graph, numbering components in order of their first node."""
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+
+        components = array('q', [-1]) * self.n
+        component = 0
+        for root in range(self.n):
+            if components[root] != -1:
+                continue
+
+            components[root] = component
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                    if components[neighbour] == -1:
+                        components[neighbour] = component
+                        stack.append(neighbour)
+
+            component += 1
+
+        return np.frombuffer(components, dtype=np.int64)
+
+    def core(self) -> np.ndarray:
+
+        """
+        Boolean array of the nodes of an undirected graph left after repeatedly deleting every node with
+        fewer than two neighbours: those on cycles, and on paths between them.
+        """
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+        degrees = memoryview(self.degrees)
+
+        deleted = bytearray(self.n)
+        queue = [node for node in range(self.n) if degrees[node] < 2]
+        for node in queue:
+            deleted[node] = 1
+
+        for node in queue:
+            for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                if not deleted[neighbour]:
+                    degrees[neighbour] -= 1
+                    if degrees[neighbour] < 2:
+                        deleted[neighbour] = 1
+                        queue.append(neighbour)
+
+        return ~np.frombuffer(deleted, dtype=bool)
+
+    def topological_order(self):
+
+        """The nodes of a directed acyclic graph, each before every node it has an edge to. ValueError if there's a cycle."""
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+        indegrees = memoryview(np.bincount(self.targets, minlength=self.n))
+
+        order = [node for node in range(self.n) if indegrees[node] == 0]
+        for node in order:
+            for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                indegrees[neighbour] -= 1
+                if indegrees[neighbour] == 0:
+                    order.append(neighbour)
+
+        if len(order) < self.n:
+            raise ValueError("graph has a cycle, so it has no topological order")
+
+        return order
+
+    def contract(self, keep):
+
+        """
+        An undirected graph on just the nodes in keep (a boolean array), for graphs whose other nodes all lie
+        along corridors between them, like the paths between a maze's junctions. Each corridor becomes a single
+        edge, weighted by its length: the total weight of its edges. Corridors that dead-end are dropped.
+        The i-th kept node, in order, is node i of the contracted graph.
+        """
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+        weights = None if self.weights is None else memoryview(self.weights)
+        keep = np.asarray(keep, dtype=bool)
+        kept = memoryview(keep)
+
+        sources, ends, lengths = [], [], []
+        for node in np.flatnonzero(keep).tolist():
+            for entry in range(offsets[node], offsets[node + 1]):
+                previous, current = node, targets[entry]
+                length = 1 if weights is None else weights[entry]
+
+                while not kept[current]:
+                    onward = [e for e in range(offsets[current], offsets[current + 1]) if targets[e] != previous]
+                    if len(onward) > 1:
+                        raise ValueError(f"node {current} is neither kept nor on a corridor between kept nodes")
+                    if not onward:
+                        break
+
+                    previous, current = current, targets[onward[0]]
+                    length += 1 if weights is None else weights[onward[0]]
+
+                else:
+                    # every corridor gets walked from both ends: keep the walk from its lower end
+                    if node < current:
+                        sources.append(node)
+                        ends.append(current)
+                        lengths.append(length)
+
+        number = np.cumsum(keep) - 1
+        return Graph(int(keep.sum()), number[sources], number[ends], lengths)
+
+    def longest_path(self, source, target, budget=None):
+
+        """
+        Total weight (or length, unweighted) of the longest path from source to target that doesn't visit any node
+        twice, by trying every such path depth first. None if target can't be reached.
+
+        Each step onto a node counts against budget, if given. If it runs out, the longest path found so far
+        is the BudgetExceeded's partial result.
+        """
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+        weights = None if self.weights is None else memoryview(self.weights)
+        if budget is None:
+            budget = Budget()
+        pending = 0  # steps not yet passed on to the budget
+
+        longest = None
+        on_path = bytearray(self.n)
+        on_path[source] = 1
+
+        # node, next entry of targets to try from it, length of the path so far
+        stack = [(source, offsets[source], 0)]
+        while stack:
+            node, entry, length = stack[-1]
+
+            if node == target or entry == offsets[node + 1]:
+                if node == target and (longest is None or length > longest):
+                    longest = length
+                on_path[node] = 0
+                stack.pop()
+                continue
+
+            stack[-1] = (node, entry + 1, length)
+            neighbour = targets[entry]
+            if not on_path[neighbour]:
+                on_path[neighbour] = 1
+                stack.append((neighbour, offsets[neighbour], length + (1 if weights is None else weights[entry])))
+
+                pending += 1
+                if pending == CHECK_EVERY:
+                    try:
+                        budget.step(pending)
+                    except BudgetExceeded as exceeded:
+                        exceeded.partial = longest
+                        raise
+                    pending = 0
+
+        budget.steps += pending
+        return longest
+
+    def reverse_entries(self) -> np.ndarray:
+
+        """For an undirected graph, the position in targets of the other copy of each edge."""
+
+        sources = self.sources()
+        forward = np.flatnonzero(sources < self.targets)
+        backward = np.flatnonzero(sources > self.targets)
+
+        # both copies of each edge sort to the same place, keyed on (lower node, higher node)
+        forward = forward[np.lexsort((self.targets[forward], sources[forward]))]
+        backward = backward[np.lexsort((sources[backward], self.targets[backward]))]
+
+        reverse = np.arange(len(self.targets))
+        reverse[forward] = backward
+        reverse[backward] = forward
+        return reverse
+
+    def min_cut(self, source, sink, budget=None):
+
+        """
+        The least total weight of edges (each weighing 1, unweighted) that have to be cut to separate source
+        from sink in an undirected graph, found as a maximum flow by breadth-first augmenting paths. Returns
+        (cut weight, boolean array of the nodes left on source's side). Each node the searches visit counts
+        against budget, if given.
+        """
+
+        offsets, targets = memoryview(self.offsets), memoryview(self.targets)
+        reverse = memoryview(self.reverse_entries())
+        capacities = np.ones(len(self.targets), dtype=np.int64) if self.weights is None else self.weights.copy()
+        residual = memoryview(capacities)
+
+        if budget is None:
+            budget = Budget()
+
+        flow = 0
+        while True:
+
+            # the entry of targets used to reach each node, on a shortest path with capacity to spare
+            reached_by = array('q', [-1]) * self.n
+            seen = bytearray(self.n)
+            seen[source] = 1
+
+            queue = [source]
+            for node in queue:
+                for entry in range(offsets[node], offsets[node + 1]):
+                    neighbour = targets[entry]
+                    if residual[entry] > 0 and not seen[neighbour]:
+                        seen[neighbour] = 1
+                        reached_by[neighbour] = entry
+                        queue.append(neighbour)
+                if seen[sink]:
+                    break
+            budget.step(len(queue))
+
+            if not seen[sink]:
+                return flow, np.frombuffer(seen, dtype=bool)
+
+            path = []
+            node = sink
+            while node != source:
+                entry = reached_by[node]
+                path.append(entry)
+                node = targets[reverse[entry]]
+
+            bottleneck = min(residual[entry] for entry in path)
+            for entry in path:
+                residual[entry] -= bottleneck
+                residual[reverse[entry]] += bottleneck
+            flow += bottleneck
@@ -0,0 +1,150 @@
+import numpy as np
+
+from aoc import loader
+
+
+NORTH = (-1, 0)
+SOUTH = (1, 0)
+EAST = (0, 1)
+WEST = (0, -1)
+ORTHOGONAL = [NORTH, EAST, SOUTH, WEST]
+
+
+def as_byte(value) -> int:
+
+    """'#' -> 35; ints are taken to be bytes already."""
+
+    return ord(value) if isinstance(value, str) else value
+
+
+class Grid:
+
+    """
+    A rectangular grid with one byte per cell, stored contiguously row by row. A cell can be addressed by
+    (row, col) or by its flat index, row * cols + col, so stepping to a neighbour is one addition.
+
+    Indexing the grid itself returns plain ints, which is the quick way to visit one cell at a time from Python.
+    `cells` is a (rows, cols) NumPy view of the same memory, for working on every cell at once.
+
+    A tiled grid repeats forever in every direction: any (row, col) is valid, and wraps round onto the grid.
+    """
+
+    def __init__(self, cells, tiled=False):
+        cells = np.asarray(cells)
+        self.rows, self.cols = cells.shape
+        self.tiled = tiled
+
+        self.data = bytearray(self.rows * self.cols)
+        self.cells = np.frombuffer(self.data, dtype=np.uint8).reshape(self.rows, self.cols)
+        self.cells[...] = cells
+
+    @classmethod
+    def from_input(cls, raw, tiled=False):
+        return cls(loader.grid_view(raw), tiled)
+
+    def __getstate__(self):
+        # cells is a view of data, which pickling on its own would turn into a separate copy
+        return {'data': bytes(self.data), 'rows': self.rows, 'cols': self.cols, 'tiled': self.tiled}
+
+    def __setstate__(self, state):
+        cells = np.frombuffer(state['data'], dtype=np.uint8).reshape(state['rows'], state['cols'])
+        self.__init__(cells, state['tiled'])
+
+    def __repr__(self):
+        return f"Grid({self.rows}x{self.cols}{', tiled' if self.tiled else ''})"
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def size(self):
+        return self.rows * self.cols
+
+    def index(self, row, col) -> int:
+        if self.tiled:
+            row, col = row % self.rows, col % self.cols
+        return row * self.cols + col
+
+    def position(self, index):
+        return divmod(index, self.cols)
+
+    def __getitem__(self, key) -> int:
+
+        """grid[index] or grid[row, col]"""
+
+        if isinstance(key, tuple):
+            key = self.index(*key)
+        return self.data[key]
+
+    def in_bounds(self, row, col) -> bool:
+        return self.tiled or (0 <= row < self.rows and 0 <= col < self.cols)
+
+    def step(self, index, direction):
+
+        """Flat index of the cell next to `index` in direction, e.g. grid.step(i, NORTH); None if that's off the edge."""
+
+        row, col = divmod(index, self.cols)
+        row, col = row + direction[0], col + direction[1]
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row * self.cols + col
+        if self.tiled:
+            return row % self.rows * self.cols + col % self.cols
+        return None
+
+    def neighbours(self, index, directions=ORTHOGONAL):
+        neighbours = []
+        for direction in directions:
+            neighbour = self.step(index, direction)
+            if neighbour is not None:
+                neighbours.append(neighbour)
+        return neighbours
+
+    def find(self, value) -> int:
+
+        """Flat index of the first cell holding value, e.g. grid.find('S'). ValueError if there isn't one."""
+
+        return self.data.index(as_byte(value))
+
+    def mask(self, values) -> np.ndarray:
+
+        """Boolean (rows, cols) array of the cells holding any of values, e.g. grid.mask('.S')."""
+
+        return np.isin(self.cells, [as_byte(value) for value in values])
+
+    def shift(self, direction, values=None, fill=0) -> np.ndarray:
+
+        """
+        For every cell, the value of its neighbour in direction, from `values` (a (rows, cols) array,
+        defaulting to the cells themselves): fill for neighbours off the edge, unless the grid is tiled.
+        """
+
+        values = self.cells if values is None else values
+        if self.tiled:
+            return np.roll(values, (-direction[0], -direction[1]), axis=(0, 1))
+
+        shifted = np.full_like(values, fill)
+        target = tuple(slice(max(0, -d), n - max(0, d)) for d, n in zip(direction, self.shape))
+        source = tuple(slice(max(0, d), n + min(0, d)) for d, n in zip(direction, self.shape))
+        shifted[target] = values[source]
+        return shifted
+
+    def neighbour_mask(self, direction) -> np.ndarray:
+
+        """Boolean (rows, cols) array of the cells that have a neighbour in direction."""
+
+        return self.shift(direction, np.ones(self.shape, dtype=bool), fill=False)
+
+    def pairs(self, sources, direction, targets=None):
+
+        """
+        Flat indices (from, to) of every cell in the boolean array sources whose neighbour in direction
+        is in targets (defaulting to sources): the edges of a grid graph, without visiting cells one by one.
+        """
+
+        targets = sources if targets is None else targets
+        starts = np.flatnonzero(sources & self.shift(direction, targets, fill=False))
+
+        rows, cols = np.divmod(starts, self.cols)
+        ends = (rows + direction[0]) % self.rows * self.cols + (cols + direction[1]) % self.cols
+        return starts, ends
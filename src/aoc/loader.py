@@ -0,0 +1,141 @@
+import mmap
+import re
+
+from typing import Iterator
+
+
+NEWLINE = re.compile(rb'\n')
+BLANK_LINE = re.compile(rb'\n\n')
+
+
+def as_buffer(data) -> memoryview:
+
+    """
+    A flat byte view of a puzzle input. Strings (like the embedded examples) have to be encoded, which copies
+    them; anything bytes-like, such as the mmap from runner.read_input, is viewed in place.
+    """
+
+    if isinstance(data, str):
+        data = data.encode()
+    return memoryview(data).cast('B')
+
+
+def content_length(buffer: memoryview) -> int:
+
+    """Length of the input, not counting a trailing newline."""
+
+    if len(buffer) and buffer[-1] == ord('\n'):
+        return len(buffer) - 1
+    return len(buffer)
+
+
+def lines(data) -> Iterator[memoryview]:
+
+    """Each line of the input, without its newline, as a view into the same buffer: bytes(line) copies one out."""
+
+    buffer = as_buffer(data)
+    end = content_length(buffer)
+
+    start = 0
+    for match in NEWLINE.finditer(buffer, 0, end):
+        yield buffer[start:match.start()]
+        start = match.end()
+    yield buffer[start:end]
+
+
+def read_lines(path) -> Iterator[bytes]:
+
+    """Each line of a file, without its newline, read one at a time: for inputs too big to hold, or even map, at once."""
+
+    with open(path, 'rb') as f:
+        for line in f:
+            yield line[:-1] if line.endswith(b'\n') else line
+
+
+def blocks(data) -> Iterator[memoryview]:
+
+    """The input split on blank lines, e.g. day 13's patterns, each a view into the same buffer."""
+
+    buffer = as_buffer(data)
+    end = content_length(buffer)
+
+    start = 0
+    for match in BLANK_LINE.finditer(buffer, 0, end):
+        yield buffer[start:match.start()]
+        start = match.end()
+    yield buffer[start:end]
+
+
+def release(mapped, start, end):
+
+    """
+    Hand the pages of a memory map wholly inside [start, end) back to the kernel. The map stays valid:
+    touching them again reads them back in from the file.
+    """
+
+    first = -(-start // mmap.PAGESIZE) * mmap.PAGESIZE
+    last = end // mmap.PAGESIZE * mmap.PAGESIZE
+    if last > first and hasattr(mmap, 'MADV_DONTNEED'):
+        mapped.madvise(mmap.MADV_DONTNEED, first, last - first)
+
+
+def chunks(data, size) -> Iterator[memoryview]:
+
+    """
+    The input in pieces of about size bytes, each a view into the same buffer, split only at newlines
+    (which are left out), so every line is whole in exactly one piece. For a memory-mapped input, each
+    piece's pages are released once the next is asked for, so only about size bytes of the file are
+    in memory at a time, however big it is.
+    """
+
+    buffer = as_buffer(data)
+    end = content_length(buffer)
+
+    start = 0
+    while True:
+        match = NEWLINE.search(buffer, min(start + size, end), end) if start + size < end else None
+        if match is None:
+            yield buffer[start:end]
+            return
+        yield buffer[start:match.start()]
+        if isinstance(data, mmap.mmap):
+            release(data, start, match.start())
+        start = match.end()
+
+
+def line_bounds(data):
+
+    """Start and end offsets of every line, as two NumPy arrays: line i is data[starts[i]:ends[i]]."""
+
+    import numpy as np
+
+    buffer = as_buffer(data)
+    flat = np.frombuffer(buffer, dtype=np.uint8)[:content_length(buffer)]
+
+    newlines = np.flatnonzero(flat == ord('\n'))
+    starts = np.concatenate([[0], newlines + 1])
+    ends = np.append(newlines, len(flat))
+    return starts, ends
+
+
+def grid_view(data):
+
+    """
+    A rectangular input as a read-only uint8 array of shape (rows, cols), without copying: each row starts
+    cols + 1 bytes after the last, stepping over the newline. Compare against ord('#') and so on.
+    """
+
+    import numpy as np
+
+    buffer = as_buffer(data)
+    length = content_length(buffer)
+
+    first_newline = NEWLINE.search(buffer, 0, length)
+    cols = length if first_newline is None else first_newline.start()
+    rows = (length + 1) // (cols + 1)
+
+    flat = np.frombuffer(buffer, dtype=np.uint8)
+    if rows * (cols + 1) - 1 != length or np.any(flat[cols:length:cols + 1] != ord('\n')):
+        raise ValueError("input is not a rectangular grid: its lines are not all the same length")
+
+    return np.lib.stride_tricks.as_strided(flat, shape=(rows, cols), strides=(cols + 1, 1), writeable=False)
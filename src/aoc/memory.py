@@ -0,0 +1,89 @@
+import contextlib
+import os
+import tracemalloc
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from aoc import runner
+
+
+TOP_SITES = 5
+
+# ignore memory regressions on phases whose peak is smaller than this
+MIN_PEAK = 2**20  # bytes
+
+
+@dataclass
+class AllocationSite:
+    location: str  # 'day11_pt2.py:66'
+    size: int  # bytes
+    count: int
+
+
+@dataclass
+class PhaseMemory:
+    peak: int  # bytes of Python heap traced at the phase's high-water mark
+    retained: int  # bytes still allocated once the phase finished, net of anything it freed
+    top: List[AllocationSite] = field(default_factory=list)
+
+
+class MemoryTracer:
+
+    """
+    Traces Python heap allocations with tracemalloc, phase by phase. The top allocation sites are the lines
+    responsible for the most memory still held when the phase ended; allocations freed within the phase
+    only show up in its peak. Allocations made by C extensions like numpy are counted against the line
+    of Python that called them.
+    """
+
+    def __init__(self, top=TOP_SITES):
+        self.top = top
+        self.phases: Dict[str, PhaseMemory] = {}
+
+    def __enter__(self):
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        yield
+
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+
+        growth = after.compare_to(before, 'lineno')
+
+        top = []
+        for stat in growth:
+            frame = stat.traceback[0]
+            # leave out the tracing's own bookkeeping
+            if frame.filename in (tracemalloc.__file__, __file__) or stat.size_diff <= 0:
+                continue
+            top.append(AllocationSite(f"{Path(frame.filename).name}:{frame.lineno}", stat.size_diff, stat.count_diff))
+            if len(top) == self.top:
+                break
+
+        self.phases[name] = PhaseMemory(peak, current - start, top)
+
+
+def trace_memory(name: str, raw: str) -> Dict[str, PhaseMemory]:
+
+    """Run one solver under tracemalloc. Meant for a fresh process, like bench.measure, since it's much slower."""
+
+    module = runner.load_solver(name)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        with MemoryTracer() as tracer:
+            runner.run(module, raw, trace_phase=tracer.phase)
+
+    return tracer.phases
+
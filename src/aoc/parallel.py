@@ -0,0 +1,126 @@
+import contextlib
+import json
+import multiprocessing
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, List
+
+from aoc import runner
+from aoc.cache import Cache
+
+
+TIMINGS_PATH = runner.SRC_DIR.parent / 'benchmarks' / 'last_run.json'
+
+# imported once by the fork server, so each solver's fresh process doesn't pay for them again
+PRELOAD = ['aoc.runner', 'numpy', 'aoc.grid', 'aoc.graph', 'sympy']
+
+
+@dataclass
+class Outcome:
+    name: str
+    result: runner.RunResult = None
+    error: str = None
+    wall: float = None
+
+    @property
+    def elapsed(self):
+        return self.result.total_time
+
+
+def solve_one(name: str, test: bool = False, cache: bool = False) -> Outcome:
+
+    """
+    Load, parse and solve one day/part, turning any exception into a failed Outcome.
+    The Outcome's wall time covers the whole task, imports and input reading included.
+    """
+
+    start = time.perf_counter()
+    try:
+        module = runner.load_solver(name)
+        raw = runner.embedded_test_input(module) if test else runner.read_input(name)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = runner.run(module, raw, Cache() if cache else None)
+
+        return Outcome(name, result=result, wall=time.perf_counter() - start)
+
+    except Exception as e:
+        return Outcome(name, error=f"{e.__class__.__name__}: {e}", wall=time.perf_counter() - start)
+
+
+def load_timings(path=TIMINGS_PATH) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_timings(outcomes: List[Outcome], path=TIMINGS_PATH):
+
+    """Remember how long each successful solver took, for scheduling the next run."""
+
+    timings = load_timings(path)
+    timings.update({o.name: o.wall for o in outcomes if o.error is None})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+def schedule(names: List[str], timings: Dict[str, float]) -> List[str]:
+
+    """
+    Longest expected run time first, so the slow solvers don't end up starting last and stretching the makespan.
+    Solvers with no recorded timing go to the front, since they could be anything.
+    """
+
+    return sorted(names, key=lambda name: timings.get(name, float('inf')), reverse=True)
+
+
+def pool_context(preload=PRELOAD):
+
+    """Where available, a fork server that imports `preload` once for all the processes it starts; otherwise spawn."""
+
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(preload)
+        return context
+
+    return multiprocessing.get_context('spawn')
+
+
+def run_all(names: List[str], workers=None, test=False, timings=None, cache=False):
+
+    """
+    Run the solvers across a process pool, yielding each Outcome as it finishes.
+
+    At most `workers` solvers are in flight at a time, so if a worker process dies outright only those
+    in-flight solvers are lost: they are reported as failed and the rest carry on in a fresh pool.
+    """
+
+    workers = workers or os.cpu_count()
+    queue = schedule(names, timings or {})
+    context = pool_context()
+
+    while queue:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1) as pool:
+            in_flight = {}
+            try:
+                while queue or in_flight:
+                    while queue and len(in_flight) < workers:
+                        name = queue.pop(0)
+                        in_flight[pool.submit(solve_one, name, test, cache)] = name
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        outcome = future.result()
+                        del in_flight[future]
+                        yield outcome
+
+            except BrokenProcessPool:
+                for name in in_flight.values():
+                    yield Outcome(name, error="worker process died")
@@ -0,0 +1,192 @@
+import cProfile
+import pstats
+import sys
+import threading
+import time
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+from aoc import runner
+
+
+PROFILES_DIR = runner.SRC_DIR.parent / 'profiles'
+SAMPLE_INTERVAL = 0.001  # seconds
+
+# paths through the call graph worth less than this are left out of collapsed stacks built from cProfile
+MIN_STACK_TIME = 1e-6  # seconds
+
+
+@dataclass
+class HotFunction:
+    label: str
+    self_time: float
+    total_time: float
+    calls: int = None  # only known to the deterministic profiler
+
+
+def code_label(filename: str, name: str) -> str:
+
+    """'/root/package/src/day17_pt2.py', 'get_neighbours' -> 'day17_pt2.py:get_neighbours'"""
+
+    return f"{Path(filename).name}:{name}"
+
+
+def write_collapsed(stacks: Counter, path: Path):
+
+    """One line per stack, 'outer;inner;innermost count', as read by flamegraph.pl and speedscope."""
+
+    with open(path, 'w') as f:
+        for stack, count in sorted(stacks.items()):
+            if count > 0:
+                f.write(f"{';'.join(stack)} {count}\n")
+
+
+class DeterministicProfile:
+
+    """cProfile: every call is counted and timed, at some cost to the run time."""
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.disable()
+        self.stats = pstats.Stats(self.profiler).stats
+
+    @staticmethod
+    def label(func) -> str:
+        filename, _, name = func
+        return name if filename == '~' else code_label(filename, name)  # '~' marks builtins
+
+    def hot_functions(self, n=20) -> List[HotFunction]:
+        hot = [HotFunction(self.label(func), tt, ct, nc) for func, (cc, nc, tt, ct, callers) in self.stats.items()]
+        return sorted(hot, key=lambda f: f.self_time, reverse=True)[:n]
+
+    def collapsed_stacks(self) -> Counter:
+
+        """
+        cProfile only records caller -> callee edges, not whole stacks, so the stacks are rebuilt by walking
+        down from the entry points, splitting each function's time between the paths that reach it in
+        proportion to the time spent along each edge. Counts are in microseconds.
+        """
+
+        callees = defaultdict(list)
+        for func, (_, _, _, _, callers) in self.stats.items():
+            for caller, (_, _, _, edge_time) in callers.items():
+                callees[caller].append((func, edge_time))
+
+        stacks = Counter()
+
+        def walk(func, path, share):
+            _, _, tt, ct, _ = self.stats[func]
+            stacks[tuple(self.label(f) for f in path)] += round(tt * share * 1e6)
+
+            for callee, edge_time in callees[func]:
+                callee_time = self.stats[callee][3]
+                if callee in path or callee_time == 0:
+                    continue
+
+                # the part of the callee's time that came through this call site, on this path
+                callee_share = share * edge_time / callee_time
+                if callee_share * callee_time >= MIN_STACK_TIME:
+                    walk(callee, path + [callee], callee_share)
+
+        for func, (_, _, _, _, callers) in self.stats.items():
+            if not callers:
+                walk(func, [func], 1.0)
+
+        return stacks
+
+    def write(self, directory: Path, name: str) -> List[Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stats_path = directory / f'{name}.pstats'
+        self.profiler.dump_stats(stats_path)
+
+        collapsed_path = directory / f'{name}.collapsed'
+        write_collapsed(self.collapsed_stacks(), collapsed_path)
+
+        return [stats_path, collapsed_path]
+
+
+class SamplingProfile:
+
+    """
+    Snapshots the profiled thread's stack from a background thread every `interval` seconds. Much cheaper than
+    cProfile, so the timings stay close to the real thing, but there are no call counts and short-lived
+    functions can be missed entirely.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+        self.stopped = threading.Event()
+
+    def sample(self, thread_id, outer_frames):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+
+            stack = []
+            while frame is not None:
+                stack.append(code_label(frame.f_code.co_filename, frame.f_code.co_qualname))
+                frame = frame.f_back
+
+            # leave out the frames that were already running when profiling started
+            stack = tuple(reversed(stack))[outer_frames:]
+            if stack:
+                self.samples[stack] += 1
+
+    def __enter__(self):
+        outer_frames = 0
+        frame = sys._getframe(1)
+        while frame is not None:
+            outer_frames += 1
+            frame = frame.f_back
+
+        self.sampler = threading.Thread(target=self.sample, args=(threading.get_ident(), outer_frames), daemon=True)
+        self.start = time.perf_counter()
+        self.sampler.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.sampler.join()
+        self.elapsed = time.perf_counter() - self.start
+
+    def hot_functions(self, n=20) -> List[HotFunction]:
+        total_samples = sum(self.samples.values())
+        if total_samples == 0:
+            return []
+
+        # scale by the real elapsed time, since the sampler rarely manages exactly one sample per interval
+        seconds_per_sample = self.elapsed / total_samples
+
+        self_samples = Counter()
+        total = Counter()
+        for stack, count in self.samples.items():
+            self_samples[stack[-1]] += count
+            for label in set(stack):
+                total[label] += count
+
+        hot = [HotFunction(label, self_samples[label] * seconds_per_sample, total[label] * seconds_per_sample) for label in total]
+        return sorted(hot, key=lambda f: f.self_time, reverse=True)[:n]
+
+    def write(self, directory: Path, name: str) -> List[Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        collapsed_path = directory / f'{name}.sampled.collapsed'
+        write_collapsed(self.samples, collapsed_path)
+
+        return [collapsed_path]
+
+
+PROFILERS = {
+    'cprofile': DeterministicProfile,
+    'sample': SamplingProfile,
+}
@@ -0,0 +1,260 @@
+import contextlib
+import importlib
+import mmap
+import os
+import re
+import resource
+import sys
+import time
+
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, List
+
+from aoc.budget import Budget
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+INPUTS_DIR = SRC_DIR.parent / 'inputs'
+
+
+@dataclass
+class RunResult:
+    name: str
+    answer: Any
+    parse_time: float
+    solve_time: float
+    cpu_time: float
+    peak_memory: int  # bytes
+    prepare_time: float = 0.0
+    cached: List[str] = field(default_factory=list)  # phases answered from the cache
+    steps: int = None  # counted by solvers that set BUDGETED
+
+    @property
+    def step_rate(self):
+
+        """Steps per second of solve, for budgeted solvers: comparable across changes to the algorithm, unlike its time."""
+
+        if self.steps is None:
+            return None
+        return self.steps / self.solve_time if self.solve_time else 0.0
+
+    @property
+    def total_time(self):
+        return self.parse_time + self.prepare_time + self.solve_time
+
+    def __repr__(self):
+        return f"{self.name}: {self.answer} (parse {self.parse_time:.3f}s, prepare {self.prepare_time:.3f}s, solve {self.solve_time:.3f}s, peak memory {self.peak_memory / 2**20:.1f} MiB)"
+
+
+def solver_name(day, part) -> str:
+
+    """'day17' or 17, and part 2 -> 'day17_pt2'"""
+
+    day = int(str(day).removeprefix('day'))
+    return f'day{day}_pt{part}'
+
+
+def day_and_part(name: str):
+
+    """'day17_pt2' -> (17, 2)"""
+
+    day, part = re.fullmatch(r'day(\d+)_pt(\d+)', name).groups()
+    return int(day), int(part)
+
+
+def solver_names() -> List[str]:
+
+    """Every solver module in src/, in day and part order."""
+
+    names = [path.stem for path in SRC_DIR.glob('day*_pt*.py')]
+    return sorted(names, key=day_and_part)
+
+
+def load_solver(name: str):
+    return importlib.import_module(name)
+
+
+def input_path(name: str) -> Path:
+    day, _ = day_and_part(name)
+    return INPUTS_DIR / f'day{day}.txt'
+
+
+def map_file(path):
+
+    """A file's contents, memory-mapped read-only. Empty files can't be mapped, so they come back as b''."""
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        # the mapping stays valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_input(name: str, path=None):
+
+    """
+    The puzzle input, as a string; or memory-mapped, for solvers that set MAPPED_INPUT because their parse
+    can take a bytes-like buffer (see aoc.loader) as well as a string.
+    """
+
+    path = input_path(name) if path is None else Path(path)
+    if getattr(load_solver(name), 'MAPPED_INPUT', False):
+        return map_file(path)
+    return path.read_text()
+
+
+def embedded_test_input(module) -> str:
+
+    """The example input embedded in a solver module; days with several examples use the first one."""
+
+    for attr in ['test_input_raw', 'test_input_raw_1']:
+        if hasattr(module, attr):
+            return getattr(module, attr)
+
+    raise ValueError(f"{module.__name__} has no embedded test input")
+
+
+def peak_rss() -> int:
+
+    """Peak resident set size of this process so far, in bytes."""
+
+    # on Linux, ru_maxrss survives fork+exec, so a freshly spawned child would report its parent's peak;
+    # VmHWM belongs to the current address space only
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except FileNotFoundError:
+        pass
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak
+    return peak * 1024
+
+
+def no_tracing(phase):
+    return contextlib.nullcontext()
+
+
+def cached_phase(cache, module, raw, functions, get_input, hits, times, trace_phase=no_tracing):
+
+    """
+    Call the last of `functions` on get_input(), unless the cache already holds the result of running all
+    of them in turn on this input, in which case get_input is never called. Records the phase's time in
+    `times`, and its name in `hits` if it came from the cache.
+    """
+
+    function = functions[-1]
+    start = time.perf_counter()
+
+    if cache is not None:
+        key = cache.phase_key(raw, *functions)
+        try:
+            value = cache.get(key, module)
+            times[function.__name__] = time.perf_counter() - start
+            hits.append(function.__name__)
+            return value
+        except KeyError:
+            pass
+
+    arg = get_input()
+
+    start = time.perf_counter()
+    with trace_phase(function.__name__):
+        value = function(arg)
+    if cache is not None:
+        cache.put(key, value)
+    times[function.__name__] = time.perf_counter() - start
+
+    return value
+
+
+def run(module, raw: str, cache=None, trace_phase=no_tracing, budget=None) -> RunResult:
+
+    """
+    Parse and solve one input, timing each phase separately.
+
+    Solvers can also define prepare(parsed), for expensive work that both parts of a day share; solve then
+    gets prepare's result instead of parse's. With a cache, the answer is looked up first, then the prepared
+    input (which makes parsing unnecessary), then the parsed input.
+
+    trace_phase(name) should return a context manager, which each phase that actually runs is wrapped in.
+
+    Search-heavy solvers set BUDGETED, and solve(parsed, budget) counts its steps against a Budget: this
+    one, whose limits can stop it with BudgetExceeded, or else an unlimited one, just to count them.
+    """
+
+    cpu_start = time.process_time()
+
+    if cache is not None:
+        # imported here, since aoc.cache imports this module
+        from aoc.cache import module_digest
+
+        # the source of the aoc.* modules it uses too, since editing those can change the answer
+        answer_key = cache.key(raw, module_digest(module))
+        try:
+            answer = cache.get(answer_key, module)
+            return RunResult(module.__name__, answer, 0.0, 0.0, time.process_time() - cpu_start, peak_rss(), cached=['answer'])
+        except KeyError:
+            pass
+
+    hits = []
+    times = {}
+    parse = partial(cached_phase, cache, module, raw, [module.parse], lambda: raw, hits, times, trace_phase)
+
+    prepare = getattr(module, 'prepare', None)
+    if prepare is None:
+        parsed = parse()
+    else:
+        parsed = cached_phase(cache, module, raw, [module.parse, prepare], parse, hits, times, trace_phase)
+
+    budgeted = getattr(module, 'BUDGETED', False)
+    if budgeted and budget is None:
+        budget = Budget()
+
+    start = time.perf_counter()
+    with trace_phase('solve'):
+        if budgeted:
+            budget.start()
+            answer = module.solve(parsed, budget)
+        else:
+            answer = module.solve(parsed)
+    solve_time = time.perf_counter() - start
+
+    if cache is not None:
+        cache.put(answer_key, answer)
+
+    cpu_time = time.process_time() - cpu_start
+
+    steps = budget.steps if budgeted else None
+    return RunResult(module.__name__, answer, times.get('parse', 0.0), solve_time, cpu_time, peak_rss(), times.get('prepare', 0.0), hits, steps)
+
+
+def streamable(module) -> bool:
+
+    """Whether a solver can answer from its input's lines read one at a time, which it declares by defining solve_lines(lines)."""
+
+    return hasattr(module, 'solve_lines')
+
+
+def run_streamed(module, lines, trace_phase=no_tracing) -> RunResult:
+
+    """
+    Solve from an iterable of the input's lines with solve_lines, never holding the whole input: there's no
+    parse phase, since the solver parses each line as it reads it, so it's all timed as solve.
+    """
+
+    cpu_start = time.process_time()
+
+    start = time.perf_counter()
+    with trace_phase('solve'):
+        answer = module.solve_lines(lines)
+    solve_time = time.perf_counter() - start
+
+    return RunResult(module.__name__, answer, 0.0, solve_time, time.process_time() - cpu_start, peak_rss())
@@ -0,0 +1,166 @@
+import numpy as np
+
+from collections import deque
+from typing import Iterator, Tuple
+
+from aoc import loader
+
+
+# a cell and its eight neighbours, as (row, col) offsets
+NEIGHBOURHOOD = [(d_row, d_col) for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)]
+
+# numbers of up to this many digits are kept as int64, in which even the sum of a product of two of them for
+# every cell of a schematic that fits in memory can't overflow; longer ones are kept as Python ints
+INT64_DIGITS = 4
+
+
+class Schematic:
+
+    """
+    An engine schematic with each number's ID written into every cell it covers: labels[row, col] is the ID
+    of the number there, counting from 1, or 0 outside any number, and values[id] is the number itself.
+    Every cell that isn't a digit or '.' is a symbol.
+
+    Which numbers a symbol touches is then a look at the nine labels around it, so resolving every symbol
+    takes time in proportion to the cells, however many numbers and symbols there are.
+    """
+
+    def __init__(self, cells):
+        cells = np.asarray(cells, dtype=np.uint8)
+        self.rows, self.cols = cells.shape
+
+        # a column of '.' after each row, so no run of digits carries on into the next row
+        padded = np.full((self.rows, self.cols + 1), ord('.'), dtype=np.uint8)
+        padded[:, :self.cols] = cells
+        flat = padded.ravel()
+
+        # bytes below '0' wrap round to large values
+        digits = flat - ord('0')
+        is_digit = digits < 10
+        starts, ends = np.flatnonzero(np.diff(is_digit, prepend=False, append=False)).reshape(-1, 2).T
+
+        longest = (ends - starts).max(initial=0)
+        values = np.zeros(len(starts) + 1, dtype=np.int64 if longest <= INT64_DIGITS else object)
+        for k in range(longest):
+            longer = np.flatnonzero(ends - starts > k)
+            values[longer + 1] = values[longer + 1] * 10 + digits[starts[longer] + k]
+
+        first_digits = np.zeros(len(flat), dtype=np.int32)
+        first_digits[starts] = 1
+        labels = np.cumsum(first_digits, dtype=np.int32)
+        labels[~is_digit] = 0
+
+        self.labels = labels.reshape(self.rows, self.cols + 1)[:, :self.cols]
+        self.values = values
+        self.positions = np.stack(np.divmod(starts, self.cols + 1), axis=1)  # (row, col) of each number's first digit, by ID - 1
+        self.symbol_mask = ~is_digit.reshape(self.rows, self.cols + 1)[:, :self.cols] & (cells != ord('.'))
+        self.symbols = np.argwhere(self.symbol_mask)
+        self.cells = cells
+
+    @classmethod
+    def from_input(cls, raw):
+        return cls(loader.grid_view(raw))
+
+    def __repr__(self):
+        return f"Schematic({self.rows}x{self.cols}, {len(self.values) - 1} numbers, {len(self.symbols)} symbols)"
+
+    def around_symbols(self) -> np.ndarray:
+
+        """
+        (symbols, 9) array of the IDs of the numbers around each symbol, each at most once, in increasing order
+        at the end of the row, after 0s filling the rest. A number covering several of a symbol's neighbours is
+        only counted once.
+        """
+
+        bordered = np.zeros((self.rows + 2, self.cols + 2), dtype=np.int32)
+        bordered[1:-1, 1:-1] = self.labels
+
+        centres = (self.symbols[:, 0] + 1) * (self.cols + 2) + self.symbols[:, 1] + 1
+        offsets = np.array([d_row * (self.cols + 2) + d_col for d_row, d_col in NEIGHBOURHOOD])
+        around = np.sort(bordered.ravel()[centres[:, np.newaxis] + offsets], axis=1)
+
+        # blank out repeats, then sort again so the blanks come first
+        around[:, 1:][around[:, 1:] == around[:, :-1]] = 0
+        around.sort(axis=1)
+        return around
+
+    def gears(self):
+
+        """The symbols next to exactly two numbers, as three arrays: each one's index in symbols, and the IDs of its numbers."""
+
+        around = self.around_symbols()
+        is_gear = np.flatnonzero(np.count_nonzero(around, axis=1) == 2)
+        return is_gear, around[is_gear, -2], around[is_gear, -1]
+
+    def near_symbols(self) -> np.ndarray:
+
+        """
+        Boolean (rows, cols) array of the cells on or next to a symbol: the symbols dilated by a 3x3 square,
+        which is a dilation by three cells down the columns and then by three along the rows, each two ORs of
+        shifted slices.
+        """
+
+        near = self.symbol_mask.copy()
+        near[1:] |= self.symbol_mask[:-1]
+        near[:-1] |= self.symbol_mask[1:]
+
+        columns = near.copy()
+        near[:, 1:] |= columns[:, :-1]
+        near[:, :-1] |= columns[:, 1:]
+        return near
+
+    def part_numbers(self) -> np.ndarray:
+
+        """Boolean array over IDs: True for the numbers with a digit near a symbol (see near_symbols)."""
+
+        is_part = np.zeros(len(self.values), dtype=bool)
+        is_part[self.labels[self.near_symbols()]] = True
+        is_part[0] = False
+        return is_part
+
+
+def middle_row_events(window: np.ndarray, row: int) -> Iterator[Tuple[str, int, int, int]]:
+
+    """The part numbers and gears in the middle of a window of three rows, the middle being `row` of the whole schematic."""
+
+    schematic = Schematic(window)
+
+    is_part = schematic.part_numbers()[1:] & (schematic.positions[:, 0] == 1)
+    for col, number in zip(schematic.positions[is_part, 1].tolist(), schematic.values[1:][is_part].tolist()):
+        yield 'part', row, col, number
+
+    gears, first, second = schematic.gears()
+    in_middle = schematic.symbols[gears, 0] == 1
+    ratios = schematic.values[first[in_middle]] * schematic.values[second[in_middle]]
+    for col, ratio in zip(schematic.symbols[gears[in_middle], 1].tolist(), ratios.tolist()):
+        yield 'gear', row, col, ratio
+
+
+def stream(rows) -> Iterator[Tuple[str, int, int, int]]:
+
+    """
+    The part numbers and gears of a schematic read one row at a time, as ('part', row, col, number) and
+    ('gear', row, col, ratio), for schematics with too many rows to hold. Only three rows are kept: a row's
+    numbers and gears are settled, and yielded, as soon as the row after it has been read, since nothing
+    further down can touch them. Rows are bytes-like, without their newlines, and must all be the same width.
+    """
+
+    window = deque(maxlen=3)
+    blank = None
+    row = -1
+    for row, cells in enumerate(rows):
+        cells = np.frombuffer(cells, dtype=np.uint8)
+        if blank is None:
+            # as if there were a row of '.' above the first, and below the last
+            blank = np.full(len(cells), ord('.'), dtype=np.uint8)
+            window.append(blank)
+        elif len(cells) != len(blank):
+            raise ValueError(f"schematic is not rectangular: row {row} is {len(cells)} wide, not {len(blank)}")
+
+        window.append(cells)
+        if len(window) == 3:
+            yield from middle_row_events(np.stack(window), row - 1)
+
+    if blank is not None:
+        window.append(blank)
+        yield from middle_row_events(np.stack(window), row)
@@ -0,0 +1,178 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Optional
+
+from aoc import loader
+
+
+# the pile is parsed this many bytes at a time, which bounds the memory parsing takes
+CHUNK_BYTES = 1 << 23
+
+# how many bits are set in each byte, for NumPy before 2.0, which has no bitwise_count
+BYTE_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+@dataclass
+class Pile:
+
+    """
+    Every card's numbers as bitmasks, a row of uint64 words per card: bit n of winning[card] is set if n is
+    one of its winning numbers, and likewise for revealed. A card's matching numbers are then the bits set in
+    the AND of its two rows, so counting them for the whole pile is one AND and a popcount.
+    """
+
+    ids: np.ndarray
+    winning: np.ndarray
+    revealed: np.ndarray
+
+    def matches(self) -> np.ndarray:
+
+        """How many of each card's revealed numbers are among its winning numbers."""
+
+        both = self.winning & self.revealed
+        if hasattr(np, 'bitwise_count'):
+            return np.bitwise_count(both).sum(axis=1, dtype=np.int64)
+        return BYTE_POPCOUNT[both.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+def read_fields(grid, starts, ends) -> Optional[np.ndarray]:
+
+    """
+    The numbers in columns starts[i]:ends[i] of every line of a grid, as a (lines, fields) array, every field
+    read at once; None unless each field of each line is spaces then at least one digit.
+    """
+
+    # right-aligned, so a narrower field's leftmost columns are outside it, and read as spaces
+    width = int((ends - starts).max(initial=1))
+    cols = ends[:, np.newaxis] - np.arange(width, 0, -1)
+    inside = cols >= starts[:, np.newaxis]
+    cells = grid[:, np.where(inside, cols, 0)]
+    if not inside.all():
+        cells = np.where(inside, cells, np.uint8(ord(' ')))
+
+    # bytes below '0' wrap round to large values
+    digits = cells - np.uint8(ord('0'))
+    is_digit = digits < 10
+    if not (is_digit[..., -1].all() and (is_digit | (cells == ord(' '))).all()):
+        return None
+    if (is_digit[..., :-1] & ~is_digit[..., 1:]).any():
+        return None
+
+    digits *= is_digit
+    values = digits[..., 0].astype(np.int64)
+    for k in range(1, width):
+        values = values * 10 + digits[..., k]
+    return values
+
+
+def parse_fields(raw) -> Optional[Pile]:
+
+    """
+    The cards, parsed a field at a time, for piles laid out in fixed columns as the puzzle's are: every line
+    the same length, with its ':' and '|' in the same places and its numbers right-aligned in the same
+    fields. A field is then a slice of columns of the input as a grid, and is read for every card at once.
+    None if the pile isn't laid out like that.
+    """
+
+    try:
+        grid = loader.grid_view(raw)
+    except ValueError:
+        return None
+    colon, bar = (np.flatnonzero(grid[0] == ord(mark)) for mark in ':|')
+    if len(colon) != 1 or len(bar) != 1 or bar[0] < colon[0]:
+        return None
+    colon, bar = colon[0], bar[0]
+    if np.count_nonzero(grid == ord(':')) != len(grid) or np.count_nonzero(grid == ord('|')) != len(grid):
+        return None
+    if np.any(grid[:, colon] != ord(':')) or np.any(grid[:, bar] != ord('|')):
+        return None
+
+    # fields are runs of columns with a digit in some line, the first of them the card's ID
+    has_digit = np.concatenate([[False], ((grid - ord('0')) < 10).any(axis=0), [False]])
+    field_starts, field_ends = np.flatnonzero(np.diff(has_digit)).reshape(-1, 2).T
+    if np.count_nonzero(field_ends <= colon) != 1 or field_ends[0] != colon:
+        return None
+
+    ids = read_fields(grid, field_starts[:1], field_ends[:1])
+    numbers = read_fields(grid, field_starts[1:], field_ends[1:])
+    if ids is None or numbers is None:
+        return None
+
+    # every number's own bitmask, so a card's is a lookup per field and an OR across them
+    top = np.arange(numbers.max(initial=0) + 1)
+    one_hot = np.zeros((len(top), len(top) // 64 + 1), dtype=np.uint64)
+    one_hot[top, top >> 6] = np.left_shift(np.uint64(1), (top & 63).astype(np.uint64))
+
+    revealed = field_starts[1:] > bar
+    winning_masks, revealed_masks = (np.bitwise_or.reduce(one_hot[numbers[:, revealed == side]], axis=1) for side in (False, True))
+
+    return Pile(ids[:, 0], winning_masks, revealed_masks)
+
+
+def parse_runs(raw) -> Pile:
+
+    """
+    The cards, however they're laid out, parsed a column at a time: every number in the input is a run of
+    digits, a card's ID if a colon follows it, and otherwise one of the numbers of the last card to start
+    before it, a winning one if it comes before that card's '|' and a revealed one if after.
+    """
+
+    flat = np.frombuffer(loader.as_buffer(raw), dtype=np.uint8)
+
+    # bytes below '0' wrap round to large values; runs of digits start and end where this changes
+    digits = flat - ord('0')
+    is_digit = digits < 10
+    starts, ends = np.flatnonzero(np.diff(is_digit, prepend=False, append=False)).reshape(-1, 2).T
+
+    # only card IDs run to more than a few digits, so each pass narrows down to the runs still going
+    lengths = ends - starts
+    values = digits[starts].astype(np.int64)
+    longer = np.flatnonzero(lengths > 1)
+    for k in range(1, lengths.max(initial=0)):
+        longer = longer[lengths[longer] > k]
+        values[longer] = values[longer] * 10 + digits[starts[longer] + k]
+
+    is_id = flat[np.minimum(ends, len(flat) - 1)] == ord(':')
+    card_of = np.cumsum(is_id) - 1
+    bars = np.flatnonzero(flat == ord('|'))
+    card_starts = starts[is_id]
+    if len(bars) != len(card_starts) or np.any(bars[:-1] >= card_starts[1:]) or np.any(bars < card_starts):
+        raise ValueError("every card needs one '|' between its winning and revealed numbers")
+
+    is_number = ~is_id
+    numbers, card_of = values[is_number], card_of[is_number]
+    if np.any(card_of < 0):
+        raise ValueError("numbers before the first card")
+    side = (starts[is_number] > bars[card_of]).astype(np.intp)
+
+    masks = np.zeros((2, len(card_starts), int(numbers.max(initial=0)) // 64 + 1), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (numbers & 63).astype(np.uint64))
+    np.bitwise_or.at(masks, (side, card_of, numbers >> 6), bits)
+
+    return Pile(values[is_id], masks[0], masks[1])
+
+
+def parse_cards(raw) -> Pile:
+
+    """The cards, parsed by fields where they're laid out in fixed columns, and by runs of digits otherwise."""
+
+    pile = parse_fields(raw)
+    return parse_runs(raw) if pile is None else pile
+
+
+def parse_pile(raw) -> Pile:
+
+    """The Pile, parsing CHUNK_BYTES of the input at a time, which bounds the memory parsing takes."""
+
+    piles = [parse_cards(chunk) for chunk in loader.chunks(raw, CHUNK_BYTES)]
+
+    # chunks with bigger numbers have more words per card
+    words = max(pile.winning.shape[1] for pile in piles)
+
+    def widened(masks):
+        return np.pad(masks, ((0, 0), (0, words - masks.shape[1])))
+
+    return Pile(np.concatenate([pile.ids for pile in piles]),
+                np.concatenate([widened(pile.winning) for pile in piles]),
+                np.concatenate([widened(pile.revealed) for pile in piles]))
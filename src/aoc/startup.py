@@ -0,0 +1,84 @@
+import os
+import re
+import subprocess
+import sys
+
+from dataclasses import dataclass
+from typing import List
+
+from aoc import runner
+
+
+# importing a solver should cost little more than numpy does
+STARTUP_BUDGET = 0.150  # seconds
+
+IMPORT_TIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_time: float  # seconds
+    cumulative: float  # seconds
+    depth: int  # 0 for the solver itself, 1 for what it imports directly, and so on
+
+
+@dataclass
+class ImportProfile:
+    name: str
+    imports: List[ImportTime]
+
+    @property
+    def total(self) -> float:
+        return self.imports[-1].cumulative
+
+    def heaviest(self, n=5) -> List[ImportTime]:
+
+        """The solver's direct imports that took longest, counting everything they imported in turn."""
+
+        direct = [entry for entry in self.imports if entry.depth == 1]
+        return sorted(direct, key=lambda entry: entry.cumulative, reverse=True)[:n]
+
+
+def parse_import_times(stderr: str) -> List[ImportTime]:
+
+    """Parse the report written by `python -X importtime`, which lists each module after everything it imported."""
+
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append(ImportTime(module, int(self_us) / 1e6, int(cumulative_us) / 1e6, len(indent) // 2))
+
+    return imports
+
+
+def profile_imports(name: str, repeats=3) -> ImportProfile:
+
+    """
+    Import a solver in a fresh interpreter under -X importtime, keeping the fastest of a few attempts.
+    Only the solver's own imports are counted, not the interpreter's startup.
+    """
+
+    env = dict(os.environ, PYTHONPATH=str(runner.SRC_DIR))
+
+    best = None
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {name}'],
+            env=env, cwd=runner.SRC_DIR.parent, capture_output=True, text=True, check=True)
+
+        imports = parse_import_times(completed.stderr)
+
+        # the solver is the last entry, straight after everything it imported;
+        # anything before that belongs to the interpreter's own startup
+        first = len(imports) - 1
+        while first > 0 and imports[first - 1].depth > 0:
+            first -= 1
+        profile = ImportProfile(name, imports[first:])
+
+        if best is None or profile.total < best.total:
+            best = profile
+
+    return best
@@ -0,0 +1,153 @@
+import atexit
+import json
+import os
+import pickle
+import sys
+import time
+
+from pathlib import Path
+from typing import Dict, Iterator
+
+
+# levels, least verbose first
+OFF = 0
+INFO = 1  # a handful of events per run: what was found, what was chosen
+DEBUG = 2  # events from inside the hot loops: one per game, card, cycle and so on
+
+LEVELS = {'off': OFF, 'info': INFO, 'debug': DEBUG}
+
+# the level and file scripts trace at, run outside `aoc run --trace`; files are appended to, since
+# every process that imports this module (each worker of a pool, say) opens its own
+LEVEL_VARIABLE = 'AOC_TRACE'
+FILE_VARIABLE = 'AOC_TRACE_FILE'
+
+
+class TextSink:
+
+    """Events as readable lines, e.g. `[   0.0012] game  number=3 possible=False`: the only place fields get formatted."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, t, name, fields):
+        details = ' '.join(f"{key}={value}" for key, value in fields.items())
+        print(f"[{t:9.4f}] {name}  {details}", file=self.stream)
+
+    def close(self):
+        if self.stream is not sys.stderr:
+            self.stream.close()
+
+
+class JsonLinesSink(TextSink):
+
+    """Events as JSON objects, one per line, {"t": ..., "event": ..., **fields}. Fields JSON can't carry become their str()."""
+
+    def write(self, t, name, fields):
+        print(json.dumps({'t': t, 'event': name, **fields}, default=str), file=self.stream)
+
+
+class BinarySink(TextSink):
+
+    """Events pickled one after another as (t, name, fields): cheaper to write than JSON, and fields keep their types."""
+
+    def write(self, t, name, fields):
+        pickle.dump((t, name, fields), self.stream, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+level = OFF
+sink = None
+start = time.perf_counter()
+
+
+def enabled(at_level) -> bool:
+
+    """
+    Whether events at this level are wanted. Hot loops should check once, before they start, and guard
+    each event with the result, so a disabled trace costs one test of a local variable per iteration:
+
+        debug = trace.enabled(trace.DEBUG)
+        for card in cards:
+            ...
+            if debug:
+                trace.event('card', id=card.id, matches=matches)
+    """
+
+    return level >= at_level
+
+
+def event(name, **fields):
+
+    """Record one event, whatever the level: see enabled(). Fields are only formatted, if at all, by the sink."""
+
+    sink.write(time.perf_counter() - start, name, fields)
+
+
+def info(name, **fields):
+    if level >= INFO:
+        event(name, **fields)
+
+
+def debug(name, **fields):
+    if level >= DEBUG:
+        event(name, **fields)
+
+
+def open_sink(path=None, mode='w'):
+
+    """Readable lines on stderr without a path; otherwise JSON Lines for a .jsonl file, and binary for anything else."""
+
+    if path is None:
+        return TextSink(sys.stderr)
+    if Path(path).suffix == '.jsonl':
+        return JsonLinesSink(open(path, mode))
+    return BinarySink(open(path, mode + 'b'))
+
+
+def configure(new_level, path=None, mode='w'):
+
+    """Start tracing at new_level (a level or its name), to path if given, closing any trace already open."""
+
+    global level, sink, start
+
+    close()
+    level = LEVELS[new_level] if isinstance(new_level, str) else new_level
+    if level > OFF:
+        sink = open_sink(path, mode)
+    start = time.perf_counter()
+
+
+def close():
+    global level, sink
+
+    if sink is not None:
+        sink.close()
+    level, sink = OFF, None
+
+
+def configure_from_environment():
+    name = os.environ.get(LEVEL_VARIABLE)
+    if name:
+        configure(name.lower(), os.environ.get(FILE_VARIABLE), mode='a')
+
+
+def read_events(path) -> Iterator[Dict]:
+
+    """The events in a trace file written as JSON Lines or binary, as {"t": ..., "event": ..., **fields} dicts."""
+
+    if Path(path).suffix == '.jsonl':
+        with open(path) as f:
+            for line in f:
+                yield json.loads(line)
+        return
+
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                t, name, fields = pickle.load(f)
+            except EOFError:
+                return
+            yield {'t': t, 'event': name, **fields}
+
+
+atexit.register(close)
+configure_from_environment()
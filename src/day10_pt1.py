@@ -1,24 +1,13 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-
+import numpy as np
 from dataclasses import dataclass
-from typing import Dict, List
-
 
-@dataclass
-class Tile:
-    type: str 
-    i: int 
-    j: int 
-    connections = None
+from aoc import trace
+from aoc.graph import Graph
+from aoc.grid import Grid, NORTH, SOUTH, EAST, WEST
 
-    def __repr__(self):
-        return f"{self.type} at ({self.i}, {self.j})"
 
-NORTH = (-1, 0)
-SOUTH = (1, 0)
-EAST = (0, 1)
-WEST = (0, -1)
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
 
 valid_moves = {
 
@@ -80,108 +69,72 @@ valid_moves = {
 
 @dataclass
 class Sketch:
-    tiles: Dict
-    start: Tile = None
+    grid: Grid
+    start: int = None  # flat index into grid, like every other tile
     graph = None
     connections = None
 
     def __post_init__(self):
-        self.start = [tile for tile in self.tiles.values() if tile.type == "S"][0]
+        self.start = self.grid.find("S")
         self.get_connections()
         self.create_graph()
 
     def get_connections(self):
-        connections = []
-        for tile in self.tiles.values():
-            if tile.type == ".":
-                continue
-
-            connected_tiles = []
-            for direction in [NORTH, SOUTH, EAST, WEST]:
-                candidate_tile_coords = (tile.i + direction[0], tile.j + direction[1])  
-                if candidate_tile_coords not in self.tiles:
-                    continue
-                candidate_tile = self.tiles[candidate_tile_coords]
-                if self.is_valid_connection(tile, candidate_tile, direction):
-                    #connected_tiles.append(candidate_tile) 
-                    connections.append((tile, candidate_tile))
 
-        # handle connections to the start tile
-        adjacent_to_start = [tile 
-                            for tile in self.tiles.values() 
-                            if self.are_adjacent( (tile.i, tile.j), (self.start.i, self.start.j) )]
-
-        # .....something is wrong here
-        connected_to_start = []
-        for tile in adjacent_to_start:
-            for direction in [NORTH, SOUTH, EAST, WEST]:
-                if tile.i + direction[0] == self.start.i and tile.j + direction[1] == self.start.j:
-                    is_valid = self.is_valid_connection(tile, self.start, direction)
-                    if is_valid:
-                        connected_to_start.append(tile)
-                        print(f"tile: {tile}, direction: {direction}, is_valid: {is_valid}")
-
-        print(f"Start: {self.start}")
-        print(f"adjacent_to_start: {adjacent_to_start}")
-        print(f"connected_to_start: {connected_to_start}")
-
-        self.connections = connections
-
-    @staticmethod
-    def is_valid_connection(from_tile, to_tile, direction):
-        valid_directions = valid_moves.get((from_tile.type, to_tile.type), [])
-        return direction in valid_directions
-
-    @staticmethod
-    def are_adjacent(coord1, coord2):
-        x1, y1 = coord1
-        x2, y2 = coord2
-        return (x1 == x2 and abs(y1 - y2) == 1) or (y1 == y2 and abs(x1 - x2) == 1)
+        """
+        (tile, connected_tile) pairs of flat indices, found a whole tile type and direction at a time,
+        as the two rows of an array: each connection once, lower tile first.
+        """
 
-    def create_graph(self):
+        masks = {tile_type: self.grid.mask(tile_type) for pair in valid_moves for tile_type in pair}
 
-        G = nx.Graph()
-        #print(f"sketch.connections: {self.connections}")
-        for tile, connected_tile in self.connections:
-            tile_coords = (tile.i, tile.j)
-            connected_tile_coords = (connected_tile.i, connected_tile.j)
-            G.add_edge(tile_coords, connected_tile_coords)
+        tiles, connected_tiles = [], []
+        for (from_type, to_type), moves in valid_moves.items():
+            for direction in moves:
+                from_tiles, to_tiles = self.grid.pairs(masks[from_type], direction, masks[to_type])
+                tiles.append(from_tiles)
+                connected_tiles.append(to_tiles)
 
-        cycles = nx.cycle_basis(G)
+        tiles, connected_tiles = np.concatenate(tiles), np.concatenate(connected_tiles)
 
-        nodes_in_cycles = set()
-        for cycle in cycles:
-            nodes_in_cycles.update(cycle)
+        # handle connections to the start tile
+        if trace.enabled(trace.INFO):
+            adjacent_to_start = self.grid.neighbours(self.start)
+            connected_to_start = tiles[connected_tiles == self.start].tolist()
+            trace.event('start', tile=self.describe(self.start),
+                        adjacent=[self.describe(tile) for tile in adjacent_to_start],
+                        connected=[self.describe(tile) for tile in connected_to_start])
 
-        nodes_to_remove = [node for node in G if node not in nodes_in_cycles]
-        for node in nodes_to_remove:
-            G.remove_node(node)
+        # a connection between two pipes is found from both ends
+        connections = np.sort(np.stack([tiles, connected_tiles]), axis=0)
+        self.connections = np.unique(connections, axis=1)
 
-        self.graph = G
+    def describe(self, tile):
+        return f"{chr(self.grid[tile])} at {self.grid.position(tile)}"
 
+    def create_graph(self):
 
-    def get_furthest_distance(self):
-        start = (self.start.i, self.start.j)
-        path_lengths = nx.single_source_shortest_path_length(self.graph, start)
-        furthest_distance = max(path_lengths.values())
-        
-        return furthest_distance
+        graph = Graph(self.grid.size, *self.connections)
+
+        # each pipe connects to two others at most, so pruning away dead ends leaves just the loops
+        self.graph = graph.subgraph(graph.core())
 
 
+    def get_furthest_distance(self):
+        return int(self.graph.bfs(self.start).max())
 
-def parse_sketch(raw: str):  
 
-    coords = {}
-    for i, row in enumerate(raw.split('\n')):
-        for j, tile_type in enumerate(row):
-            coords[(i,j)] = (Tile(tile_type, i, j))
 
-    sketch = Sketch(coords)
+def parse_sketch(raw):
+    return Sketch(Grid.from_input(raw))
 
-    return sketch
 
+def parse(raw):
+    return parse_sketch(raw)
 
 
+def solve(sketch):
+    return sketch.get_furthest_distance()
 
 
 test_input_raw_1 = """.....
@@ -189,28 +142,29 @@ test_input_raw_1 = """.....
 .|.|.
 .L-J.
 ....."""
-test_sketch_1 = parse_sketch(test_input_raw_1)  # 4
-# nx.draw(test_sketch_1.graph, with_labels=True, node_color='lightblue', edge_color='gray')
-# plt.show()
-
 
 test_input_raw_2 = """..F7.
 .FJ|.
 SJ.L7
 |F--J
 LJ..."""
-test_sketch_2 = parse_sketch(test_input_raw_2) # 8
-# nx.draw(test_sketch_2.graph, with_labels=True, node_color='lightblue', edge_color='gray')
-# plt.show()
 
-assert test_sketch_1.get_furthest_distance() == 4
-assert test_sketch_2.get_furthest_distance() == 8
 
+if __name__ == '__main__':
+    # import matplotlib.pyplot as plt
+
+    test_sketch_1 = parse(test_input_raw_1)  # 4
+    # nx.draw(test_sketch_1.graph, with_labels=True, node_color='lightblue', edge_color='gray')
+    # plt.show()
 
+    test_sketch_2 = parse(test_input_raw_2) # 8
+    # nx.draw(test_sketch_2.graph, with_labels=True, node_color='lightblue', edge_color='gray')
+    # plt.show()
 
-with open("inputs/day10.txt") as f:
-    input_raw = f.read()
-    sketch = parse_sketch(input_raw)
+    assert solve(test_sketch_1) == 4
+    assert solve(test_sketch_2) == 8
 
-print(f"Result: {sketch.get_furthest_distance()}")
+    with open("inputs/day10.txt") as f:
+        sketch = parse(f.read())
 
+    print(f"Result: {solve(sketch)}")
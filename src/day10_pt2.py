@@ -1,24 +1,12 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-
+import numpy as np
 from dataclasses import dataclass
-from typing import Dict, List
-
 
-@dataclass
-class Tile:
-    type: str 
-    i: int 
-    j: int 
-    connections = None
+from aoc.graph import Graph
+from aoc.grid import Grid, NORTH, SOUTH, EAST, WEST
 
-    def __repr__(self):
-        return f"{self.type} at ({self.i}, {self.j})"
 
-NORTH = (-1, 0)
-SOUTH = (1, 0)
-EAST = (0, 1)
-WEST = (0, -1)
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
 
 valid_moves = {
 
@@ -80,109 +68,85 @@ valid_moves = {
 
 @dataclass
 class Sketch:
-    tiles: Dict
-    start: Tile = None
+    grid: Grid
+    start: int = None  # flat index into grid, like every other tile
     graph = None
     connections = None
     loop = None
 
     def __post_init__(self):
-        self.start = [tile for tile in self.tiles.values() if tile.type == "S"][0]
+        self.start = self.grid.find("S")
         self.get_connections()
         self.create_graph()
 
     def get_connections(self):
-        connections = []
-        for tile in self.tiles.values():
-            if tile.type == ".":
-                continue
-
-            connected_tiles = []
-            for direction in [NORTH, SOUTH, EAST, WEST]:
-                candidate_tile_coords = (tile.i + direction[0], tile.j + direction[1])  
-                if candidate_tile_coords not in self.tiles:
-                    continue
-                candidate_tile = self.tiles[candidate_tile_coords]
-                if self.is_valid_connection(tile, candidate_tile, direction):
-                    #connected_tiles.append(candidate_tile) 
-                    connections.append((tile, candidate_tile))
-
-        # handle connections to the start tile
-        adjacent_to_start = [tile 
-                            for tile in self.tiles.values() 
-                            if self.are_adjacent( (tile.i, tile.j), (self.start.i, self.start.j) )]
-
-        # .....something is wrong here
-        connected_to_start = []
-        for tile in adjacent_to_start:
-            for direction in [NORTH, SOUTH, EAST, WEST]:
-                if tile.i + direction[0] == self.start.i and tile.j + direction[1] == self.start.j:
-                    is_valid = self.is_valid_connection(tile, self.start, direction)
-                    if is_valid:
-                        connected_to_start.append(tile)
-                        #print(f"tile: {tile}, direction: {direction}, is_valid: {is_valid}")
-
-        # print(f"Start: {self.start}")
-        # print(f"adjacent_to_start: {adjacent_to_start}")
-        # print(f"connected_to_start: {connected_to_start}")
-
-        self.connections = connections
-
-    @staticmethod
-    def is_valid_connection(from_tile, to_tile, direction):
-        valid_directions = valid_moves.get((from_tile.type, to_tile.type), [])
-        return direction in valid_directions
-
-    @staticmethod
-    def are_adjacent(coord1, coord2):
-        x1, y1 = coord1
-        x2, y2 = coord2
-        return (x1 == x2 and abs(y1 - y2) == 1) or (y1 == y2 and abs(x1 - x2) == 1)
 
-    def create_graph(self):
+        """
+        (tile, connected_tile) pairs of flat indices, found a whole tile type and direction at a time,
+        as the two rows of an array: each connection once, lower tile first.
+        """
+
+        masks = {tile_type: self.grid.mask(tile_type) for pair in valid_moves for tile_type in pair}
 
-        G = nx.Graph()
-        #print(f"sketch.connections: {self.connections}")
-        for tile, connected_tile in self.connections:
-            tile_coords = (tile.i, tile.j)
-            connected_tile_coords = (connected_tile.i, connected_tile.j)
-            G.add_edge(tile_coords, connected_tile_coords)
+        tiles, connected_tiles = [], []
+        for (from_type, to_type), moves in valid_moves.items():
+            for direction in moves:
+                from_tiles, to_tiles = self.grid.pairs(masks[from_type], direction, masks[to_type])
+                tiles.append(from_tiles)
+                connected_tiles.append(to_tiles)
 
-        cycles = nx.cycle_basis(G)
-        self.loop = cycles[0]
+        tiles, connected_tiles = np.concatenate(tiles), np.concatenate(connected_tiles)
 
-        nodes_in_cycles = set()
-        for cycle in cycles:
-            nodes_in_cycles.update(cycle)
+        # a connection between two pipes is found from both ends
+        connections = np.sort(np.stack([tiles, connected_tiles]), axis=0)
+        self.connections = np.unique(connections, axis=1)
 
-        nodes_to_remove = [node for node in G if node not in nodes_in_cycles]
-        for node in nodes_to_remove:
-            G.remove_node(node)
+    def describe(self, tile):
+        return f"{chr(self.grid[tile])} at {self.grid.position(tile)}"
 
-        self.graph = G
+    def create_graph(self):
+
+        graph = Graph(self.grid.size, *self.connections)
+
+        # each pipe connects to two others at most, so pruning away dead ends leaves just the loops
+        self.graph = graph.subgraph(graph.core())
+
+        # the loop is the one through the start
+        self.loop = np.flatnonzero(self.graph.bfs(self.start) >= 0)
 
 
     def get_furthest_distance(self):
-        start = (self.start.i, self.start.j)
-        path_lengths = nx.single_source_shortest_path_length(self.graph, start)
-        furthest_distance = max(path_lengths.values())
-        
-        return furthest_distance
+        return int(self.graph.bfs(self.start).max())
+
 
 
+def parse_sketch(raw):
+    return Sketch(Grid.from_input(raw))
 
-def parse_sketch(raw: str):  
 
-    coords = {}
-    for i, row in enumerate(raw.split('\n')):
-        for j, tile_type in enumerate(row):
-            coords[(i,j)] = (Tile(tile_type, i, j))
+def count_cells_inside_loop(sketch):
 
-    sketch = Sketch(coords)
+    """
+    Scan each row from the left, crossing into or out of the loop at each of its S, |, F and 7 tiles:
+    a running count of crossings along the row, taken mod 2, says which cells are inside.
+    """
 
-    return sketch
+    on_loop = np.zeros(sketch.grid.size, dtype=bool)
+    on_loop[sketch.loop] = True
+    on_loop = on_loop.reshape(sketch.grid.shape)
 
+    crossings = on_loop & sketch.grid.mask("S|F7")
+    inside = np.cumsum(crossings, axis=1) % 2 == 1
 
+    return int(np.count_nonzero(inside & ~on_loop))
+
+
+def parse(raw):
+    return parse_sketch(raw)
+
+
+def solve(sketch):
+    return count_cells_inside_loop(sketch)
 
 
 test_input_raw_1 = """...........
@@ -194,10 +158,6 @@ test_input_raw_1 = """...........
 .|..|.|..|.
 .L--J.L--J.
 ..........."""
-test_sketch_1 = parse_sketch(test_input_raw_1)  
-# nx.draw(test_sketch_1.graph, with_labels=True, node_color='lightblue', edge_color='gray')
-# plt.show()
-
 
 test_input_raw_2 = """.F----7F7F7F7F-7....
 .|F--7||||||||FJ....
@@ -209,9 +169,6 @@ L--J.L7...LJS7F-7L7.
 .....|FJLJ|FJ|F7|.LJ
 ....FJL-7.||.||||...
 ....L---J.LJ.LJLJ..."""
-test_sketch_2 = parse_sketch(test_input_raw_2) 
-# nx.draw(test_sketch_2.graph, with_labels=True, node_color='lightblue', edge_color='gray')
-# plt.show()
 
 test_input_raw_3 = """FF7FSF7F7F7F7F7F---7
 L|LJ||||||||||||F--J
@@ -223,44 +180,26 @@ L---JF-JLJIIIIFJLJJ7
 7-L-JL7||F7|L7F-7F7|
 L.L7LFJ|||||FJL7||LJ
 L7JLJL-JLJLJL--JLJ.L"""
-test_sketch_3 = parse_sketch(test_input_raw_3) 
-# nx.draw(test_sketch_2.graph, with_labels=True, 
-
-
-with open("inputs/day10.txt") as f:
-    input_raw = f.read()
-    sketch = parse_sketch(input_raw)
-
-
-def count_cells_inside_loop(sketch):
-    nrows = max([tile.i for tile in sketch.tiles.values()]) 
-    ncols = max([tile.j for tile in sketch.tiles.values()]) 
-
-    cell_count = 0
-    for row in range(0, nrows+1):
-        row_count = 0
-        inside = False
-        record = []
-        for col in range(0, ncols+1):
 
-            current_tile = sketch.tiles[(row,col)]
 
-            if (current_tile.i, current_tile.j) in sketch.loop and current_tile.type in ["S", "|", "F", "7"]:
-                inside = not inside
-            
-            elif inside and (current_tile.i, current_tile.j) not in sketch.loop :
-                row_count += 1
+if __name__ == '__main__':
+    # import matplotlib.pyplot as plt
 
-            record.append(inside)
-            
-        cell_count += row_count
+    test_sketch_1 = parse(test_input_raw_1)  
+    # nx.draw(test_sketch_1.graph, with_labels=True, node_color='lightblue', edge_color='gray')
+    # plt.show()
 
-    return cell_count
+    test_sketch_2 = parse(test_input_raw_2) 
+    # nx.draw(test_sketch_2.graph, with_labels=True, node_color='lightblue', edge_color='gray')
+    # plt.show()
 
-assert count_cells_inside_loop(test_sketch_1) == 4
-assert count_cells_inside_loop(test_sketch_2) == 8
-assert count_cells_inside_loop(test_sketch_3) == 10
+    test_sketch_3 = parse(test_input_raw_3) 
 
+    assert solve(test_sketch_1) == 4
+    assert solve(test_sketch_2) == 8
+    assert solve(test_sketch_3) == 10
 
-print(f"cell_count: { count_cells_inside_loop(sketch)}")
+    with open("inputs/day10.txt") as f:
+        sketch = parse(f.read())
 
+    print(f"cell_count: {solve(sketch)}")
@@ -2,7 +2,6 @@ import numpy as np
 
 from dataclasses import dataclass
 from typing import Dict
-from scipy.spatial.distance import cdist
 
 
 @dataclass
@@ -64,7 +63,8 @@ def parse_input(raw_input):
 def get_sum_of_distances(universe):
 
     galaxy_coords = np.argwhere(universe == 1)
-    distances = cdist(galaxy_coords, galaxy_coords, 'cityblock')
+    # manhattan distance between every pair of galaxies
+    distances = np.abs(galaxy_coords[:, np.newaxis, :] - galaxy_coords[np.newaxis, :, :]).sum(axis=-1)
     result = distances.sum().sum()/2
     return result
 
@@ -80,13 +80,21 @@ test_input_raw = """...#......
 .......#..
 #...#....."""
 
-test_image = parse_input(test_input_raw)
-assert get_sum_of_distances(test_image.expanded_universe) == 374
 
+def parse(raw):
+    return parse_input(raw)
 
-with open("inputs/day11.txt") as f:
-    raw_input = f.read()
-    image = parse_input(raw_input)
 
-result = get_sum_of_distances(image.expanded_universe)
-print(f"Sum of distances: {result}")
+def solve(image):
+    return get_sum_of_distances(image.expanded_universe)
+
+
+if __name__ == '__main__':
+    test_image = parse(test_input_raw)
+    assert solve(test_image) == 374
+
+    with open("inputs/day11.txt") as f:
+        image = parse(f.read())
+
+    result = solve(image)
+    print(f"Sum of distances: {result}")
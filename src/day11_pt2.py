@@ -2,7 +2,6 @@ import numpy as np
 
 from dataclasses import dataclass
 from typing import Dict
-from scipy.spatial.distance import cdist
 
 
 @dataclass
@@ -62,7 +61,8 @@ def parse_input(raw_input):
 
 def get_distances(universe):
     galaxy_coords = np.argwhere(universe == 1)
-    distances = cdist(galaxy_coords, galaxy_coords, 'cityblock')
+    # manhattan distance between every pair of galaxies
+    distances = np.abs(galaxy_coords[:, np.newaxis, :] - galaxy_coords[np.newaxis, :, :]).sum(axis=-1)
     return distances
 
 def get_sum_of_distances(universe):
@@ -72,28 +72,6 @@ def get_sum_of_distances(universe):
     return result
 
 
-test_input_raw = """...#......
-.......#..
-#.........
-..........
-......#...
-.#........
-.........#
-..........
-.......#..
-#...#....."""
-
-test_image = parse_input(test_input_raw)
-assert get_sum_of_distances(test_image.expanded_universe) == 374
-
-
-with open("inputs/day11.txt") as f:
-    raw_input = f.read()
-    image = parse_input(raw_input)
-
-
-
-
 def get_sum_of_distances_after_n_expansions(image, num_expansions):
 
     original_distances = get_distances(image.universe)
@@ -111,9 +89,36 @@ def get_sum_of_distances_after_n_expansions(image, num_expansions):
     return result 
 
 
-assert get_sum_of_distances_after_n_expansions(test_image, 1) == 374
-assert get_sum_of_distances_after_n_expansions(test_image, 10) == 1030
-assert get_sum_of_distances_after_n_expansions(test_image, 100) == 8410
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(image, num_expansions=1_000_000):
+    return get_sum_of_distances_after_n_expansions(image, num_expansions)
+
+
+test_input_raw = """...#......
+.......#..
+#.........
+..........
+......#...
+.#........
+.........#
+..........
+.......#..
+#...#....."""
+
+
+if __name__ == '__main__':
+    test_image = parse(test_input_raw)
+    assert get_sum_of_distances(test_image.expanded_universe) == 374
+
+    assert solve(test_image, 1) == 374
+    assert solve(test_image, 10) == 1030
+    assert solve(test_image, 100) == 8410
+
+    with open("inputs/day11.txt") as f:
+        image = parse(f.read())
 
-result = get_sum_of_distances_after_n_expansions(image, 1_000_000)
-print(f"Sum of distances: {result}")
\ No newline at end of file
+    result = solve(image)
+    print(f"Sum of distances: {result}")
@@ -78,12 +78,21 @@ test_input_raw = """???.### 1,1,3
 ????.######..#####. 1,6,5
 ?###???????? 3,2,1"""
 
-test_records = parse_records(test_input_raw)
-assert count_arrangements(test_records) == 21
 
-with open('inputs/day12.txt') as f:
-    input_raw = f.read()
-    records = parse_records(input_raw)
+def parse(raw):
+    return parse_records(raw)
 
-result = count_arrangements(records)
-print(f"There are {result} valid arrangements")
+
+def solve(records):
+    return count_arrangements(records)
+
+
+if __name__ == '__main__':
+    test_records = parse(test_input_raw)
+    assert solve(test_records) == 21
+
+    with open('inputs/day12.txt') as f:
+        records = parse(f.read())
+
+    result = solve(records)
+    print(f"There are {result} valid arrangements")
@@ -88,9 +88,7 @@ def _process_dot(line, expected_hash_sequences, actual_hash_sequences, hash_coun
     return count_valid_arrangements(line, expected_hash_sequences, actual_hash_sequences, 0, idx+1)
 
 
-def part1_count(input_raw):
-
-    records = parse_records(input_raw)  
+def part1_count(records):
 
     result = 0
     for record in records:
@@ -100,9 +98,7 @@ def part1_count(input_raw):
     return result
 
 
-def part2_count(input_raw, expansion_factor):
-
-    records = parse_records(input_raw)  
+def part2_count(records, expansion_factor):
 
     result = 0
     for record in records:
@@ -115,6 +111,14 @@ def part2_count(input_raw, expansion_factor):
     return result
 
 
+def parse(raw):
+    return parse_records(raw)
+
+
+def solve(records, expansion_factor=5):
+    return part2_count(records, expansion_factor)
+
+
 test_input_raw = """???.### 1,1,3
 .??..??...?##. 1,1,3
 ?#?#?#?#?#?#?#? 1,3,1,6
@@ -122,16 +126,17 @@ test_input_raw = """???.### 1,1,3
 ????.######..#####. 1,6,5
 ?###???????? 3,2,1"""
 
-assert part1_count(test_input_raw) == 21
-assert part2_count(test_input_raw, expansion_factor=5) == 525152
-
 
-with open('inputs/day12.txt') as f:
-    input_raw = f.read()
+if __name__ == '__main__':
+    test_records = parse(test_input_raw)
+    assert part1_count(test_records) == 21
+    assert solve(test_records, expansion_factor=5) == 525152
 
-result_part_1 = part1_count(input_raw)
-print(f"Part 1 Result: {result_part_1}")  # 7110
+    with open('inputs/day12.txt') as f:
+        records = parse(f.read())
 
-result_part_2 = part2_count(input_raw, expansion_factor=5)
-print(f"Part 2 Result: {result_part_2}")  # 1566786613613
+    result_part_1 = part1_count(records)
+    print(f"Part 1 Result: {result_part_1}")  # 7110
 
+    result_part_2 = solve(records, expansion_factor=5)
+    print(f"Part 2 Result: {result_part_2}")  # 1566786613613
@@ -6,18 +6,18 @@ from typing import List
 from dataclasses import dataclass
 from itertools import combinations
 
+from aoc import loader, trace
+
 Pattern = np.array
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
 def parse_input(raw):
 
-    parts = raw.split("\n\n")
     patterns = []
-    for part in parts:
-        
-        grid = [row.replace("#", "1").replace(".", "0")
-                for row in part.split("\n")]
-
-        patterns.append(Pattern([list(row) for row in grid], dtype=int))
+    for part in loader.blocks(raw):
+        patterns.append(Pattern(loader.grid_view(part) == ord("#"), dtype=int))
 
     return patterns
 
@@ -70,13 +70,9 @@ test_input_raw = """#.##..##.
 ..##..###
 #....#..#"""
 
-test_patterns = parse_input(test_input_raw)
-
-with open("inputs/day13.txt") as f:
-    raw = f.read()
-    patterns = parse_input(raw)
-
 def part1(patterns):
+    debug = trace.enabled(trace.DEBUG)
+
     result = 0
     for i, pattern in enumerate(patterns): 
 
@@ -85,19 +81,33 @@ def part1(patterns):
 
         # seems from the wording that every pattern has exactly one line of symmetry
         if num_left_of_vertical is not None:
-            print(f"Pattern {i} has a vertical line of symmetry: {num_left_of_vertical}")
+            if debug:
+                trace.event('symmetry', pattern=i, line='vertical', position=num_left_of_vertical)
             result += num_left_of_vertical
 
         if num_above_horizontal is not None:
-            print(f"Pattern {i} has a horizontal line of symmetry: {num_above_horizontal}")
+            if debug:
+                trace.event('symmetry', pattern=i, line='horizontal', position=num_above_horizontal)
             result += (100 * num_above_horizontal)
 
     return result
 
-assert part1(test_patterns) == 405
 
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(patterns):
+    return part1(patterns)
+
+
+if __name__ == '__main__':
+    test_patterns = parse(test_input_raw)
+    assert solve(test_patterns) == 405
 
-# 35360
-part_1_result = part1(patterns) 
-print(f"Part 1 result: {part_1_result}")
+    with open("inputs/day13.txt") as f:
+        patterns = parse(f.read())
 
+    # 35360
+    part_1_result = solve(patterns) 
+    print(f"Part 1 result: {part_1_result}")
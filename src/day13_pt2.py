@@ -6,18 +6,18 @@ from typing import List
 from dataclasses import dataclass
 from itertools import combinations
 
+from aoc import loader, trace
+
 Pattern = np.array
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
 def parse_input(raw):
 
-    parts = raw.split("\n\n")
     patterns = []
-    for part in parts:
-        
-        grid = [row.replace("#", "1").replace(".", "0")
-                for row in part.split("\n")]
-
-        patterns.append(Pattern([list(row) for row in grid], dtype=int))
+    for part in loader.blocks(raw):
+        patterns.append(Pattern(loader.grid_view(part) == ord("#"), dtype=int))
 
     return patterns
 
@@ -76,13 +76,9 @@ test_input_raw = """#.##..##.
 ..##..###
 #....#..#"""
 
-test_patterns = parse_input(test_input_raw)
-
-with open("inputs/day13.txt") as f:
-    raw = f.read()
-    patterns = parse_input(raw)
-
 def part2(patterns):
+    debug = trace.enabled(trace.DEBUG)
+
     result = 0
     for i, pattern in enumerate(patterns): 
 
@@ -91,21 +87,32 @@ def part2(patterns):
 
         # seems from the wording that every pattern has exactly one line of symmetry
         if num_left_of_vertical is not None:
-            print(f"Pattern {i} has a vertical line of symmetry: {num_left_of_vertical}")
+            if debug:
+                trace.event('symmetry', pattern=i, line='vertical', position=num_left_of_vertical)
             result += num_left_of_vertical
 
         if num_above_horizontal is not None:
-            print(f"Pattern {i} has a horizontal line of symmetry: {num_above_horizontal}")
+            if debug:
+                trace.event('symmetry', pattern=i, line='horizontal', position=num_above_horizontal)
             result += (100 * num_above_horizontal)
 
     return result
 
 
-assert part2(test_patterns) == 400
-result = part2(patterns)
-print(f"Part 2 test: {result}")  # 36755
+def parse(raw):
+    return parse_input(raw)
+
 
+def solve(patterns):
+    return part2(patterns)
 
 
+if __name__ == '__main__':
+    test_patterns = parse(test_input_raw)
+    assert solve(test_patterns) == 400
 
+    with open("inputs/day13.txt") as f:
+        patterns = parse(f.read())
 
+    result = solve(patterns)
+    print(f"Part 2 test: {result}")  # 36755
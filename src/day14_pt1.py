@@ -2,6 +2,8 @@ import numpy as np
 from dataclasses import dataclass
 from collections import defaultdict
 
+from aoc import loader
+
 @dataclass
 class Platform:
     round_rocks: np.ndarray
@@ -11,11 +13,15 @@ class Platform:
         return f"Platform(round_rocks=\n{self.round_rocks}\n\ncube_rocks=\n{self.cube_rocks})"
 
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+
 def parse_input(raw_input):
-    rows = np.array([list(line) for line in raw_input.splitlines()])
+    rows = loader.grid_view(raw_input)
 
-    round_rocks = np.where(rows == "O", 1, 0)
-    cube_rocks = np.where(rows == "#", 1, 0)
+    round_rocks = np.where(rows == ord("O"), 1, 0)
+    cube_rocks = np.where(rows == ord("#"), 1, 0)
 
     return Platform(round_rocks, cube_rocks)
 
@@ -58,12 +64,20 @@ O.#..O.#.#
 #OO..#...."""
 
 
-test_platform = parse_input(test_input_raw)
-assert part1(test_platform) == 136
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(platform):
+    return part1(platform)
+
+
+if __name__ == '__main__':
+    test_platform = parse(test_input_raw)
+    assert solve(test_platform) == 136
 
-with open("inputs/day14.txt") as f:
-    raw_input = f.read()
-    platform = parse_input(raw_input)
+    with open("inputs/day14.txt") as f:
+        platform = parse(f.read())
 
-result = part1(platform) # 102497
-print(f"Part 1: {result}")
\ No newline at end of file
+    result = solve(platform) # 102497
+    print(f"Part 1: {result}")
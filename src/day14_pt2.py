@@ -2,6 +2,8 @@ import numpy as np
 from dataclasses import dataclass
 from collections import defaultdict
 
+from aoc import loader, trace
+
 
 @dataclass
 class Platform:
@@ -12,11 +14,15 @@ class Platform:
         return f"Platform(round_rocks=\n{self.round_rocks}\n\ncube_rocks=\n{self.cube_rocks})"
 
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+
 def parse_input(raw_input):
-    rows = np.array([list(line) for line in raw_input.splitlines()])
+    rows = loader.grid_view(raw_input)
 
-    round_rocks = np.where(rows == "O", 1, 0)
-    cube_rocks = np.where(rows == "#", 1, 0)
+    round_rocks = np.where(rows == ord("O"), 1, 0)
+    cube_rocks = np.where(rows == ord("#"), 1, 0)
 
     return Platform(round_rocks, cube_rocks)
 
@@ -124,43 +130,39 @@ O.#..O.#.#
 #OO..#...."""
 
 
-test_platform = parse_input(test_input_raw)
-
-
-with open("inputs/day14.txt") as f:
-    raw_input = f.read()
-    platform = parse_input(raw_input)
-
-#platform = test_platform
-
-#num_cycles = 1000000000
-num_cycles = 1000
-
 directions = ["north", "west", "south", "east"]
 
 
+def parse(raw):
+    return parse_input(raw)
 
 
-record = {}
-for i in range(num_cycles):
-    loads = column_loads(platform)
-    print(f"Cycle {i}: {sum(loads.values())}")
-    record[i] = sum(loads.values())
-    
-    for direction in directions:
-        platform = tilt_in_direction(platform, direction)
+def solve(platform, num_cycles=1000):
 
-    
+    #num_cycles = 1000000000
 
+    debug = trace.enabled(trace.DEBUG)
 
+    record = {}
+    for i in range(num_cycles):
+        loads = column_loads(platform)
+        record[i] = sum(loads.values())
+        if debug:
+            trace.event('cycle', cycle=i, load=record[i])
 
-loads = column_loads(platform)
-result = sum(loads.values())
-print(loads)
+        for direction in directions:
+            platform = tilt_in_direction(platform, direction)
 
-# 105008 obtained by running the above code for 1000 cycles and eyeballing it. Not clever, but it's late...
-print(result)
+    loads = column_loads(platform)
+    result = sum(loads.values())
+    trace.info('column loads', loads=loads)
 
+    return result
 
 
+if __name__ == '__main__':
+    with open("inputs/day14.txt") as f:
+        platform = parse(f.read())
 
+    # 105008 obtained by running the above code for 1000 cycles and eyeballing it. Not clever, but it's late...
+    print(solve(platform))
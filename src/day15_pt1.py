@@ -20,8 +20,7 @@ def HASH(step):
     return current_value
 
 
-def part1(input):
-    sequence = parse_input(input)
+def part1(sequence):
 
     decoded = []
     for step in sequence:
@@ -33,13 +32,24 @@ def part1(input):
 
 
 
-test_input = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
-assert HASH(list("HASH")) == 52
-assert part1(test_input) == 1320
+def parse(raw):
+    return parse_input(raw)
 
-with open("inputs/day15.txt") as f:
-    input = f.read()
 
-# 522547
-result = part1(input)
-print(f"Result: {result}")
\ No newline at end of file
+def solve(sequence):
+    return part1(sequence)
+
+
+test_input_raw = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
+
+
+if __name__ == '__main__':
+    assert HASH(list("HASH")) == 52
+    assert solve(parse(test_input_raw)) == 1320
+
+    with open("inputs/day15.txt") as f:
+        sequence = parse(f.read())
+
+    # 522547
+    result = solve(sequence)
+    print(f"Result: {result}")
@@ -50,9 +50,8 @@ def focusing_power(box_number, box):
     return focusing_power
 
 
-def part2(input):
+def part2(steps):
 
-    steps = parse_input(input)
     boxes = defaultdict(dict)
 
     # run the initialization sequence 
@@ -84,12 +83,24 @@ def part2(input):
 
     return result
 
-test_input = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
-assert part2(test_input) == 145
 
-with open("inputs/day15.txt") as f:
-    input = f.read()
+def parse(raw):
+    return parse_input(raw)
 
-# 229271
-result = part2(input)
-print(f"Part 2 Result: {result}")
+
+def solve(steps):
+    return part2(steps)
+
+
+test_input_raw = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
+
+
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 145
+
+    with open("inputs/day15.txt") as f:
+        steps = parse(f.read())
+
+    # 229271
+    result = solve(steps)
+    print(f"Part 2 Result: {result}")
@@ -1,244 +1,113 @@
 from collections import namedtuple
 
-Node = namedtuple('Node', ['row', 'col', 'arrived_from'])
+from aoc.grid import Grid, NORTH, SOUTH, EAST, WEST
 
-class EmptyTile():
 
-    def __init__(self, row, col, energized):
-        self.row = row 
-        self.col = col 
-        self.activated = False
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
 
-    def __repr__(self):
-        return f"{self.__class__.__name__} at ({self.row}, {self.col}), arrived from {self.arrived_from}. Activated: {self.activated}"
+# index is the tile's flat index into the grid
+Node = namedtuple('Node', ['index', 'arrived_from'])
 
-    def get_next_nodes(self, arrived_from):
+# go left and tell the next node we came from its right, and so on
+ARRIVED_FROM = {NORTH: 'below', SOUTH: 'above', EAST: 'left', WEST: 'right'}
 
-        next_nodes = []
-        if arrived_from == 'above':
-            next_nodes.append(self.activate_down())
-            
-        elif arrived_from == 'below':
-            next_nodes.append(self.activate_up())
+# which way(s) the beam leaves each type of tile, given the side it arrived from
+TILE_RULES = {
+    # empty
+    ('.', 'above'): [SOUTH],
+    ('.', 'below'): [NORTH],
+    ('.', 'left'): [EAST],
+    ('.', 'right'): [WEST],
 
-        elif arrived_from == 'left':
-            next_nodes.append(self.activate_right())
+    # vertical splitter: splits, unless the beam hits the pointy end
+    ('|', 'left'): [NORTH, SOUTH],
+    ('|', 'right'): [NORTH, SOUTH],
+    ('|', 'above'): [SOUTH],
+    ('|', 'below'): [NORTH],
 
-        elif arrived_from == 'right':
-            next_nodes.append(self.activate_left())
+    # horizontal splitter
+    ('-', 'above'): [WEST, EAST],
+    ('-', 'below'): [WEST, EAST],
+    ('-', 'right'): [WEST],
+    ('-', 'left'): [EAST],
 
-        else:
-            raise ValueError()
+    # backward mirror
+    ('\\', 'above'): [EAST],
+    ('\\', 'below'): [WEST],
+    ('\\', 'left'): [SOUTH],
+    ('\\', 'right'): [NORTH],
 
-        return [node for node in next_nodes if node is not None]
+    # forward mirror
+    ('/', 'above'): [WEST],
+    ('/', 'below'): [EAST],
+    ('/', 'left'): [NORTH],
+    ('/', 'right'): [SOUTH],
+}
 
-    # go left and tell the next node we came from its right, and so on
-    def activate_left(self):
-        if self.col - 1 >= 0:
-            return Node(self.row, self.col - 1, 'right')
+# the same, keyed by the byte the grid holds for each tile
+NEXT_DIRECTIONS = {(ord(tile), arrived_from): directions for (tile, arrived_from), directions in TILE_RULES.items()}
 
-    def activate_right(self):
-        if self.col + 1 < GRID_WIDTH:
-            return Node(self.row, self.col + 1, 'left')
 
-    def activate_up(self):
-        if self.row - 1 >= 0:
-            return Node(self.row - 1, self.col, 'below')
+def energise(grid, starting_node):
 
-    def activate_down(self):
-        if self.row + 1 < GRID_HEIGHT:
-            return Node(self.row + 1, self.col, 'above')
+    """Follow the beam from starting_node: a bytearray with a 1 for every tile it passes through, 0 for the rest."""
 
+    energised = bytearray(grid.size)
 
+    frontier = {starting_node}
+    dealt_with = set()
+    while frontier:
 
-class VerticalSplitterTile(EmptyTile):
-    def __init__(self, row, col, energized):
-        super().__init__(row, col, energized)
-
-    def get_next_nodes(self, arrived_from):
-
-        next_nodes = []
-
-        # splitting case
-        if arrived_from in ['left', 'right']:
-            next_nodes.append(self.activate_up())
-            next_nodes.append(self.activate_down())
-
-        # pointy end cases
-        elif arrived_from == 'above':
-            next_nodes.append(self.activate_down())
-
-        elif arrived_from == 'below':
-            next_nodes.append(self.activate_up())
-
-        else:
-            raise ValueError()
-
-        return [node for node in next_nodes if node is not None]
-
-
-class HorizontalSplitterTile(EmptyTile):
-    def __init__(self, row, col, energized):
-        super().__init__(row, col, energized)
-
-    def get_next_nodes(self, arrived_from):
-
-        next_nodes = []
-
-        # splitting case
-        if arrived_from in ['above', 'below']:
-            next_nodes.append(self.activate_left())
-            next_nodes.append(self.activate_right())
-
-        # pointy end cases
-        elif arrived_from == 'right':
-            next_nodes.append(self.activate_left())
-
-        elif arrived_from == 'left':
-            next_nodes.append(self.activate_right())
-
-        else:
-            raise ValueError()
-
-        return [node for node in next_nodes if node is not None]
-
-
-class BackwardMirrorTile(EmptyTile):
-    def __init__(self, row, col, energized):
-        super().__init__(row, col, energized)
-
-    def get_next_nodes(self, arrived_from):
-        
-        next_nodes = []
-        if arrived_from == 'above':
-            next_nodes.append(self.activate_right())
-            
-        elif arrived_from == 'below':
-            next_nodes.append(self.activate_left())
-
-        elif arrived_from == 'left':
-            next_nodes.append(self.activate_down())
-
-        elif arrived_from == 'right':
-            next_nodes.append(self.activate_up())
-
-        else:
-            raise ValueError()
-
-        return [node for node in next_nodes if node is not None]
-
-
-class ForwardMirrorTile(EmptyTile):
-    def __init__(self, row, col, energized):
-        super().__init__(row, col, energized)
-
-    def get_next_nodes(self, arrived_from):
-
-        next_nodes = []
-        if arrived_from == 'above':
-            next_nodes.append(self.activate_left())
-            
-        elif arrived_from == 'below':
-            next_nodes.append(self.activate_right())
-
-        elif arrived_from == 'left':
-            next_nodes.append(self.activate_up())
-
-        elif arrived_from == 'right':
-            next_nodes.append(self.activate_down())
-
-        else:
-            raise ValueError()
-
-        return [node for node in next_nodes if node is not None]
-        
-
-def tile_factory(row, col, char):
-
-    if char == ".":
-        return EmptyTile(row, col, False)
-
-    elif char == "|":
-        return VerticalSplitterTile(row, col, False)
-
-    elif char == "-":
-        return HorizontalSplitterTile(row, col, False)
-
-    elif char == "\\":
-        return BackwardMirrorTile(row, col, False)
-
-    elif char == "/":
-        return ForwardMirrorTile(row, col, False)
-
-    else:
-        raise ValueError(f"Unknown tile type: {char} for tile at ({row}, {col})")
-
+        current_node = frontier.pop()
+        energised[current_node.index] = 1
 
-def display_activated_tiles(tiles):
+        for direction in NEXT_DIRECTIONS[grid[current_node.index], current_node.arrived_from]:
+            next_index = grid.step(current_node.index, direction)
+            if next_index is None:
+                continue
 
-    grid_width, grid_height = len(tiles[0]), len(tiles)
+            node = Node(next_index, ARRIVED_FROM[direction])
+            if node in dealt_with:
+                continue
+            else: 
+                dealt_with.add(node)
+                frontier.add(node)
 
-    tile_map = [['.' for _ in range(grid_width)] for _ in range(grid_height)]
+    return energised
 
-    activated_tiles = [tile for row in tiles for tile in row if tile.activated]
 
-    for tile in activated_tiles:
-        tile_map[tile.row][tile.col] = '#'
+def display_activated_tiles(grid, energised):
 
-    for row in tile_map:
-        print(''.join(row))
+    for row in range(grid.rows):
+        print(''.join('#' if energised[grid.index(row, col)] else '.' for col in range(grid.cols)))
 
 
 def parse_input(input):
 
-    tiles = []
-    lines = input.split("\n")
-    for row, line in enumerate(lines):
-        row_values = []
-        for col, char in enumerate(line):
-            row_values.append(tile_factory(row, col, char))
-        tiles.append(row_values)
+    grid = Grid.from_input(input)
 
-    return tiles
+    rows, cols = (~grid.mask('.|-\\/')).nonzero()
+    if len(rows):
+        row, col = int(rows[0]), int(cols[0])
+        raise ValueError(f"Unknown tile type: {chr(grid[row, col])} for tile at ({row}, {col})")
 
+    return grid
 
-def Part1(input):
 
-    # I reckon it's OK to do this...
-    global GRID_WIDTH, GRID_HEIGHT
+def parse(raw):
+    return parse_input(raw)
 
-    tiles = parse_input(input)
-    GRID_WIDTH, GRID_HEIGHT = len(tiles[0]), len(tiles)
-
-    # start top left, having arrived from the left
-    starting_node = Node(0, 0, 'left')
-
-    frontier = {starting_node}
-    dealt_with = set()
-    while frontier:
-
-        current_node = frontier.pop()
-
-        # we just use the tile to track its own activation and tell us the next tiles to activate, given the arrived_from direction
-        current_tile = tiles[current_node.row][current_node.col]
-        current_tile.activated = True
-        next_nodes = current_tile.get_next_nodes(current_node.arrived_from) 
-
-        for node in next_nodes:
-            if node in dealt_with:
-                continue
-            else: 
-                dealt_with.add(node)
-                frontier.add(node)
 
+def solve(grid):
 
+    # start top left, having arrived from the left
+    starting_node = Node(grid.index(0, 0), 'left')
 
-    activated_tiles = [tile for row in tiles for tile in row if tile.activated]
-    result = len(activated_tiles)
+    return energise(grid, starting_node).count(1)
 
-    return result
 
-test_input = r""".|...\....
+test_input_raw = r""".|...\....
 |.-.\.....
 .....|-...
 ........|.
@@ -249,12 +118,13 @@ test_input = r""".|...\....
 .|....-|.\
 ..//.|...."""
 
-assert Part1(test_input) == 46
 
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 46
 
-with open('inputs/day16.txt') as f:
-    input = f.read()
+    with open('inputs/day16.txt') as f:
+        tiles = parse(f.read())
 
-# 7798
-result = Part1(input)
-print(f"Part 1 result: {result}")
\ No newline at end of file
+    # 7798
+    result = solve(tiles)
+    print(f"Part 1 result: {result}")
@@ -3,6 +3,9 @@ from dataclasses import dataclass
 from collections import defaultdict, deque, namedtuple
 from typing import Dict, List
 
+from aoc import trace
+from aoc.grid import Grid
+
 @dataclass
 class Node:
     location: tuple
@@ -16,21 +19,22 @@ class Node:
         return shortest_known_distances[self] < shortest_known_distances[other]
 
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+
 def parse_input(input):
- 
-    grid = []
-    for i, line in enumerate(input.splitlines()):
-        grid_row = []
-        for j, heat_loss in enumerate(line):
-            grid_row.append(int(heat_loss))
-        grid.append(grid_row)
+
+    # each cell's heat loss as a number, rather than the digit's character code
+    grid = Grid.from_input(input)
+    grid.cells -= ord('0')
 
     return grid
 
 
 def plot_path(path, grid):
 
-    grid_map = [[f'{".":<3}' for i in range(len(grid))] for j in range(len(grid[0]))]
+    grid_map = [[f'{".":<3}' for i in range(grid.rows)] for j in range(grid.cols)]
 
     count = 1
     for node in path:
@@ -48,7 +52,7 @@ def get_neighbours(grid, node):
     for direction_name, (di, dj) in directions.items(): 
         ni, nj = node.location[0] + di, node.location[1] + dj
         
-        if 0 <= ni < len(grid) and 0 <= nj < len(grid[0]):
+        if 0 <= ni < grid.rows and 0 <= nj < grid.cols:
 
             # can't retrace steps
             if len(node.direction_history) > 1:
@@ -69,7 +73,7 @@ def get_neighbours(grid, node):
                 continue
 
             neighbour = Node(location=(ni, nj),
-                             heat_loss=grid[ni][nj], 
+                             heat_loss=grid[ni, nj], 
                              direction_history = neighbour_direction_history)
 
             # shortest known distance through the current node
@@ -94,7 +98,7 @@ def get_neighbours(grid, node):
 def reconstruct_path(node):
     current = node
     path = [current]
-    print(path)
+    trace.info('path end', node=current)
     while current.location != start_location: 
         prev = predecessors[current]
         path.append(prev)
@@ -103,66 +107,76 @@ def reconstruct_path(node):
     return path[::-1]
 
 
-
-
-
-test_input = """2413432311323
-3215453535623
-3255245654254
-3446585845452
-4546657867536
-1438598798454
-4457876987766
-3637877979653
-4654967986887
-4564679986453
-1224686865563
-2546548887735
-4322674655533"""
-
-with open('inputs/day17.txt') as f:
-    input = f.read()
-    grid = parse_input(input)
+# refs
+MAX_CONSECUTIVE_STEPS = 3
+directions = {'UP': (-1,0), 'DOWN': (1,0), 'LEFT': (0,-1), 'RIGHT': (0,1)}
+start_location = (0,0)
 
 priority_queue = []
 shortest_known_distances = {}
 visited = set()
 predecessors = {}
 
-#grid = parse_input(test_input)
-grid = parse_input(input)
 
+def parse(raw):
+    return parse_input(raw)
 
-# refs
-MAX_CONSECUTIVE_STEPS = 3
-directions = {'UP': (-1,0), 'DOWN': (1,0), 'LEFT': (0,-1), 'RIGHT': (0,1)}
-start_location = (0,0)
-end_location = (len(grid)-1, len(grid[0])-1)
 
-current = Node(location=start_location, heat_loss=0, direction_history=deque(maxlen=MAX_CONSECUTIVE_STEPS+1))
-shortest_known_distances[current] = 0
+def solve(grid):
 
-while current.location != end_location:
+    # the search state lives at module level, so start from a clean slate on every call
+    global priority_queue, shortest_known_distances, visited, predecessors
+    priority_queue = []
+    shortest_known_distances = {}
+    visited = set()
+    predecessors = {}
 
-    neighbours = get_neighbours(grid, current)
-    for neighbour in neighbours:
+    end_location = (grid.rows-1, grid.cols-1)
 
-        if neighbour not in shortest_known_distances:
-            shortest_known_distances[neighbour] = float('inf')
+    current = Node(location=start_location, heat_loss=0, direction_history=deque(maxlen=MAX_CONSECUTIVE_STEPS+1))
+    shortest_known_distances[current] = 0
 
-        if neighbour not in visited:
-            heapq.heappush(priority_queue, neighbour)
+    while current.location != end_location:
 
-    current = heapq.heappop(priority_queue)
+        neighbours = get_neighbours(grid, current)
+        for neighbour in neighbours:
+            if neighbour not in shortest_known_distances:
+                shortest_known_distances[neighbour] = float('inf')
 
+            if neighbour not in visited:
+                heapq.heappush(priority_queue, neighbour)
 
-path = reconstruct_path(current)
+        current = heapq.heappop(priority_queue)
 
-# don't include the start node in the score
-result = sum([grid[node.location[0]][node.location[1]] for node in path[1:]])
+    path = reconstruct_path(current)
+
+    # don't include the start node in the score
+    result = sum([grid[node.location] for node in path[1:]])
+
+    return result
+
+
+test_input_raw = """2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533"""
 
-# 967
-print(f"Part 1 result: {result}")
 
+if __name__ == '__main__':
+    with open('inputs/day17.txt') as f:
+        grid = parse(f.read())
 
+    #grid = parse(test_input_raw)
 
+    # 967
+    result = solve(grid)
+    print(f"Part 1 result: {result}")
@@ -1,7 +1,9 @@
-import networkx as nx
 import numpy as np
 from collections import namedtuple, deque
 
+from aoc.graph import Graph
+from aoc.grid import Grid, EAST, SOUTH
+
 Instruction = namedtuple("Instruction", ["direction", "distance", "colour"])
 
 def parse_input(raw):
@@ -43,8 +45,39 @@ def form_grid(dig_plan):
     return grid
 
 
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(dig_plan):
+
+    grid = form_grid(dig_plan)
+    lagoon = Grid(grid)
+
+    # join neighbouring cells, except where one is a trench and the other isn't
+    trenches = lagoon.cells == 1
+    sources, targets = [], []
+    for cells in [trenches, ~trenches]:
+        for direction in [EAST, SOUTH]:
+            from_cells, to_cells = lagoon.pairs(cells, direction)
+            sources.append(from_cells)
+            targets.append(to_cells)
+
+    G = Graph(lagoon.size, np.concatenate(sources), np.concatenate(targets))
 
-test_input = """R 6 (#70c710)
+    # find the connected components: this will be the area enclosed by the trenches plus the exterior
+    component_sizes = np.bincount(G.connected_components())
+
+    # the interior is the biggest of them
+    capacity = int(grid.sum() + component_sizes.max())
+
+    # so we can see the grid
+    #np.savetxt("day18_grid.txt", grid, fmt="%d")
+
+    return capacity
+
+
+test_input_raw = """R 6 (#70c710)
 D 5 (#0dc571)
 L 2 (#5713f0)
 D 2 (#d2c081)
@@ -59,53 +92,12 @@ U 3 (#a77fa3)
 L 2 (#015232)
 U 2 (#7a21e3)"""
 
-with open("inputs/day18.txt") as f:
-    input = f.read()
-
-dig_plan = parse_input(input)
-#dig_plan = parse_input(test_input)
-
-
-grid = form_grid(dig_plan)
-G = nx.grid_2d_graph(grid.shape[0], grid.shape[1])
-
-# remove edges that connect trenches to non-trenches
-removed_edges = []
-for (i_a, j_a), (i_b, j_b) in G.edges:
-    if grid[i_a][j_a] != grid[i_b][j_b]:
-        G.remove_edge((i_a, j_a), (i_b, j_b))
-        removed_edges.append(((i_a, j_a), (i_b, j_b)))
-
-# find the connected components: this will be the area enclosed by the trenches plus the exterior
-connected_components = sorted(nx.connected_components(G), key=len, reverse=True)
-
-# graph of the connected components
-H = nx.Graph()
-
-for i, component in enumerate(connected_components):
-    H.add_node(i, members=component)
-
-# which components were adjaced in the original graph?
-for edge in removed_edges:
-    for i, comp1 in enumerate(connected_components):
-        for j, comp2 in enumerate(connected_components):
-            if i < j:  # To avoid duplicate checks
-                if (edge[0] in comp1 and edge[1] in comp2) or (edge[1] in comp1 and edge[0] in comp2):
-                    H.add_edge(i, j)
-
-interior_points = np.ones(grid.shape)
-for component in connected_components[1:]:
-    for i,j in component:
-        interior_points[i][j] = 0
-
-capacity = int(grid.sum() + interior_points.sum())
-
-# 31171
-print(f"Part 1 result: {capacity}")
-
 
-# so we can see the grid
-#np.savetxt("day18_grid.txt", grid, fmt="%d")
-#np.savetxt("day18_interior.txt", interior_points, fmt="%d")
+if __name__ == '__main__':
+    with open("inputs/day18.txt") as f:
+        dig_plan = parse(f.read())
 
+    #dig_plan = parse(test_input_raw)
 
+    # 31171
+    print(f"Part 1 result: {solve(dig_plan)}")
@@ -58,9 +58,12 @@ def get_border_length(dig_plan):
     return sum([instruction.distance for instruction in dig_plan])
 
 
-def part2(input):
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(dig_plan):
 
-    dig_plan = parse_input(input) 
     vertices = get_vertices(dig_plan)
     border_length = get_border_length(dig_plan)
 
@@ -76,9 +79,7 @@ def shoelace(vertices):
     return 0.5 * abs(sum([vertices[i][0] * vertices[(i+1)][1] - vertices[(i+1)][0] * vertices[i][1] for i in range(n)]))
 
 
-
-
-test_input = """R 6 (#70c710)
+test_input_raw = """R 6 (#70c710)
 D 5 (#0dc571)
 L 2 (#5713f0)
 D 2 (#d2c081)
@@ -93,13 +94,14 @@ U 3 (#a77fa3)
 L 2 (#015232)
 U 2 (#7a21e3)"""
 
-assert part2(test_input) == 952408144115
 
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 952408144115
+
+    with open("inputs/day18.txt") as f:
+        dig_plan = parse(f.read())
 
-with open("inputs/day18.txt") as f:
-    input = f.read()
+    result = solve(dig_plan)
 
-result = part2(input)
-  
-# 131431655002266
-print(f"Part 2 result: {result}")
\ No newline at end of file
+    # 131431655002266
+    print(f"Part 2 result: {result}")
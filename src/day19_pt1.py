@@ -147,6 +147,81 @@ def parse_terminal(rule: str) -> Node:
 LOWEST_PART_VALUE = 1
 HIGHEST_PART_VALUE = 4000
 
+
+def build_nodes(workflows):
+
+    """Create a node for each rule, with each node's right branch pointing at the next rule in its workflow."""
+
+    nodes = {}
+    for workflow_name, rules in workflows.items():
+        for rule in rules:
+            rule_type = determine_rule_type(rule) 
+
+            if rule_type == 'condition':
+                node = parse_conditional(rule)
+            elif rule_type == 'terminal':
+                node = parse_terminal(rule)
+            elif rule_type == 'reference':
+                node = parse_reference(rule)
+            else:
+                raise ValueError(f"Unknown rule type {rule_type}")
+
+            nodes[(workflow_name, node.name)] = node
+
+    for workflow_name, node_names in workflows.items():
+
+        for i in range(len(node_names)-1):
+
+            current_node_name = node_names[i]
+            next_node_name = node_names[i+1]
+
+            nodes[(workflow_name, current_node_name)].right = next_node_name
+
+    return nodes
+
+
+def parse(raw):
+    workflows, parts = parse_input(raw)
+    nodes = build_nodes(workflows)
+
+    return workflows, parts, nodes
+
+
+def solve(parsed):
+
+    workflows, parts, nodes = parsed
+
+    accepted_parts = []
+    accepted = 0
+    for part in parts:
+        current_workflow_name = 'in'
+        current_workflow = workflows[current_workflow_name]
+        current_node_name = current_workflow[0]
+
+        while True:
+            if determine_rule_type(current_node_name) == 'terminal':
+                if current_node_name == 'A':
+                    accepted += 1
+                    accepted_parts.append(part)
+                break
+
+            elif determine_rule_type(current_node_name) == 'reference':
+                new_workflow_name = current_node_name
+                new_workflow = workflows[new_workflow_name]
+                current_node_name = new_workflow[0]
+                current_workflow_name = new_workflow_name
+
+            elif determine_rule_type(current_node_name) == 'condition':
+                current_node = nodes[(current_workflow_name, current_node_name)]
+                next_node_name = current_node.get_next_node_name(part)
+                current_node_name = next_node_name
+                
+            else:
+                raise ValueError(f"Unknown node type {type(current_node)}")
+
+    return sum([part.x + part.m + part.a + part.s for part in accepted_parts])
+
+
 test_input_raw = """px{a<2006:qkq,m>2090:A,rfg}
 pv{a>1716:R,A}
 lnx{m>1548:A,A}
@@ -165,68 +240,11 @@ hdj{m>838:A,pv}
 {x=2461,m=1339,a=466,s=291}
 {x=2127,m=1623,a=2188,s=1013}"""
 
-with open("inputs/day19.txt") as f:
-    input_raw = f.read()
-
-workflows, parts = parse_input(input_raw)
-
-
-nodes = {}
-for workflow_name, rules in workflows.items():
-    for rule in rules:
-        rule_type = determine_rule_type(rule) 
 
-        if rule_type == 'condition':
-            node = parse_conditional(rule)
-        elif rule_type == 'terminal':
-            node = parse_terminal(rule)
-        elif rule_type == 'reference':
-            node = parse_reference(rule)
-        else:
-            raise ValueError(f"Unknown rule type {rule_type}")
+if __name__ == '__main__':
+    with open("inputs/day19.txt") as f:
+        parsed = parse(f.read())
 
-        nodes[(workflow_name, node.name)] = node
-    
-
-for workflow_name, node_names in workflows.items():
-    
-    for i in range(len(node_names)-1):
-
-        current_node_name = node_names[i]
-        next_node_name = node_names[i+1]
-
-        nodes[(workflow_name, current_node_name)].right = next_node_name
-
-
-# PART 1
-accepted_parts = []
-accepted = 0
-for part in parts:
-    current_workflow_name = 'in'
-    current_workflow = workflows[current_workflow_name]
-    current_node_name = current_workflow[0]
-
-    while True:
-        if determine_rule_type(current_node_name) == 'terminal':
-            if current_node_name == 'A':
-                accepted += 1
-                accepted_parts.append(part)
-            break
-
-        elif determine_rule_type(current_node_name) == 'reference':
-            new_workflow_name = current_node_name
-            new_workflow = workflows[new_workflow_name]
-            current_node_name = new_workflow[0]
-            current_workflow_name = new_workflow_name
-
-        elif determine_rule_type(current_node_name) == 'condition':
-            current_node = nodes[(current_workflow_name, current_node_name)]
-            next_node_name = current_node.get_next_node_name(part)
-            current_node_name = next_node_name
-            
-        else:
-            raise ValueError(f"Unknown node type {type(current_node)}")
-
-# 456651
-result = sum([part.x + part.m + part.a + part.s for part in accepted_parts])
-print(f"Part 1 result is {result}")
\ No newline at end of file
+    # 456651
+    result = solve(parsed)
+    print(f"Part 1 result is {result}")
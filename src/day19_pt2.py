@@ -148,60 +148,50 @@ def parse_terminal(rule: str) -> Node:
 LOWEST_PART_VALUE = 1
 HIGHEST_PART_VALUE = 4000
 
-test_input_raw = """px{a<2006:qkq,m>2090:A,rfg}
-pv{a>1716:R,A}
-lnx{m>1548:A,A}
-rfg{s<537:gd,x>2440:R,A}
-qs{s>3448:A,lnx}
-qkq{x<1416:A,crn}
-crn{x>2662:A,R}
-in{s<1351:px,qqz}
-qqz{s>2770:qs,m<1801:hdj,R}
-gd{a>3333:R,R}
-hdj{m>838:A,pv}
 
-{x=787,m=2655,a=1222,s=2876}
-{x=1679,m=44,a=2067,s=496}
-{x=2036,m=264,a=79,s=2244}
-{x=2461,m=1339,a=466,s=291}
-{x=2127,m=1623,a=2188,s=1013}"""
+def build_nodes(workflows):
 
-with open("inputs/day19.txt") as f:
-    input_raw = f.read()
+    """Create a node for each rule, with each node's right branch pointing at the next rule in its workflow."""
 
-workflows, parts = parse_input(input_raw)
+    nodes = {}
+    for workflow_name, rules in workflows.items():
+        for rule in rules:
+            rule_type = determine_rule_type(rule) 
 
-nodes = {}
-for workflow_name, rules in workflows.items():
-    for rule in rules:
-        rule_type = determine_rule_type(rule) 
+            if rule_type == 'condition':
+                node = parse_conditional(rule)
+            elif rule_type == 'terminal':
+                node = parse_terminal(rule)
+            elif rule_type == 'reference':
+                node = parse_reference(rule)
+            else:
+                raise ValueError(f"Unknown rule type {rule_type}")
 
-        if rule_type == 'condition':
-            node = parse_conditional(rule)
-        elif rule_type == 'terminal':
-            node = parse_terminal(rule)
-        elif rule_type == 'reference':
-            node = parse_reference(rule)
-        else:
-            raise ValueError(f"Unknown rule type {rule_type}")
+            nodes[(workflow_name, node.name)] = node
 
-        nodes[(workflow_name, node.name)] = node
-    
+    for workflow_name, node_names in workflows.items():
 
-for workflow_name, node_names in workflows.items():
-    
-    for i in range(len(node_names)-1):
+        for i in range(len(node_names)-1):
+
+            current_node_name = node_names[i]
+            next_node_name = node_names[i+1]
 
-        current_node_name = node_names[i]
-        next_node_name = node_names[i+1]
+            nodes[(workflow_name, current_node_name)].right = next_node_name
 
-        nodes[(workflow_name, current_node_name)].right = next_node_name
+    return nodes
 
 
-paths = []
-def visit_paths(node_name, workflow_name, path=[]):
+def parse(raw):
+    workflows, parts = parse_input(raw)
+    nodes = build_nodes(workflows)
 
-    global paths
+    return workflows, parts, nodes
+
+
+def visit_paths(node_name, workflow_name, workflows, nodes, paths, path=None):
+
+    if path is None:
+        path = []
 
     # handle references to other workflows
     if node_name in workflows:
@@ -217,60 +207,91 @@ def visit_paths(node_name, workflow_name, path=[]):
         new_workflow = workflows[new_workflow_name]
         new_node_name = new_workflow[0]
         path.append((new_workflow_name, node_name)) ##
-        visit_paths(new_node_name, new_workflow_name, path)
+        visit_paths(new_node_name, new_workflow_name, workflows, nodes, paths, path)
 
     if determine_rule_type(node_name) == 'condition':
         node = nodes[(workflow_name, node_name)]
         left_path = path.copy()
         left_path.append((workflow_name, node_name, "left"))
-        visit_paths(node.left, workflow_name, left_path)
+        visit_paths(node.left, workflow_name, workflows, nodes, paths, left_path)
 
         right_path = path.copy()
         right_path.append((workflow_name, node_name, "right"))
-        visit_paths(node.right, workflow_name, right_path)
+        visit_paths(node.right, workflow_name, workflows, nodes, paths, right_path)
 
     return paths
 
-current_workflow_name = 'in'
-root_node_name = workflows[current_workflow_name][0]
-all_paths = visit_paths(root_node_name, current_workflow_name)
 
-paths_to_acceptance = [path[:-1] for path in all_paths if path[-1][1] == 'A']
+def solve(parsed):
 
-num_cases = 0
+    workflows, _, nodes = parsed
 
-# build up the full intersection of the ranges for paths that lead to acceptance
-path_ranges = []
-for path in paths_to_acceptance:
-    ranges = {x: (LOWEST_PART_VALUE, HIGHEST_PART_VALUE) for x in ['x', 'm', 'a', 's']}
-    for step in path:
-        
-        node = nodes[(step[0], step[1])]
-        direction = step[2]
-        variable = node.variable
-        current_lower_bound, current_upper_bound = ranges[variable]
+    current_workflow_name = 'in'
+    root_node_name = workflows[current_workflow_name][0]
+    all_paths = visit_paths(root_node_name, current_workflow_name, workflows, nodes, paths=[])
 
-        if direction == 'left':
-            possible_new_lower_bound, possible_new_upper_bound = node.left_range[0], node.left_range[1]
-        elif direction == 'right':
-            possible_new_lower_bound, possible_new_upper_bound  = node.right_range[0], node.right_range[1]
+    paths_to_acceptance = [path[:-1] for path in all_paths if path[-1][1] == 'A']
 
-        
-        if possible_new_lower_bound > current_lower_bound:
-            new_lower_bound = possible_new_lower_bound
-        else:
-            new_lower_bound = current_lower_bound
+    num_cases = 0
+
+    # build up the full intersection of the ranges for paths that lead to acceptance
+    path_ranges = []
+    for path in paths_to_acceptance:
+        ranges = {x: (LOWEST_PART_VALUE, HIGHEST_PART_VALUE) for x in ['x', 'm', 'a', 's']}
+        for step in path:
+            
+            node = nodes[(step[0], step[1])]
+            direction = step[2]
+            variable = node.variable
+            current_lower_bound, current_upper_bound = ranges[variable]
 
-        if possible_new_upper_bound < current_upper_bound:
-            new_upper_bound = possible_new_upper_bound
-        else:
-            new_upper_bound = current_upper_bound
+            if direction == 'left':
+                possible_new_lower_bound, possible_new_upper_bound = node.left_range[0], node.left_range[1]
+            elif direction == 'right':
+                possible_new_lower_bound, possible_new_upper_bound  = node.right_range[0], node.right_range[1]
+
+            
+            if possible_new_lower_bound > current_lower_bound:
+                new_lower_bound = possible_new_lower_bound
+            else:
+                new_lower_bound = current_lower_bound
+
+            if possible_new_upper_bound < current_upper_bound:
+                new_upper_bound = possible_new_upper_bound
+            else:
+                new_upper_bound = current_upper_bound
+
+            ranges[variable] = (new_lower_bound, new_upper_bound)
+
+        num_cases += np.prod([r[1] - r[0] + 1 for r in ranges.values()])
+        path_ranges.append(ranges)
+
+    return num_cases
+
+
+test_input_raw = """px{a<2006:qkq,m>2090:A,rfg}
+pv{a>1716:R,A}
+lnx{m>1548:A,A}
+rfg{s<537:gd,x>2440:R,A}
+qs{s>3448:A,lnx}
+qkq{x<1416:A,crn}
+crn{x>2662:A,R}
+in{s<1351:px,qqz}
+qqz{s>2770:qs,m<1801:hdj,R}
+gd{a>3333:R,R}
+hdj{m>838:A,pv}
+
+{x=787,m=2655,a=1222,s=2876}
+{x=1679,m=44,a=2067,s=496}
+{x=2036,m=264,a=79,s=2244}
+{x=2461,m=1339,a=466,s=291}
+{x=2127,m=1623,a=2188,s=1013}"""
 
-        ranges[variable] = (new_lower_bound, new_upper_bound)
 
-    num_cases += np.prod([r[1] - r[0] + 1 for r in ranges.values()])
-    path_ranges.append(ranges)
+if __name__ == '__main__':
+    with open("inputs/day19.txt") as f:
+        parsed = parse(f.read())
 
-# 131899818301477
-result = num_cases
-print(f"Part 2 result is {result}")
\ No newline at end of file
+    # 131899818301477
+    result = solve(parsed)
+    print(f"Part 2 result is {result}")
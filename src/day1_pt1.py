@@ -1,28 +1,87 @@
-with open('inputs/day1.txt') as f:
-    input = [x for x in f.read().split('\n')]
+import multiprocessing
+import os
+
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import loader
+
+
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+# documents bigger than this are split into chunks of about this size, solved in parallel
+CHUNK_BYTES = 1 << 26
 
 test_input_raw = """1abc2
 pqr3stu8vwx
 a1b2c3d4e5f
 treb7uchet"""
 
-test_input = [x for x in test_input_raw.split('\n')]
 
-def get_digits(line):
-    digits = [x for x in line if x.isdigit()]
-    return digits
+def parse(raw):
+    return np.frombuffer(loader.as_buffer(raw), dtype=np.uint8)
+
+
+def sum_lines(chunk) -> int:
+
+    """
+    The sum of the calibration values of every line in chunk, all at once. Only the digits (0-9) and the
+    newlines between lines matter, so they're picked out together, in order: a digit is its line's first when
+    a line boundary comes just before it, and its last when one comes just after.
+    """
+
+    flat = np.frombuffer(chunk, dtype=np.uint8)
+
+    # bytes below '0' wrap round to large values
+    marks = flat[np.flatnonzero((flat - ord('0') < 10) | (flat == ord('\n')))]
+    boundary = np.concatenate(([True], marks == ord('\n'), [True]))
+    digit = ~boundary[1:-1]
+
+    # two boundaries in a row have a line with no digits between them
+    if (boundary[:-1] & boundary[1:]).any():
+        raise ValueError("every line needs at least one digit")
+
+    values = marks - ord('0')
+    return 10 * int(values[digit & boundary[:-2]].sum()) + int(values[digit & boundary[2:]].sum())
+
+
+# the chunks of the document being solved, which forked workers inherit rather than being sent a copy
+forked_chunks = []
+
+
+def forked_sum_lines(i) -> int:
+    return sum_lines(forked_chunks[i])
+
+
+def solve(document, workers=None):
+
+    """
+    Split the document into newline-aligned chunks and sum them in a pool of `workers` processes (default:
+    one per CPU), or in this process if there's only one chunk or one worker. The workers are forked, so they
+    share the document's memory (or memory map) with this process.
+    """
+
+    global forked_chunks
+
+    chunks = list(loader.chunks(document, CHUNK_BYTES))
+    workers = min(workers or os.cpu_count(), len(chunks))
+    if workers == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return sum(sum_lines(chunk) for chunk in chunks)
+
+    forked_chunks = chunks
+    try:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            return sum(pool.map(forked_sum_lines, range(len(chunks))))
+    finally:
+        forked_chunks = []
 
-# result = 0
-# for line in test_input:
-#     digits = get_digits(line) 
-#     calibration_value = digits[0] + digits[-1]
-#     result += int(calibration_value)
 
-result = 0
-for line in input:
-    digits = get_digits(line) 
-    calibration_value = digits[0] + digits[-1]
-    result += int(calibration_value)
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 142
 
+    with open('inputs/day1.txt') as f:
+        input = parse(f.read())
 
-print(result)
\ No newline at end of file
+    print(solve(input))
@@ -1,7 +1,18 @@
-import re
+import functools
 
-with open('inputs/day1.txt') as f:
-    input = [x for x in f.read().split('\n')]
+import numpy as np
+
+from aoc import loader
+from aoc.automaton import AhoCorasick
+
+
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+# the document is scanned this many bytes at a time, which bounds the size of the per-line arrays
+CHUNK_BYTES = 1 << 24
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
 
 test_input_raw = """two1nine
 eightwothree
@@ -11,21 +22,42 @@ xtwone3four
 zoneight234
 7pqrstsixteen"""
 
-test_input = [x for x in test_input_raw.split('\n')]
 
-digit_lookup = {word:digit+1 for digit,word in enumerate(['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine'])}
-for idx, digit in enumerate([1,2,3,4,5,6,7,8,9]):
-    digit_lookup[str(idx+1)] = digit
+@functools.cache
+def digit_scanner():
+
+    """An automaton finding the digits 1-9, spelled out or not, built on first use rather than at import."""
+
+    patterns = {word.encode(): digit for digit, word in enumerate(DIGIT_WORDS, 1)}
+    patterns.update({str(digit).encode(): digit for digit in range(1, 10)})
+    return AhoCorasick(patterns)
+
+
+def parse(raw):
+    return np.frombuffer(loader.as_buffer(raw), dtype=np.uint8)
+
+
+def sum_lines(chunk) -> int:
+
+    """
+    The sum of the calibration values of every line in chunk: each line's first and last digit, found in
+    one forward pass over its bytes. Overlapping words are both seen, so 'eightwo' ends in 2.
+    """
+
+    first, last = digit_scanner().first_and_last(chunk)
+    if not first.all():
+        raise ValueError("every line needs at least one digit")
+    return 10 * int(first.sum()) + int(last.sum())
+
+
+def solve(document):
+    return sum(sum_lines(chunk) for chunk in loader.chunks(document, CHUNK_BYTES))
 
-pattern = '|'.join(re.escape(word) for word in digit_lookup.keys())
 
-result = 0
-#for line in test_input:
-for line in input:
-    first_match = re.search(pattern, line)
-    last_match = re.search(pattern[::-1],line[::-1])
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 281
 
-    calibration_value = [digit_lookup[first_match.group()] * 10 + digit_lookup[last_match.group()[::-1]]][0]
-    result += calibration_value
+    with open('inputs/day1.txt') as f:
+        input = parse(f.read())
 
-print(result)
\ No newline at end of file
+    print(solve(input))
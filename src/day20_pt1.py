@@ -79,10 +79,7 @@ def process_pulses(pulse_queue):
         recipient.receive_pulse(sender, pulse)
 
 
-def cycle(input_str, times):
-
-    pulse_queue = deque()
-    modules = parse_input(input_str, pulse_queue)
+def cycle(modules, pulse_queue, times):
 
     for i in range(times):
         modules['button'].push()
@@ -261,15 +258,37 @@ test_input_raw_2 = """broadcaster -> a
 %b -> con
 &con -> output""" 
 
-with open("inputs/day20.txt") as f:
-    input_raw = f.read()
-
 
 high_pulses_sent = 0
 low_pulses_sent = 0
-cycle(input_raw, 1000)
- 
-# 1020211150
-result = high_pulses_sent * low_pulses_sent
-print(f"Part 1 result: {result}")
 
+
+def parse(raw):
+    pulse_queue = deque()
+    modules = parse_input(raw, pulse_queue)
+
+    return modules, pulse_queue
+
+
+def solve(parsed, times=1000):
+
+    global high_pulses_sent, low_pulses_sent
+    high_pulses_sent = 0
+    low_pulses_sent = 0
+
+    modules, pulse_queue = parsed
+    cycle(modules, pulse_queue, times)
+
+    return high_pulses_sent * low_pulses_sent
+
+
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw_1)) == 32000000
+    assert solve(parse(test_input_raw_2)) == 11687500
+
+    with open("inputs/day20.txt") as f:
+        parsed = parse(f.read())
+
+    # 1020211150
+    result = solve(parsed)
+    print(f"Part 1 result: {result}")
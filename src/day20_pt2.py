@@ -2,6 +2,9 @@ from collections import defaultdict, deque
 from enum import Enum
 from math import lcm 
 
+from aoc import trace
+
+
 def parse_input(input_str, pulse_queue):
     lines = input_str.split('\n')
 
@@ -119,7 +122,7 @@ class Module():
         #if destination.name in relevant_modules:
         if destination.name == 'nc' and pulse == Pulse.HIGH:
            #print(f"{self.name} -- {pulse} --> {destination}")
-           record[self.name].append(i)
+           record[self.name].append(button_presses)
         self.pulse_queue.append((self.name, destination, pulse))
 
 
@@ -261,60 +264,74 @@ test_input_raw_2 = """broadcaster -> a
 %b -> con
 &con -> output""" 
 
-with open("inputs/day20.txt") as f:
-    input_raw = f.read()
-
 
 high_pulses_sent = 0
 low_pulses_sent = 0
 
-pulse_queue = deque()
-modules = parse_input(input_raw, pulse_queue)
+# the button presses at which each module sent a high pulse to nc
+record = defaultdict(list)
+button_presses = 0
 
-# which modules connect directly to each other?
-module_connections = defaultdict(set)
-module_types = defaultdict(set)
-for module in modules.values():
 
-    # record the type of each module
-    module_types[module.name].add(module.__class__.__name__)
+def parse(raw):
+    pulse_queue = deque()
+    modules = parse_input(raw, pulse_queue)
 
-    # record the connections between modules
-    if hasattr(module, "destinations"):
-        for destination in module.destinations:
-            module_connections[module.name].add(destination.name)
-    else:
-        module_connections[module.name].add("None")
+    return modules, pulse_queue
 
 
-# modules that connect to nc -- if these are all high, a low pulse is sent to rx, so these are the ones we need to check
-relevant_modules = []
-for k,v in module_connections.items():
-    if 'nc' in v:
-        relevant_modules.append(k)
+def solve(parsed, times=10_000):
 
-# run through a number of iterations and figure out the period of the modules that connect to nc
-record = defaultdict(list)
-input_str = input_raw
-times = 10_000
-
-pulse_queue = deque()
-modules = parse_input(input_str, pulse_queue)
-
-for i in range(times):
-    modules['button'].push()
-    process_pulses(pulse_queue)
-
-periods = {}
-for module, ns in record.items():
-    period = ns[1] - ns[0]
-    print(f"{module} has period {period}")  
-    periods[module] = period
-
-# the result is the least common multiple of the periods of the modules that connect to nc
-# 238815727638557
-result = lcm(*periods.values())
-print("Part 2 result: ", result)
+    global high_pulses_sent, low_pulses_sent, record, button_presses
+    high_pulses_sent = 0
+    low_pulses_sent = 0
+
+    modules, pulse_queue = parsed
+
+    # which modules connect directly to each other?
+    module_connections = defaultdict(set)
+    module_types = defaultdict(set)
+    for module in modules.values():
+
+        # record the type of each module
+        module_types[module.name].add(module.__class__.__name__)
+
+        # record the connections between modules
+        if hasattr(module, "destinations"):
+            for destination in module.destinations:
+                module_connections[module.name].add(destination.name)
+        else:
+            module_connections[module.name].add("None")
+
+    # modules that connect to nc -- if these are all high, a low pulse is sent to rx, so these are the ones we need to check
+    relevant_modules = []
+    for k,v in module_connections.items():
+        if 'nc' in v:
+            relevant_modules.append(k)
+
+    # run through a number of iterations and figure out the period of the modules that connect to nc
+    record = defaultdict(list)
+    for button_presses in range(times):
+        modules['button'].push()
+        process_pulses(pulse_queue)
+
+    periods = {}
+    for module, ns in record.items():
+        period = ns[1] - ns[0]
+        trace.info('period', module=module, period=period)
+        periods[module] = period
+
+    # the result is the least common multiple of the periods of the modules that connect to nc
+    return lcm(*periods.values())
+
+
+if __name__ == '__main__':
+    with open("inputs/day20.txt") as f:
+        parsed = parse(f.read())
+
+    # 238815727638557
+    result = solve(parsed)
+    print("Part 2 result: ", result)
 
 
 
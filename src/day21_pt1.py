@@ -1,5 +1,7 @@
 import numpy as np
-import networkx as nx
+
+from aoc.graph import Graph
+from aoc.grid import Grid, EAST, SOUTH
 
 test_input_raw = """...........
 .....###.#.
@@ -14,64 +16,60 @@ test_input_raw = """...........
 ..........."""
 
 
-class GardenMap:
-
-    def __init__(self, raw_input):
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
 
-        lines = raw_input.split("\n")
-        lines = np.array([list(line) for line in lines])
 
-        self.nrows, self.ncols = len(lines), len(lines[0])
-        self.start_pos = tuple(np.argwhere(lines == "S")[0])
+class GardenMap:
 
-        self.garden_plots = np.zeros((self.nrows, self.ncols), dtype=np.int8)
-        self.garden_plots[lines == "."] = 1
-        self.garden_plots[self.start_pos[0], self.start_pos[1]] = 1
+    def __init__(self, raw_input):
 
-        self.rocks = np.zeros((self.nrows, self.ncols), dtype=np.int8)
-        self.rocks[lines == "#"] = 1
+        self.grid = Grid.from_input(raw_input)
+        self.start_pos = self.grid.find("S")
 
         self.g = None
         self.build_graph()
     
     def build_graph(self):
 
-        self.g = nx.Graph()
+        # a node, by flat index, for every cell; those that aren't rocks are joined to each neighbouring garden plot
+        open_cells = ~self.grid.mask("#")
+        garden_plots = self.grid.mask(".S")
+
+        sources, targets = [], []
+        for direction in [EAST, SOUTH]:
+            from_cells, to_cells = self.grid.pairs(open_cells, direction, garden_plots)
+            sources.append(from_cells)
+            targets.append(to_cells)
+
+        self.g = Graph(self.grid.size, np.concatenate(sources), np.concatenate(targets))
+
+
+def count_reachable_plots(garden_map, target_steps):
+
+    steps_to_nodes = garden_map.g.bfs(garden_map.start_pos, cutoff=target_steps)
+    reachable_nodes = (steps_to_nodes >= 0) & (steps_to_nodes % 2 == 0)
 
-        for row in range(self.nrows):
-            for col in range(self.ncols):
-                
-                if self.rocks[row, col] == 1:
-                    continue
+    return int(np.count_nonzero(reachable_nodes))
 
-                self.g.add_node((row, col))
-                
-                if col < self.ncols-1:
-                    if self.garden_plots[row, col+1] == 1:
-                        self.g.add_edge((row, col), (row, col+1))
 
-                if row < self.nrows-1 :
-                    if self.garden_plots[row+1, col] == 1:
-                        self.g.add_edge((row, col), (row+1, col))
 
+def parse(raw):
+    return GardenMap(raw)
 
-def count_reachable_plots(input_raw, target_steps):
-    garden_map = GardenMap(input_raw)
-    steps_to_nodes = nx.single_source_shortest_path_length(garden_map.g, garden_map.start_pos, cutoff=target_steps)
-    reachable_nodes = {(row, col): nsteps
-                      for (row, col), nsteps in steps_to_nodes.items()
-                      if nsteps % 2 == 0}
 
-    return len(reachable_nodes)
+def solve(garden_map, target_steps=64):
+    return count_reachable_plots(garden_map, target_steps)
 
 
-assert count_reachable_plots(test_input_raw, 6) == 16
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw), 6) == 16
 
-with open("inputs/day21.txt") as f:
-    input_raw = f.read()
+    with open("inputs/day21.txt") as f:
+        garden_map = parse(f.read())
 
-target_steps = 64
-result = count_reachable_plots(input_raw, target_steps=target_steps)
+    target_steps = 64
+    result = solve(garden_map, target_steps=target_steps)
 
-# 3716
-print(f"There are {result} nodes reachable in {target_steps} steps")
\ No newline at end of file
+    # 3716
+    print(f"There are {result} nodes reachable in {target_steps} steps")
@@ -1,36 +1,52 @@
 import math
 import numpy as np
-import pandas as pd
+from array import array
 from collections import deque
 
+from aoc.grid import Grid
+
+
+test_input_raw = """...........
+.....###.#.
+.###.##..#.
+..#.#...#..
+....#.#....
+.##..S####.
+.##..#...#.
+.......##..
+.##.#.####.
+.##..##.##.
+..........."""
+
+
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+
+ROCK = ord("#")
+
 
 class GardenMap:
 
     def __init__(self, raw_input):
 
-        lines = raw_input.split("\n")
-        lines = np.array([list(line) for line in lines])
-        self.nrows, self.ncols = len(lines), len(lines[0])
-        self.start = ((self.nrows-1)//2, (self.ncols-1)//2)
-        self.plots = self.parse_input(raw_input)
+        # the garden repeats forever in every direction
+        self.grid = Grid.from_input(raw_input, tiled=True)
+        self.start = ((self.grid.rows-1)//2, (self.grid.cols-1)//2)
 
-    def parse_input(self, raw_input):
-        lines = raw_input.split("\n")
-        lines = np.array([list(line) for line in lines])
-        nrows, ncols = len(lines), len(lines[0])
 
-        garden_plots = np.ones((nrows, ncols), dtype=np.int8)
-        garden_plots[lines == "."] = 0
-        garden_plots[lines == "S"] = 0
+def bfs_distance(grid, start, shape):
 
-        return garden_plots
+    """
+    Steps from start to every cell of a window of the given shape onto the tiled grid, whose top left is the
+    grid's top left: -1 for rocks, and for plots that can't be reached without leaving the window.
+    """
 
-
-def bfs_distance(grid, start):
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = shape
 
-    distances = [[-1 for _ in range(cols)] for _ in range(rows)]
+    # a C int per cell, rather than a list of lists of Python ints
+    distances = array('i', [-1]) * (rows * cols)
     
     # row, column, distance
     queue = deque([(start[0], start[1], 0)])
@@ -39,60 +55,60 @@ def bfs_distance(grid, start):
         r, c, dist = queue.popleft()
 
         # skip rocks, already visited or out of bounds
-        if r < 0 or r >= rows or c < 0 or c >= cols or grid[r][c] == 1 or distances[r][c] != -1:
+        if r < 0 or r >= rows or c < 0 or c >= cols or grid[r, c] == ROCK or distances[r * cols + c] != -1:
             continue
         
-        distances[r][c] = dist
+        distances[r * cols + c] = dist
         
         for dr, dc in directions:
             queue.append((r + dr, c + dc, dist + 1))
 
-    return np.array(distances)
+    return np.frombuffer(distances, dtype=np.intc).reshape(shape)
 
 
-class TiledGardenMap(GardenMap):
 
-    def __init__(self, raw_input, N):
+def parse(raw):
+    return GardenMap(raw)
 
-        super().__init__(raw_input)
 
-        self.plots = np.tile(self.plots, (N, N))
-        self.nrows, self.ncols = self.plots.shape
-        self.start = ((self.nrows-1)//2, (self.ncols-1)//2)
+def solve(garden_map, target_steps=26501365):
 
+    # generate some data we can fit a polynomial to;
+    num_reachable_plots = []
+    num_tilings = [1,5,9]  # odd number of tilings, to match the puzzle
+    num_steps = []
+    for N in num_tilings:
 
+        # N copies of the map across and down, with the start in the middle one
+        shape = (N * garden_map.grid.rows, N * garden_map.grid.cols)
+        start = ((shape[0]-1)//2, (shape[1]-1)//2)
+        tiling_steps = (shape[0] - 1) // 2
 
-with open("inputs/day21.txt") as f:
-    input_raw = f.read()
+        distances = bfs_distance(garden_map.grid, start, shape)
 
-# generate some data we can fit a polynomial to;
-num_reachable_plots = []
-num_tilings = [1,5,9]  # odd number of tilings, to match the puzzle
-num_steps = []
-for N in num_tilings:
+        # plots are reachable if:
+        #  they are not rocks
+        #  the distance is less than the target steps 
+        #  the parity of the distance is the same as parity of the target steps
+        reachable = (
+            (distances >= 0) & \
+            (distances <= tiling_steps) & \
+            ((distances % 2) == (tiling_steps % 2))
+        ) 
 
-    garden = TiledGardenMap(input_raw, N=N)
-    target_steps = (garden.nrows - 1) // 2
+        num_reachable_plots.append(np.sum(reachable))
+        num_steps.append(tiling_steps)
 
-    distances = bfs_distance(garden.plots, garden.start)
+    coefficients = np.polyfit(num_steps, num_reachable_plots, 2)
+    result = coefficients[0] * target_steps**2 + coefficients[1] * target_steps + coefficients[2]
 
-    # plots are reachable if:
-    #  they are not rocks
-    #  the distance is less than the target steps 
-    #  the parity of the distance is the same as parity of the target steps
-    reachable = (
-        (distances >= 0) & \
-        (distances <= target_steps) & \
-        ((distances % 2) == (target_steps % 2))
-    ) 
+    return result
 
-    num_reachable_plots.append(np.sum(reachable))
-    num_steps.append(target_steps)
 
-    
-target_steps = 26501365
-coefficients = np.polyfit(num_steps, num_reachable_plots, 2)
-result = coefficients[0] * target_steps**2 + coefficients[1] * target_steps + coefficients[2]
+if __name__ == '__main__':
+    with open("inputs/day21.txt") as f:
+        garden_map = parse(f.read())
 
-# 616583483179597
-print(f"Part 2 result: {result}")
\ No newline at end of file
+    # 616583483179597
+    result = solve(garden_map)
+    print(f"Part 2 result: {result}")
@@ -1,6 +1,7 @@
-import networkx as nx
 import numpy as np
 
+from aoc.graph import Graph
+
 
 def parse_input(input_raw: str):
     bricks = {}
@@ -29,97 +30,117 @@ test_input_raw = """1,0,1~1,2,1
 0,1,6~2,1,6
 1,1,8~1,1,9"""
 
-with open('inputs/day22.txt', 'r') as f:
-    input_raw = f.read()
 
-#bricks = parse_input(test_input_raw)
-bricks = parse_input(input_raw)
+def parse(raw):
+    return parse_input(raw)
+
 
-# we'll create a 3d numpy array to represent the grid
-max_x = max([x for coords in bricks.values() for x,_,_ in coords])
-max_y = max([y for coords in bricks.values() for _,y,_ in coords])
-max_z = max([z for coords in bricks.values() for _,_,z in coords])
+def prepare(bricks):
 
-# we'll add 1 to each dimension so indexes match the brick positions
-brick_array = np.zeros((max_x+1, max_y+1, max_z+1), dtype=int)
-for brick_id, cubes in bricks.items():
-    for (x, y, z) in cubes:
-        brick_array[x, y, z] = brick_id 
+    """Drop the bricks until none of them can fall any further. Both parts start from the settled stack."""
 
-# mark the floor
-brick_array[:, :, 0] = -1
+    # we'll create a 3d numpy array to represent the grid
+    max_x = max([x for coords in bricks.values() for x,_,_ in coords])
+    max_y = max([y for coords in bricks.values() for _,y,_ in coords])
+    max_z = max([z for coords in bricks.values() for _,_,z in coords])
 
-# we'll iterate through the bricks and check if they can fall
-finished = False
-while not finished:
-    falling_brick_count = 0
+    # we'll add 1 to each dimension so indexes match the brick positions
+    brick_array = np.zeros((max_x+1, max_y+1, max_z+1), dtype=int)
     for brick_id, cubes in bricks.items():
+        for (x, y, z) in cubes:
+            brick_array[x, y, z] = brick_id 
+
+    # mark the floor
+    brick_array[:, :, 0] = -1
+
+    # we'll iterate through the bricks and check if they can fall
+    finished = False
+    while not finished:
+        falling_brick_count = 0
+        for brick_id, cubes in bricks.items():
+
+            # cubes beneath the brick's cubes that are not part of the brick
+            beneath = [(x, y, z-1) 
+                       for (x,y,z) in cubes
+                       if brick_array[(x, y, z-1)] != brick_id]
+
+            x_beneath, y_beneath, z_beneath = zip(*beneath)
+
+            # if the area beneath is all empty, the brick falls
+            if np.all(brick_array[x_beneath, y_beneath, z_beneath] == 0):
+                #print(f"Brick {brick_id} fell")
+                new_cubes = [(x, y, z-1) for (x,y,z) in cubes]
+                x_new, y_new, z_new = zip(*new_cubes)
+                x_old, y_old, z_old = zip(*cubes)
+
+                # update the array
+                brick_array[x_old, y_old, z_old] = 0
+                brick_array[x_new, y_new, z_new] = brick_id
+
+                # update the brick
+                bricks[brick_id] = new_cubes
+
+                falling_brick_count += 1
 
-        # cubes beneath the brick's cubes that are not part of the brick
+        if falling_brick_count == 0:
+            finished = True 
+
+    return bricks, brick_array
+
+
+def solve(settled):
+    bricks, brick_array = settled
+
+    # which bricks support which other bricks?
+    supported_by = {}
+    for brick_id, cubes in bricks.items():
+    
+        # different from part 1: we also consider the floor as a support
         beneath = [(x, y, z-1) 
                    for (x,y,z) in cubes
                    if brick_array[(x, y, z-1)] != brick_id]
 
-        x_beneath, y_beneath, z_beneath = zip(*beneath)
+        below_x_indices, below_y_indices, below_z_indices = zip(*beneath)
+        cubes_below = brick_array[below_x_indices, below_y_indices, below_z_indices]
+        bricks_below = set([b_id for b_id in cubes_below if b_id not in [0, brick_id]])
+        supported_by[brick_id] = bricks_below
 
-        # if the area beneath is all empty, the brick falls
-        if np.all(brick_array[x_beneath, y_beneath, z_beneath] == 0):
-            #print(f"Brick {brick_id} fell")
-            new_cubes = [(x, y, z-1) for (x,y,z) in cubes]
-            x_new, y_new, z_new = zip(*new_cubes)
-            x_old, y_old, z_old = zip(*cubes)
+    # create a directed graph, from each brick to the bricks (or floor, -1) it rests on
+    g = Graph.from_adjacency(supported_by, directed=True)
+    floor = g.index[-1]
 
-            # update the array
-            brick_array[x_old, y_old, z_old] = 0
-            brick_array[x_new, y_new, z_new] = brick_id
+    # supports come before the bricks they hold up
+    order = g.topological_order()[::-1]
 
-            # update the brick
-            bricks[brick_id] = new_cubes
+    # let's say I remove a brick: a brick above it falls if everything it rests on has fallen, which we can
+    # settle for each brick in turn, since the ones it rests on have already been settled
+    falling_bricks = {}
+    for position, node in enumerate(order):
 
-            falling_brick_count += 1
+        # don't consider removing the floor 
+        if node == floor:
+            continue
 
-    if falling_brick_count == 0:
-        finished = True 
-    
-# which bricks support which other bricks?
-supported_by = {}
-for brick_id, cubes in bricks.items():
-    
-    # different from part 1: we also consider the floor as a support
-    beneath = [(x, y, z-1) 
-               for (x,y,z) in cubes
-               if brick_array[(x, y, z-1)] != brick_id]
-
-    below_x_indices, below_y_indices, below_z_indices = zip(*beneath)
-    cubes_below = brick_array[below_x_indices, below_y_indices, below_z_indices]
-    bricks_below = set([b_id for b_id in cubes_below if b_id not in [0, brick_id]])
-    supported_by[brick_id] = bricks_below
-
-# create a directed graph
-g = nx.DiGraph(supported_by).reverse()
-
-# let's say I remove a node from the graph -- for which nodes does the graph become disconnected?
-# the falling bricks are the size of the connected components that do not contain the floor
-falling_bricks = {}
-for node in g.nodes():
-
-    # don't consider removing the floor 
-    if node == -1:
-        continue
-    
-    g2 = g.copy()
-    g2.remove_node(node)
+        fallen = bytearray(g.n)
+        fallen[node] = 1
+
+        # only bricks later in the order can be resting on this one, directly or not
+        falling_bricks[node] = 0
+        for brick in order[position + 1:]:
+            if all(fallen[support] for support in g.neighbours(brick)):
+                fallen[brick] = 1
+                falling_bricks[node] += 1
 
-    # falling bricks are ones that have now become unreachable from the floor
-    connected_to_floor_before_deletion = set(nx.descendants(g, -1))
-    connected_to_floor_after_deletion = set(nx.descendants(g2, -1))
+    return sum(falling_bricks.values())
 
 
-    # fallings bricks are the difference between the two sets, if we remember to remove the node itself
-    falling_bricks[node] = connected_to_floor_before_deletion - connected_to_floor_after_deletion - {node}
+if __name__ == '__main__':
+    with open('inputs/day22.txt', 'r') as f:
+        bricks = parse(f.read())
 
+    #bricks = parse(test_input_raw)
 
-result = sum([len(v) for k, v in falling_bricks.items()])
+    result = solve(prepare(bricks))
 
-# 60963
-print(f"Part 2: {result} bricks will fall.")
\ No newline at end of file
+    # 60963
+    print(f"Part 2: {result} bricks will fall.")
@@ -1,47 +1,56 @@
-import networkx as nx
 import numpy as np
 
+from aoc.graph import Graph
+from aoc.grid import Grid, NORTH, SOUTH, EAST, WEST
+
+
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
+# the one way each slope can be walked
+SLOPES = {NORTH: "^", SOUTH: "v", EAST: ">", WEST: "<"}
+
+
 def parse_input(input_raw):
-    trails = {}
-
-    lines = input_raw.split("\n")
-    nrows = len(lines)
-    ncols = len(lines[0])
-
-    for i, line in enumerate(lines):
-        for j, val in enumerate(line):
-            if val == ".":
-                connections = [(i+1,j), (i-1,j), (i,j+1), (i,j-1)]
-            elif val == ">":
-                 connections = [(i,j+1)]
-            elif val == "<":
-                connections = [(i,j-1)]
-            elif val == "^":
-                connections = [(i-1,j)]
-            elif val == "v":
-                connections = [(i+1,j)]
-            elif val == "#":
-                connections = None
-            else:
-                raise ValueError(f"Unknown character {val}")
-        
-            # only connect non-wall cells in range
-            if connections is not None:
-                trails[(i,j)] = [(row, col) 
-                                for (row, col) in connections 
-                                if 0 <= row < nrows and 0 <= col < ncols and lines[row][col] != "#"]
-
-    g = nx.DiGraph(trails)
+    grid = Grid.from_input(input_raw)
+
+    unknown = grid.cells[~grid.mask(".#<>^v")]
+    if len(unknown):
+        raise ValueError(f"Unknown character {chr(unknown[0])}")
+
+    # a node for every non-wall cell, by its flat index into the grid
+    trails = ~grid.mask("#")
+
+    # paths lead every way and slopes only downhill, onto any non-wall cell in range
+    sources, targets = [], []
+    for direction, slope in SLOPES.items():
+        from_cells, to_cells = grid.pairs(grid.mask("." + slope), direction, trails)
+        sources.append(from_cells)
+        targets.append(to_cells)
+
+    g = Graph(grid.size, np.concatenate(sources), np.concatenate(targets), directed=True)
 
     # we start at the only path cell in the first row
-    start = [pos for pos in trails if pos[0] == 0][0]
+    start = grid.index(0, int(np.flatnonzero(trails[0])[0]))
 
     # and end at the only path cell in the last row
-    end = [pos for pos in trails if pos[0] == nrows-1][0]
+    end = grid.index(grid.rows-1, int(np.flatnonzero(trails[-1])[0]))
             
     return start, end, g
 
 
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(parsed):
+
+    start, end, g = parsed
+
+    # the length of a path is its number of steps, which doesn't count the start
+    return g.longest_path(start, end)
+
+
 test_input_raw = """#.#####################
 #.......#########...###
 #######.#########.#.###
@@ -67,24 +76,11 @@ test_input_raw = """#.#####################
 #####################.#"""
 
 
-with open("inputs/day23.txt", "r") as f:
-    input_raw = f.read()
-
-#start, end, g = parse_input(test_input_raw)
-start, end, g = parse_input(input_raw)
-
-all_paths = nx.all_simple_paths(g, start, end)
-
-paths = []
-path_lengths = []
-for path in all_paths:
-    paths.append(path)
-    path_lengths.append(len(path)-1)  # dont count the start
-
-longest_path_idx = np.argmax(path_lengths)
-longest_path = paths[longest_path_idx]
+if __name__ == '__main__':
+    with open("inputs/day23.txt", "r") as f:
+        parsed = parse(f.read())
 
-result = path_lengths[longest_path_idx]
+    #parsed = parse(test_input_raw)
 
-# 2202
-print(f"Part 1 result: {result}")
\ No newline at end of file
+    # 2202
+    print(f"Part 1 result: {solve(parsed)}")
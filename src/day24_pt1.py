@@ -1,6 +1,4 @@
 import numpy as np
-import sympy as sp
-import matplotlib.pyplot as plt
 
 from dataclasses import dataclass
 from itertools import combinations
@@ -38,6 +36,8 @@ def parse_input(input_raw):
 
 def get_intersection_times(a, b):
 
+    import sympy as sp
+
     t_a = sp.symbols('t_a')
     t_b = sp.symbols('t_b')
     
@@ -48,52 +48,53 @@ def get_intersection_times(a, b):
     return solution
 
 
-test_input_raw = """19, 13, 30 @ -2,  1, -2
-18, 19, 22 @ -1, -1, -2
-20, 25, 34 @ -2, -2, -4
-12, 31, 28 @ -1, -2, -1
-20, 19, 15 @  1, -5, -3"""
+def parse(raw):
+    return parse_input(raw)
 
 
-with open("inputs/day24.txt", "r") as f:
-    input_raw = f.read()
+def solve(hailstones, test_area_x=(200000000000000,400000000000000), test_area_y=(200000000000000,400000000000000)):
 
-# hailstones = parse_input(test_input_raw)
-# test_area_x = (7,27)
-# test_area_y = (7,27)
+    intersection_times = {}
+    for i,j in combinations(range(len(hailstones)), 2):
+        intersection_times[(i,j)] = get_intersection_times(hailstones[i], hailstones[j])
 
-hailstones = parse_input(input_raw)
-test_area_x = (200000000000000,400000000000000)
-test_area_y = (200000000000000,400000000000000)
+    # limit to the test area and time >= 0
+    in_test_area = []
+    for (i,j), soln in intersection_times.items():
 
+        if len(soln) == 0:
+            continue
 
-intersection_times = {}
-for i,j in combinations(range(len(hailstones)), 2):
-    intersection_times[(i,j)] = get_intersection_times(hailstones[i], hailstones[j])
+        t_a, t_b = list(soln.values())
 
-# limit to the test area and time >= 0
-in_test_area = []
-for (i,j), soln in intersection_times.items():
+        # check if the solution is in the past for either hailstone
+        if t_a < 0 or t_b < 0:
+            continue
 
-    if len(soln) == 0:
-        continue
+        else:
+            x = hailstones[i].vx * t_a + hailstones[i].px
+            y = hailstones[i].vy * t_a + hailstones[i].py
 
-    t_a, t_b = list(soln.values())
+            # check if the solution is in the test area
+            if (test_area_x[0] <= x <= test_area_x[1]) and (test_area_y[0] <= y <= test_area_y[1]):
+                in_test_area.append((i, j, x.evalf(), y.evalf()))
 
-    # check if the solution is in the past for either hailstone
-    if t_a < 0 or t_b < 0:
-        continue
+    return len(in_test_area)
 
-    else:
-        x = hailstones[i].vx * t_a + hailstones[i].px
-        y = hailstones[i].vy * t_a + hailstones[i].py
 
-        # check if the solution is in the test area
-        if (test_area_x[0] <= x <= test_area_x[1]) and (test_area_y[0] <= y <= test_area_y[1]):
-            in_test_area.append((i, j, x.evalf(), y.evalf()))
+test_input_raw = """19, 13, 30 @ -2,  1, -2
+18, 19, 22 @ -1, -1, -2
+20, 25, 34 @ -2, -2, -4
+12, 31, 28 @ -1, -2, -1
+20, 19, 15 @  1, -5, -3"""
+
 
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw), test_area_x=(7,27), test_area_y=(7,27)) == 2
 
-result = len(in_test_area)
+    with open("inputs/day24.txt", "r") as f:
+        hailstones = parse(f.read())
 
-# 15318
-print(f"Part 1 result: {result} intersections in the test area") 
+    # 15318
+    result = solve(hailstones)
+    print(f"Part 1 result: {result} intersections in the test area") 
@@ -1,6 +1,4 @@
 import numpy as np
-import sympy as sp
-import matplotlib.pyplot as plt
 
 from dataclasses import dataclass
 
@@ -34,42 +32,52 @@ def parse_input(input_raw):
     return hailstones
 
 
-test_input_raw = """19, 13, 30 @ -2,  1, -2
-18, 19, 22 @ -1, -1, -2
-20, 25, 34 @ -2, -2, -4
-12, 31, 28 @ -1, -2, -1
-20, 19, 15 @  1, -5, -3"""
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(hailstones):
+
+    import sympy as sp
 
+    # find the position and velocity of a rock that intersects with 3 rocks
+    # 9 unknowns: 3 variables for the rock's velocity, 3 variables for the rock's position, 3 variables for the intersection times
+    px, py, pz, vx, vy, vz, t1, t2, t3 = sp.symbols('px, py, pz, vx, vy, vz, t1, t2, t3')
 
-with open("inputs/day24.txt", "r") as f:
-    input_raw = f.read()
+    equations = [
+        px + vx * t1 - hailstones[0].px - hailstones[0].vx * t1,
+        py + vy * t1 - hailstones[0].py - hailstones[0].vy * t1,
+        pz + vz * t1 - hailstones[0].pz - hailstones[0].vz * t1,
 
-#hailstones = parse_input(test_input_raw)
-hailstones = parse_input(input_raw)
+        px + vx * t2 - hailstones[1].px - hailstones[1].vx * t2,
+        py + vy * t2 - hailstones[1].py - hailstones[1].vy * t2,
+        pz + vz * t2 - hailstones[1].pz - hailstones[1].vz * t2,
 
-# find the position and velocity of a rock that intersects with 3 rocks
-# 9 unknowns: 3 variables for the rock's velocity, 3 variables for the rock's position, 3 variables for the intersection times
-px, py, pz, vx, vy, vz, t1, t2, t3 = sp.symbols('px, py, pz, vx, vy, vz, t1, t2, t3')
+        px + vx * t3 - hailstones[2].px - hailstones[2].vx * t3,
+        py + vy * t3 - hailstones[2].py - hailstones[2].vy * t3,
+        pz + vz * t3 - hailstones[2].pz - hailstones[2].vz * t3
 
-equations = [
-    px + vx * t1 - hailstones[0].px - hailstones[0].vx * t1,
-    py + vy * t1 - hailstones[0].py - hailstones[0].vy * t1,
-    pz + vz * t1 - hailstones[0].pz - hailstones[0].vz * t1,
+    ]
 
-    px + vx * t2 - hailstones[1].px - hailstones[1].vx * t2,
-    py + vy * t2 - hailstones[1].py - hailstones[1].vy * t2,
-    pz + vz * t2 - hailstones[1].pz - hailstones[1].vz * t2,
+    solution = sp.solve(equations, px, py, pz, vx, vy, vz, t1, t2, t3)[0]
 
-    px + vx * t3 - hailstones[2].px - hailstones[2].vx * t3,
-    py + vy * t3 - hailstones[2].py - hailstones[2].vy * t3,
-    pz + vz * t3 - hailstones[2].pz - hailstones[2].vz * t3
+    # sum of px, py, pz
+    return solution[0] + solution[1] + solution[2]
+
+
+test_input_raw = """19, 13, 30 @ -2,  1, -2
+18, 19, 22 @ -1, -1, -2
+20, 25, 34 @ -2, -2, -4
+12, 31, 28 @ -1, -2, -1
+20, 19, 15 @  1, -5, -3"""
 
-]
 
-solution = sp.solve(equations, px, py, pz, vx, vy, vz, t1, t2, t3)[0]
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 47
 
-# sum of px, py, pz
-result = solution[0] + solution[1] + solution[2]
+    with open("inputs/day24.txt", "r") as f:
+        hailstones = parse(f.read())
 
-# 870379016024859
-print(f"Part 2 result: {result}")
+    # 870379016024859
+    result = solve(hailstones)
+    print(f"Part 2 result: {result}")
@@ -1,8 +1,13 @@
-import networkx as nx
 import numpy as np
 
 from itertools import combinations
 
+from aoc.graph import Graph
+
+
+# solve counts the nodes its min-cut searches visit against a Budget
+BUDGETED = True
+
 
 def parse_input(input_raw):
     lines = input_raw.strip().split('\n')
@@ -16,8 +21,25 @@ def parse_input(input_raw):
     return parsed
 
 
-with open('inputs/day25.txt', 'r') as f:
-    input_raw = f.read()
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(connections, budget=None):
+
+    g = Graph.from_adjacency(connections)
+
+    for source, sink in combinations(range(g.n), 2):
+
+        if source != sink:
+            cut_value, reachable = g.min_cut(source, sink, budget)
+
+            # all weights are 1, so the cut value is the number of edges between the two sets
+            if cut_value == 3:
+                break 
+
+    return int(np.count_nonzero(reachable) * np.count_nonzero(~reachable))
+
 
 test_input_raw = """jqt: rhn xhk nvd
 rsh: frs pzl lsr
@@ -34,26 +56,12 @@ rzs: qnr cmg lsr rsh
 frs: qnr lhk lsr"""
 
 
-#connections = parse_input(test_input_raw)
-connections = parse_input(input_raw)
-
-g = nx.DiGraph()
-
-for source, targets in connections.items():
-    for target in targets:
-        g.add_edge(source, target, weight=1)
-        g.add_edge(target, source, weight=1)
-
-for source, sink in combinations(g.nodes, 2):
-
-    if source != sink:
-        cut_value, (reachable, non_reachable) = nx.minimum_cut(g, source, sink, capacity='weight')
-
-        # all weights are 1, so the cut value is the number of edges between the two sets
-        if cut_value == 3:
-            break 
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 54
 
-result = len(reachable) * len(non_reachable)
+    with open('inputs/day25.txt', 'r') as f:
+        connections = parse(f.read())
 
-# 562772
-print(f"Part 1 solution is {result}")
\ No newline at end of file
+    # 562772
+    result = solve(connections)
+    print(f"Part 1 solution is {result}")
@@ -1,4 +1,10 @@
-import re
+import numpy as np
+
+from aoc import games
+
+
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
 
 test_input_raw = """Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
 Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
@@ -6,60 +12,52 @@ Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
 Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
 Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"""
 
-test_flag = False
 
-if test_flag is True:
-    input = [x for x in test_input_raw.split('\n')]
-else:
-    with open('inputs/day2.txt') as f:
-        input = [x for x in f.read().split('\n')]
+def parse(raw):
+    return games.parse_maxima(raw)
 
 
-def parse_games(input):
-    parsed_games = {}
-    for game in input:
-        parts = [part.strip() for part in re.split(';|:', game)]
-        game_number = int(parts[0].split(' ')[1])
+#bag = 12 red cubes, 13 green cubes, and 14 blue cubes
+bag = {'red':12, 'green':13, 'blue':14}
 
-        draws = [re.split(',', part) for part in parts[1:]]
-        parsed_draws = []
-        for draw in draws:
-            parsed_draw = {colour:int(count) for count,colour in [re.split(' ', x.strip()) for x in draw]}
-            parsed_draws.append(parsed_draw)
+# feasible_sum compares about this many bag and game colours at a time, which bounds its memory
+QUERY_ELEMENTS = 1 << 22
 
-        parsed_games[game_number] = parsed_draws
 
-    return parsed_games
+def bag_limits(colours, bags) -> np.ndarray:
 
+    """The cubes of each colour in each bag, limits[bag, colour]: as many as could ever be drawn, for a colour the bag doesn't mention."""
 
+    unlimited = np.iinfo(np.int32).max
+    limits = np.array([[bag.get(colour, unlimited) for colour in colours] for bag in bags], dtype=np.int64)
+    return limits.reshape(len(bags), len(colours))
 
-#bag = 12 red cubes, 13 green cubes, and 14 blue cubes
-bag = {'red':12, 'green':13, 'blue':14}
 
-parsed_games = parse_games(input)
+def feasible_sum(maxima: games.Maxima, bags) -> np.ndarray:
+
+    """
+    For each bag, a dict of colour -> cubes in it, the sum of the numbers of the games it makes possible.
+    Every bag is compared with every distinct row at once, QUERY_ELEMENTS comparisons at a time.
+    Colours a bag doesn't mention are ignored.
+    """
 
-result = 0
-for game_number, draws in parsed_games.items():
-    print(f'Game {game_number}:')
-    print(f'  Bag: {bag}')
-    print(f'  Draws: {draws}')
+    limits = bag_limits(maxima.colours, bags)
 
-    impossible_draw = False
-    for draw in draws:
-        if impossible_draw is True:
-            break
-        for colour in bag.keys():
+    sums = np.empty(len(bags), dtype=np.int64)
+    step = max(1, QUERY_ELEMENTS // max(1, maxima.distinct.size))
+    for start in range(0, len(bags), step):
+        fits = (maxima.distinct <= limits[start:start + step, np.newaxis]).all(axis=2)
+        sums[start:start + step] = fits.astype(np.int64) @ maxima.totals
 
-            number_in_bag = bag[colour]
-            number_in_draw = draw.get(colour, 0)
-            if number_in_draw > number_in_bag:
-                print(f'    Invalid draw: {number_in_draw} {colour} cubes, only {number_in_bag} in bag')
-                impossible_draw = True
+    return sums
 
-    if impossible_draw is False:
-        result += game_number
 
-    print()
+def solve(maxima):
+    return int(feasible_sum(maxima, [bag])[0])
 
-print(result)
 
+if __name__ == '__main__':
+    with open('inputs/day2.txt') as f:
+        parsed_games = parse(f.read())
+
+    print(solve(parsed_games))
@@ -1,8 +1,9 @@
-import re
-from dataclasses import dataclass
-from typing import List, Set
+from aoc import scratchcards, trace
 
 
+# parse can read the input file straight from a memory map
+MAPPED_INPUT = True
+
 test_input_raw = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
 Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
 Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
@@ -11,88 +12,44 @@ Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
 Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11"""
 
 
-def parse_pile(raw: str) -> 'Pile':
-
-    """Parse the raw input into a Pile object, containing Scratchcard objects."""
-
-    scratchcards = []
-    for line in raw.splitlines():
-        new_scratchcard = parse_scratchcard(line)
-        scratchcards.append(new_scratchcard)
-
-    return Pile(scratchcards=scratchcards)
+def parse(raw):
+    return scratchcards.parse_pile(raw)
 
-def parse_scratchcard(line: str) -> 'Scratchcard':
 
-    """Parse one line of the raw input into a Scratchcard object."""
+def solve(pile):
 
-    card_name, numbers = line.split(': ')
-    card_number = int(re.search(r'\d+', card_name).group())
+    """
+    How many cards there are by the end, counting the copies won: a card with n matching numbers wins a copy
+    of each of the next n cards, for every copy of it there is. Cards are numbered consecutively, so the next
+    n cards are the next n rows of the pile.
+    """
 
-    winning_numbers, revealed_numbers = numbers.split(' | ')
+    debug = trace.enabled(trace.DEBUG)
+    matches = pile.matches().tolist()
 
-    winning_numbers = {int(num) for num in winning_numbers.split()}
-    revealed_numbers = {int(num) for num in revealed_numbers.split()}
+    # won[card] is the change, from the card before, in the copies earlier cards have won of it, so a card
+    # winning copies of a run of cards is two additions, however long the run
+    won = [0] * (len(matches) + max(matches, default=0) + 1)
+    copies_won = 0
+    total = 0
+    for card, matching in enumerate(matches):
+        copies_won += won[card]
+        copies = copies_won + 1
+        total += copies
 
-    return Scratchcard(card_number, winning_numbers, revealed_numbers)
+        if debug:
+            trace.event('scratchcard', id=int(pile.ids[card]), copies=copies, matching_numbers=matching)
 
-@dataclass
-class Scratchcard:
-    id: int
-    winning_numbers: Set[int]      
-    revealed_numbers: Set[int]  
-    matching_numbers: Set[int] = None
-    value: int = None
+        won[card + 1] += copies
+        won[card + 1 + matching] -= copies
 
-    def __post_init__(self):
-        """Calculate the value of the scratchcard."""
-        self.matching_numbers = len(self.winning_numbers.intersection(self.revealed_numbers))
-        if self.matching_numbers == 0:
-            self.value = 0
-        else:
-            self.value = 2**(self.matching_numbers-1)
+    return total
 
 
-@dataclass
-class Pile:
-    scratchcards: List[Scratchcard]
-    value: int = None
+if __name__ == '__main__':
+    assert solve(parse(test_input_raw)) == 30
 
-    def __post_init__(self):
-        """Calculate the value of the pile."""
-        self.value = sum([scratchcard.value for scratchcard in self.scratchcards])
-
-
-test_flag = False
-
-if test_flag is True:
-    pile = parse_pile(test_input_raw)
-else:
     with open('inputs/day4.txt') as f:
-        input_raw = f.read()
-        pile = parse_pile(input_raw)
-
-#print(f"The value of the pile is: {pile.value}")
-
-
-scratchcard_counts = {sc.id:1 for sc in pile.scratchcards}
-for scratchcard in pile.scratchcards:
-
-    num_copies = scratchcard_counts[scratchcard.id]
-
-    print(scratchcard)
-    print(f"Number of copies: {num_copies}")
-    if scratchcard.matching_numbers > 0: 
-
-        # for each matching number, create a new scratchcard. Do this for every current copy of the scratchcard
-        new_scratchcard_ids = [scratchcard.id + x for x in range(1, scratchcard.matching_numbers+1)]
-
-        print(f"New Scratchcards: {new_scratchcard_ids}")
-        for new_id in new_scratchcard_ids:
-            scratchcard_counts[new_id] += num_copies
-
-    print('')
+        pile = parse(f.read())
 
-result = sum(scratchcard_counts.values())
-print(scratchcard_counts)
-print(result)
\ No newline at end of file
+    print(solve(pile))
@@ -107,26 +107,25 @@ class Almanac:
 
 
 
+def parse(raw):
+    return parse_almanac(raw)
 
-test_flag = False
 
-if test_flag is True:
-    almanac = parse_almanac(test_input_raw)
+def solve(almanac):
+    seed_locations = [almanac.get_seed_location(seed) for seed in almanac.seeds]
+    return min(seed_locations)
 
-    assert almanac.lookup('seed-to-soil', 79) == 81
-    assert almanac.lookup('seed-to-soil', 14) == 14
-    assert almanac.lookup('seed-to-soil', 55) == 57
-    assert almanac.lookup('seed-to-soil', 13) == 13
 
-else:
-    with open('inputs/day5.txt') as f:
-        input_raw = f.read()
-        almanac = parse_almanac(input_raw)
+if __name__ == '__main__':
+    test_almanac = parse(test_input_raw)
 
-seed_locations = [almanac.get_seed_location(seed) for seed in almanac.seeds]
-result = min(seed_locations)
+    assert test_almanac.lookup('seed-to-soil', 79) == 81
+    assert test_almanac.lookup('seed-to-soil', 14) == 14
+    assert test_almanac.lookup('seed-to-soil', 55) == 57
+    assert test_almanac.lookup('seed-to-soil', 13) == 13
+    assert solve(test_almanac) == 35
 
-print(almanac)
-print(seed_locations)
-print(result)
+    with open('inputs/day5.txt') as f:
+        almanac = parse(f.read())
 
+    print(solve(almanac))
@@ -5,6 +5,9 @@ from dataclasses import dataclass
 from typing import List, Set, Dict
 from collections import namedtuple, defaultdict
 
+from aoc import trace
+from aoc.budget import Budget, BudgetExceeded
+
 
 test_input_raw = """seeds: 79 14 55 13
 
@@ -151,23 +154,11 @@ already_checked = {
 }
 
 
-test_flag = False
-
-if test_flag is True:
-    almanac = parse_almanac(test_input_raw)
-
-    assert almanac.lookup('seed-to-soil', 79) == 81
-    assert almanac.lookup('seed-to-soil', 14) == 14
-    assert almanac.lookup('seed-to-soil', 55) == 57
-    assert almanac.lookup('seed-to-soil', 13) == 13
-
-else:
-    with open('inputs/day5.txt') as f:
-        input_raw = f.read()
-        almanac = parse_almanac(input_raw)
+def parse(raw):
+    return parse_almanac(raw)
 
 
-def location_has_seed(location):
+def location_has_seed(almanac, location):
     """does this location correspond to any of the initial seed numbers?"""
     seed = almanac.get_location_seed(location)
 
@@ -178,27 +169,58 @@ def location_has_seed(location):
         return False
 
 
-# check if a location corresponds to any of the initial seed numbers
-best_seed = None
-best_location = None
 #location = 59370572  #best seed: 1623310249, best location: 59370572 
-upper_limit = 59370572  #part 1 answer 
-for location in range(0,upper_limit+1):
-
-    if best_location is not None:
-        break
-    if best_seed is None:
-        #print(f"checking location: {location}")
-        seed = almanac.get_location_seed(location)
-        print(f"location: {location}, seed: {seed}")
-        print()
-        if location_has_seed(location):
-            best_seed = seed 
-            best_location = location    
-        else:
-            continue
-
-    location == 1
-
-print(f"best seed: {best_seed}, best location: {best_location}")
+UPPER_LIMIT = 59370572  #part 1 answer 
+
+# solve counts the locations it checks against a Budget
+BUDGETED = True
+
+
+def solve(almanac, budget=None):
+
+    debug = trace.enabled(trace.DEBUG)
+    if budget is None:
+        budget = Budget()
+
+    # check if a location corresponds to any of the initial seed numbers
+    best_seed = None
+    best_location = None
+    for location in range(0,UPPER_LIMIT+1):
+
+        if best_location is not None:
+            break
+        if best_seed is None:
+            try:
+                budget.step()
+            except BudgetExceeded as exceeded:
+                # every lower location has been ruled out, so the answer is at least this
+                exceeded.partial = location
+                raise
+
+            #print(f"checking location: {location}")
+            seed = almanac.get_location_seed(location)
+            if debug:
+                trace.event('location', location=location, seed=seed)
+            if location_has_seed(almanac, location):
+                best_seed = seed 
+                best_location = location    
+            else:
+                continue
+
+    trace.info('best', seed=best_seed, location=best_location)
+
+    return best_location
+
+
+if __name__ == '__main__':
+    test_almanac = parse(test_input_raw)
+
+    assert test_almanac.lookup('seed-to-soil', 79) == 81
+    assert test_almanac.lookup('seed-to-soil', 14) == 14
+    assert test_almanac.lookup('seed-to-soil', 55) == 57
+    assert test_almanac.lookup('seed-to-soil', 13) == 13
+
+    with open('inputs/day5.txt') as f:
+        almanac = parse(f.read())
 
+    print(solve(almanac))
@@ -5,6 +5,8 @@ from typing import Dict, List
 from dataclasses import dataclass
 from collections import namedtuple
 
+from aoc import trace
+
 
 test_input_raw = """Time:      7  15   30
 Distance:  9  40  200"""
@@ -32,17 +34,6 @@ class Document:
     races: List[Race]
 
 
-test_flag = False
-
-if test_flag is True:
-    document = parse_input(test_input_raw)
-
-else:
-    with open('inputs/day6.txt') as f:
-        input_raw = f.read()
-        document = parse_input(input_raw)
-
-
 def lower_and_upper_bounds(race):
 
     """
@@ -61,20 +52,24 @@ def lower_and_upper_bounds(race):
     return math.floor(lower_bound+1), math.ceil(upper_bound - 1) 
 
 
-result = 1
-for race in document.races:
-    print(race)
-    lower_bound, upper_bound = lower_and_upper_bounds(race) 
-    print(lower_bound, upper_bound)
-    successes = (upper_bound - lower_bound) + 1
-    print(f"There are {successes} possible ways to beat the distance record.")
+def parse(raw):
+    return parse_input(raw)
 
-    result *= successes
 
-    print("--------------------")
-    
-print(result)
+def solve(document):
+    result = 1
+    for race in document.races:
+        lower_bound, upper_bound = lower_and_upper_bounds(race) 
+        successes = (upper_bound - lower_bound) + 1
+        trace.info('race', race=race, lower_bound=lower_bound, upper_bound=upper_bound, ways_to_win=successes)
 
+        result *= successes
 
+    return result
 
 
+if __name__ == '__main__':
+    with open('inputs/day6.txt') as f:
+        document = parse(f.read())
+
+    print(solve(document))
@@ -4,6 +4,8 @@ import math
 from typing import Dict, List
 from collections import namedtuple
 
+from aoc import trace
+
 
 test_input_raw = """Time:      7  15   30
 Distance:  9  40  200"""
@@ -25,19 +27,6 @@ Race = namedtuple('Race', ['time', 'distance'])
 
 
 
-test_flag = False
-
-if test_flag is True:
-    race = parse_input(test_input_raw)
-
-else:
-    with open('inputs/day6.txt') as f:
-        input_raw = f.read()
-        race = parse_input(input_raw)
-
-
-
-
 def lower_and_upper_bounds(race):
 
     """
@@ -56,9 +45,20 @@ def lower_and_upper_bounds(race):
     return math.floor(lower_bound+1), math.ceil(upper_bound - 1) 
 
 
-print(race)
-lower_bound, upper_bound = lower_and_upper_bounds(race) 
-print(lower_bound, upper_bound)
-successes = (upper_bound - lower_bound) + 1
-print(f"There are {successes} possible ways to beat the distance record.")
+def parse(raw):
+    return parse_input(raw)
+
+
+def solve(race):
+    lower_bound, upper_bound = lower_and_upper_bounds(race) 
+    successes = (upper_bound - lower_bound) + 1
+    trace.info('race', race=race, lower_bound=lower_bound, upper_bound=upper_bound, ways_to_win=successes)
+
+    return successes
+
+
+if __name__ == '__main__':
+    with open('inputs/day6.txt') as f:
+        race = parse(f.read())
 
+    solve(race)
@@ -104,8 +104,6 @@ def parse_hands(raw):
 
 
 
-test_flag = False
-
 test_input_raw = """32T3K 765
 T55J5 684
 KK677 28
@@ -115,19 +113,20 @@ QQQJA 483"""
 card_types = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
 card_ranks = {str(label):card_rank for card_rank, label in enumerate(card_types)}
 
-if test_flag is False:
-    with open("inputs/day7.txt") as f:
-        input_raw = f.read()
-        hands = parse_hands(input_raw)
-else:
-    hands = parse_hands(test_input_raw)
 
+def parse(raw):
+    return parse_hands(raw)
 
 
-ordering = sorted(list(hands.values()))
+def solve(hands):
+    ordering = sorted(list(hands.values()))
 
-winnings = sum([(1+idx) * hand.bid for idx, hand in enumerate(ordering)])
-print(winnings)
+    winnings = sum([(1+idx) * hand.bid for idx, hand in enumerate(ordering)])
+    return winnings
 
 
+if __name__ == '__main__':
+    with open("inputs/day7.txt") as f:
+        hands = parse(f.read())
 
+    print(solve(hands))
@@ -4,6 +4,8 @@ from typing import Dict, List
 from dataclasses import dataclass
 from collections import namedtuple
 
+from aoc import trace
+
 
 
 Node = namedtuple('Node', ['label', 'left', 'right'])
@@ -15,12 +17,15 @@ class Map:
 
     def steps_to_zzz(self):
 
+        debug = trace.enabled(trace.DEBUG)
+
         node = self.nodes['AAA']
         i = 0
         while node.label != 'ZZZ':
             instruction = self.instructions[i%len(self.instructions)]
             next_node = node.left if instruction == 'L' else node.right
-            print(f"At node {node}; instruction {instruction} so we go to {next_node}")
+            if debug:
+                trace.event('step', node=node.label, instruction=instruction, next_node=next_node)
             node = self.nodes[next_node]
 
             if node != 'ZZZ':
@@ -60,15 +65,23 @@ def parse_map(raw):
 
 
 
-with open('inputs/day8.txt') as f:
-    input_raw = f.read()
+def parse(raw):
+    return parse_map(raw)
+
+
+def solve(map):
+    return map.steps_to_zzz()
+
+
+if __name__ == '__main__':
+    test_map_1 = parse(test_input_raw_1)
+    assert solve(test_map_1) == 2
 
-test_map_1 = parse_map(test_input_raw_1)
-assert test_map_1.steps_to_zzz() == 2
+    test_map_2 = parse(test_input_raw_2)
+    assert solve(test_map_2) == 6
 
-test_map_2 = parse_map(test_input_raw_2)
-assert test_map_2.steps_to_zzz() == 6
+    with open('inputs/day8.txt') as f:
+        real_map = parse(f.read())
 
-real_map = parse_map(input_raw)
-part_1_result = real_map.steps_to_zzz()
-print(f"Part 1: {part_1_result} steps to ZZZ")
+    part_1_result = solve(real_map)
+    print(f"Part 1: {part_1_result} steps to ZZZ")
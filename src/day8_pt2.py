@@ -5,8 +5,13 @@ from typing import Dict, List, Set
 from dataclasses import dataclass
 from collections import namedtuple, defaultdict
 
+from aoc import trace
+from aoc.budget import Budget, BudgetExceeded
 
 
+# solve counts the nodes its walks step through against a Budget
+BUDGETED = True
+
 Node = namedtuple('Node', ['label', 'left', 'right'])
 
 @dataclass
@@ -20,7 +25,10 @@ class Map:
         self.start_node_labels = {node.label for node in self.nodes.values() if node.label[-1] == 'A'}
         self.end_node_labels = {node.label for node in self.nodes.values() if node.label[-1] == 'Z'}
 
-    def steps_to_end(self, start_node_label, end_node_label, max_steps=100_000):
+    def steps_to_end(self, start_node_label, end_node_label, max_steps=100_000, budget=None):
+
+        if budget is None:
+            budget = Budget()
 
         next_node_label = start_node_label
         i = 0
@@ -28,6 +36,7 @@ class Map:
         reached_end_at = None
         already_seen = set()
         while not finished:
+            budget.step()
             current_node_label = next_node_label
             if current_node_label == end_node_label:
                 reached_end_at = i
@@ -91,40 +100,56 @@ def parse_map(raw):
 
 
 
-with open('inputs/day8.txt') as f:
-    input_raw = f.read()
+def parse(raw):
+    return parse_map(raw)
+
+
+def solve(part_2_map, budget=None):
+
+    paths = {}
+    try:
+        for start in part_2_map.start_node_labels:
+            for end in part_2_map.end_node_labels:
+                num_steps = part_2_map.steps_to_end(start, end, max_steps=1_000_000, budget=budget)
+                paths[(start, end)] = num_steps
+
+    except BudgetExceeded as exceeded:
+        # the walks finished so far, as "start-end": steps, for those that reached their end
+        exceeded.partial = {f"{start}-{end}": steps for (start, end), steps in paths.items() if steps is not None}
+        raise
+
+    trace.info('nodes', starts=part_2_map.start_node_labels, ends=part_2_map.end_node_labels)
+    if trace.enabled(trace.INFO):
+        for (start, end), num_steps in paths.items():
+            if num_steps is not None:
+                trace.event('path', start=start, end=end, steps=num_steps)
 
-# Part 1
-# test_map_1 = parse_map(test_input_raw_1)
-# assert test_map_1.steps_to_end('AAA', 'ZZZ') == 2
+    # the ghosts only all arrive together at the LCM of their path lengths if each start leads to exactly one end
+    for start in part_2_map.start_node_labels:
+        ends = [end for end in part_2_map.end_node_labels if paths[(start, end)] is not None]
+        if len(ends) != 1:
+            raise ValueError(f"start {start} reaches {len(ends)} ends, where it should reach exactly one")
 
-# test_map_2 = parse_map(test_input_raw_2)
-# assert test_map_2.steps_to_end('AAA', 'ZZZ') == 6
+    result = np.lcm.reduce([v for v in paths.values() if v is not None])
+    return result
 
-# real_map = parse_map(input_raw)
-# part_1_result = real_map.steps_to_end('AAA', 'ZZZ') 
-# #print(f"Part 1: {part_1_result} steps to ZZZ")
-# assert part_1_result == 12169
 
-# Part 2
-part_2_map = parse_map(input_raw)
+if __name__ == '__main__':
 
-paths = {}
-for start in part_2_map.start_node_labels:
-    for end in part_2_map.end_node_labels:
-        num_steps = part_2_map.steps_to_end(start, end, max_steps=1_000_000)
-        paths[(start, end)] = num_steps
+    # Part 1
+    # test_map_1 = parse(test_input_raw_1)
+    # assert test_map_1.steps_to_end('AAA', 'ZZZ') == 2
 
-print(f"Start nodes: {part_2_map.start_node_labels}")
-print(f"End nodes: {part_2_map.end_node_labels}")
+    # test_map_2 = parse(test_input_raw_2)
+    # assert test_map_2.steps_to_end('AAA', 'ZZZ') == 6
 
+    # real_map = parse(input_raw)
+    # part_1_result = real_map.steps_to_end('AAA', 'ZZZ') 
+    # #print(f"Part 1: {part_1_result} steps to ZZZ")
+    # assert part_1_result == 12169
 
-for k,v in paths.items():
-    if v is None:
-        continue
-    print(k, v)
-    print()
+    # Part 2
+    with open('inputs/day8.txt') as f:
+        part_2_map = parse(f.read())
 
-# TODO should probably make sure that each start only connects to one end, but it turns out that way
-result = np.lcm.reduce([v for v in paths.values() if v is not None])
-print(result)
+    print(solve(part_2_map))
@@ -67,13 +67,21 @@ test_input_raw = """0 3 6 9 12 15
 1 3 6 10 15 21
 10 13 16 21 30 45"""
 
-test_report = parse_report(test_input_raw)
-assert sum([hist.next_term for hist in test_report.histories]) == 114
 
-with open('inputs/day9.txt') as f:
-    input_raw = f.read()
-    report = parse_report(input_raw)
+def parse(raw):
+    return parse_report(raw)
 
-result = sum([hist.next_term for hist in report.histories])  # 1904165718
-print(f"Result: {result}")
 
+def solve(report):
+    return sum([hist.next_term for hist in report.histories])
+
+
+if __name__ == '__main__':
+    test_report = parse(test_input_raw)
+    assert solve(test_report) == 114
+
+    with open('inputs/day9.txt') as f:
+        report = parse(f.read())
+
+    result = solve(report)  # 1904165718
+    print(f"Result: {result}")